@@ -0,0 +1,370 @@
+"""Motor de agregación en una sola pasada sobre los registros de una entidad.
+
+Un ``Resumen`` agrupa los registros por una o más columnas y calcula, para
+cada grupo, varios agregados a la vez: ``Conteo``, ``Minimo``, ``Maximo``,
+``Distintos``, ``Histograma`` y ``HistogramaDeEdades``. Varios resúmenes se
+calculan juntos recorriendo los registros una sola vez, sin guardarlos: cada
+grupo ocupa memoria constante (un contador, un extremo, un histograma de
+intervalos fijos o un contador de distintos acotado).
+
+Los resúmenes que solo cuentan registros por una columna con índice
+secundario se responden con los conteos del índice, sin recorrer los
+registros. Por ejemplo::
+
+    por_disciplina = Resumen(['Disciplina'], atletas=Conteo(),
+                             nacionalidades=Distintos('Nacionalidad'),
+                             mayor=Minimo('Fecha de Nacimiento', ordinal))
+    edades = Resumen(edades=HistogramaDeEdades('Fecha de Nacimiento', ancho=5))
+    disciplinas, edades = Atleta().resumir([por_disciplina, edades])
+"""
+
+import math
+from datetime import date
+
+from IndiceDeFechas import ordinal
+
+# Valores distintos que se cuentan de forma exacta; a partir de aquí el
+# conteo se estima con HyperLogLog.
+LIMITE_EXACTO = 1024
+
+# Bits del hash que eligen el registro de HyperLogLog: 2 ** 11 registros de
+# un byte, con un error típico cercano al 2 %.
+BITS_DE_REGISTRO = 11
+REGISTROS = 1 << BITS_DE_REGISTRO
+BITS_DE_HASH = 64
+MASCARA_DE_HASH = (1 << BITS_DE_HASH) - 1
+
+
+class ContadorDeDistintos:
+    """Cuenta valores distintos con memoria acotada.
+
+    Guarda los valores en un conjunto hasta ``LIMITE_EXACTO``; después los
+    resume en los registros de un HyperLogLog y el conteo pasa a ser una
+    estimación.
+
+    Attributes:
+        exacto (bool): True mientras el conteo es exacto.
+    """
+
+    exacto = True
+
+    def __init__(self):
+        self.exacto = True
+        self.__valores = set()
+        self.__registros = None
+
+    def agregar(self, valor):
+        """Cuenta un valor."""
+        if self.__registros is None:
+            self.__valores.add(valor)
+            if len(self.__valores) > LIMITE_EXACTO:
+                self.__registros = bytearray(REGISTROS)
+                for anterior in self.__valores:
+                    self.__registrar(anterior)
+                self.__valores = None
+                self.exacto = False
+            return
+        self.__registrar(valor)
+
+    def __registrar(self, valor):
+        """Actualiza el registro de HyperLogLog que corresponde a un valor."""
+        # Se mezclan los bits del hash (finalizador de splitmix64): el hash de
+        # un entero pequeño es el propio entero y sus bits altos serían cero.
+        codigo = (hash(valor) + 0x9E3779B97F4A7C15) & MASCARA_DE_HASH
+        codigo = ((codigo ^ (codigo >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA_DE_HASH
+        codigo = ((codigo ^ (codigo >> 27)) * 0x94D049BB133111EB) & MASCARA_DE_HASH
+        codigo ^= codigo >> 31
+        registro = codigo >> (BITS_DE_HASH - BITS_DE_REGISTRO)
+        resto = codigo & ((1 << (BITS_DE_HASH - BITS_DE_REGISTRO)) - 1)
+        rango = BITS_DE_HASH - BITS_DE_REGISTRO - resto.bit_length() + 1
+        if rango > self.__registros[registro]:
+            self.__registros[registro] = rango
+
+    def total(self):
+        """Número de valores distintos, exacto o estimado.
+
+        Returns:
+            int: El conteo.
+        """
+        if self.__registros is None:
+            return len(self.__valores)
+        alfa = 0.7213 / (1 + 1.079 / REGISTROS)
+        estimacion = alfa * REGISTROS * REGISTROS / sum(2.0 ** -rango for rango in self.__registros)
+        vacios = self.__registros.count(0)
+        if estimacion <= 2.5 * REGISTROS and vacios:
+            estimacion = REGISTROS * math.log(REGISTROS / vacios)
+        return round(estimacion)
+
+
+class Agregado:
+    """Cálculo que se acumula registro por registro dentro de cada grupo.
+
+    Cada agregado define su estado inicial, cómo lo actualiza un valor de su
+    columna y cómo se presenta al final. Los valores que ``convertir`` no
+    puede convertir se omiten.
+
+    Attributes:
+        campo (str): Columna que se agrega; None si no usa ninguna.
+        convertir (callable): Conversión del texto antes de agregarlo, o None.
+    """
+
+    campo = None
+    convertir = None
+
+    def __init__(self, campo=None, convertir=None):
+        self.campo = campo
+        self.convertir = convertir
+
+    def inicial(self):
+        """Estado de un grupo antes de ver registros."""
+        return None
+
+    def acumular(self, estado, texto):
+        """Devuelve el estado actualizado con el texto de la columna de un registro."""
+        return estado
+
+    def final(self, estado):
+        """Valor del agregado a partir del estado de un grupo."""
+        return estado
+
+
+class Conteo(Agregado):
+    """Número de registros del grupo."""
+
+    def inicial(self):
+        return 0
+
+    def acumular(self, estado, texto):
+        return estado + 1
+
+
+class Minimo(Agregado):
+    """Texto del valor más pequeño de una columna, comparado tras ``convertir``.
+
+    Por ejemplo, ``Minimo('Fecha de Nacimiento', ordinal)`` da la fecha de
+    nacimiento más antigua del grupo; None si no hay valores válidos.
+    """
+
+    def acumular(self, estado, texto):
+        try:
+            valor = texto if self.convertir is None else self.convertir(texto)
+        except (TypeError, ValueError):
+            return estado
+        if valor is None or (estado is not None and not self._mejor(valor, estado[0])):
+            return estado
+        return (valor, texto)
+
+    def _mejor(self, valor, actual):
+        """True si ``valor`` debe reemplazar al extremo actual."""
+        return valor < actual
+
+    def final(self, estado):
+        return None if estado is None else estado[1]
+
+
+class Maximo(Minimo):
+    """Texto del valor más grande de una columna, comparado tras ``convertir``."""
+
+    def _mejor(self, valor, actual):
+        return valor > actual
+
+
+class Distintos(Agregado):
+    """Número de valores distintos de una columna en el grupo.
+
+    Es exacto hasta ``LIMITE_EXACTO`` valores por grupo y una estimación a
+    partir de ahí.
+    """
+
+    def inicial(self):
+        return ContadorDeDistintos()
+
+    def acumular(self, estado, texto):
+        estado.agregar(texto)
+        return estado
+
+    def final(self, estado):
+        return estado.total()
+
+
+class Histograma(Agregado):
+    """Registros por intervalo de un valor numérico.
+
+    El valor convertido se ubica en el intervalo ``[k * ancho, (k + 1) * ancho)``
+    que le corresponde; el resultado asocia el inicio de cada intervalo con
+    su número de registros, en orden. La memoria depende solo del número de
+    intervalos con registros.
+
+    Attributes:
+        ancho (float): Ancho de cada intervalo.
+    """
+
+    ancho = 1
+
+    def __init__(self, campo, convertir=float, ancho=1):
+        super().__init__(campo, convertir)
+        self.ancho = ancho
+
+    def inicial(self):
+        return {}
+
+    def acumular(self, estado, texto):
+        try:
+            valor = self.convertir(texto)
+        except (TypeError, ValueError):
+            return estado
+        if valor is None:
+            return estado
+        inicio = valor // self.ancho * self.ancho
+        estado[inicio] = estado.get(inicio, 0) + 1
+        return estado
+
+    def final(self, estado):
+        return dict(sorted(estado.items()))
+
+
+class HistogramaDeEdades(Histograma):
+    """Registros por intervalo de edad, a partir de una fecha de nacimiento.
+
+    Attributes:
+        hoy (date): Fecha a la que se calculan las edades.
+    """
+
+    hoy = None
+
+    def __init__(self, campo='Fecha de Nacimiento', ancho=5, hoy=None):
+        super().__init__(campo, self.__edad, ancho)
+        self.hoy = hoy or date.today()
+        self.__edades = {}
+
+    def __edad(self, texto):
+        """Edad en años cumplidos de quien nació en la fecha ``texto``, o None."""
+        dia = ordinal(texto)
+        if dia is None:
+            return None
+        edad = self.__edades.get(dia)
+        if edad is None:
+            nacimiento = date.fromordinal(dia)
+            edad = self.hoy.year - nacimiento.year - ((self.hoy.month, self.hoy.day) <
+                                                      (nacimiento.month, nacimiento.day))
+            self.__edades[dia] = edad
+        return edad
+
+
+class Resumen:
+    """Agrupación de registros con los agregados de cada grupo.
+
+    Attributes:
+        agrupar_por (list): Columnas cuyos valores forman cada grupo; vacía
+            para un solo grupo con todos los registros.
+        agregados (dict): Nombre de cada resultado -> ``Agregado``.
+    """
+
+    agrupar_por = []
+    agregados = {}
+
+    def __init__(self, agrupar_por=(), **agregados):
+        """Define el resumen.
+
+        Args:
+            agrupar_por (list): Columnas de agrupación.
+            **agregados: Agregados por nombre, por ejemplo ``atletas=Conteo()``.
+        """
+        self.agrupar_por = list(agrupar_por)
+        self.agregados = agregados or {'registros': Conteo()}
+        self.__grupos = {}
+        self.__encabezados = []
+        self.__posiciones = []
+        self.__columnas = []
+
+    @staticmethod
+    def __posicion(encabezados, campo):
+        """Posición de una columna, sin distinguir mayúsculas y minúsculas."""
+        for posicion, encabezado in enumerate(encabezados):
+            if encabezado.casefold() == campo.casefold():
+                return posicion
+        raise ValueError(f"El campo {campo} no existe.")
+
+    def preparar(self, encabezados):
+        """Ubica las columnas en los encabezados y descarta grupos anteriores.
+
+        Las columnas se buscan sin distinguir mayúsculas y minúsculas, así que
+        un resumen escrito con los nombres del esquema sirve aunque el archivo
+        los escriba de otra forma.
+
+        Raises:
+            ValueError: Si una columna no existe.
+        """
+        self.__encabezados = list(encabezados)
+        self.__posiciones = [self.__posicion(encabezados, campo) for campo in self.agrupar_por]
+        self.__columnas = [None if agregado.campo is None else self.__posicion(encabezados, agregado.campo)
+                           for agregado in self.agregados.values()]
+        self.__grupos = {}
+
+    def solo_cuenta(self):
+        """Columna de los encabezados por la que se cuentan registros si el
+        resumen no hace nada más, o None."""
+        if len(self.agrupar_por) == 1 and all(type(agregado) is Conteo for agregado in self.agregados.values()):
+            return self.__encabezados[self.__posiciones[0]]
+        return None
+
+    def cargar_conteos(self, conteos):
+        """Toma los grupos de un resumen de ``solo_cuenta`` de conteos ya hechos.
+
+        Args:
+            conteos (dict): Valor de la columna -> número de registros.
+        """
+        self.__grupos = {(valor,): [cuenta] * len(self.agregados) for valor, cuenta in conteos.items() if cuenta}
+
+    def acumular(self, fila):
+        """Agrega un registro a su grupo."""
+        clave = tuple(fila[posicion] for posicion in self.__posiciones)
+        estados = self.__grupos.get(clave)
+        if estados is None:
+            estados = self.__grupos[clave] = [agregado.inicial() for agregado in self.agregados.values()]
+        for indice, (agregado, columna) in enumerate(zip(self.agregados.values(), self.__columnas)):
+            estados[indice] = agregado.acumular(estados[indice], None if columna is None else fila[columna])
+
+    def resultado(self):
+        """Grupos con sus agregados, ordenados por los valores de agrupación.
+
+        Returns:
+            list: Un diccionario por grupo con las columnas de agrupación y
+            el resultado de cada agregado.
+        """
+        grupos = []
+        for clave, estados in sorted(self.__grupos.items()):
+            grupo = dict(zip(self.agrupar_por, clave))
+            for (nombre, agregado), estado in zip(self.agregados.items(), estados):
+                grupo[nombre] = agregado.final(estado)
+            grupos.append(grupo)
+        return grupos
+
+
+def resumir(almacen, consulta, resumenes):
+    """Calcula varios resúmenes con una sola pasada sobre los registros.
+
+    Args:
+        almacen (Almacenamiento): Almacenamiento de la entidad.
+        consulta (Consulta): Registros que entran en los resúmenes.
+        resumenes (list): ``Resumen`` a calcular.
+
+    Returns:
+        list: El resultado de cada resumen, en el mismo orden.
+    """
+    todos = len(consulta.alternativas) == 1 and not consulta.condiciones
+    pendientes = []
+    for resumen in resumenes:
+        resumen.preparar(almacen.encabezados)
+        campo = resumen.solo_cuenta()
+        conteos = almacen.conteos(campo) if todos and campo is not None else None
+        if conteos is not None:
+            resumen.cargar_conteos(conteos)
+        else:
+            pendientes.append(resumen)
+    if pendientes:
+        acumuladores = [resumen.acumular for resumen in pendientes]
+        for fila in almacen.buscar_filas(consulta):
+            for acumular in acumuladores:
+                acumular(fila)
+    return [resumen.resultado() for resumen in resumenes]
@@ -0,0 +1,337 @@
+import heapq
+from abc import ABC, abstractmethod
+
+from IndiceDeTexto import UMBRAL, IndiceDeTexto
+from InstantaneaColumnar import InstantaneaColumnar, codificar
+from Instrumentacion import METRICAS
+
+
+class Almacenamiento(ABC):
+    """Interfaz que define cómo una entidad guarda y recupera sus registros.
+
+    Las entidades se encargan de validar los datos y de informar al usuario;
+    el almacenamiento se encarga de dónde y cómo se guardan los registros.
+    Cada registro se identifica por los valores de sus columnas clave, que
+    se comparan después de aplicar la función ``normalizar``.
+
+    Attributes:
+        atributos (list): Columnas de la entidad, en orden.
+        campos_clave (list): Columnas que forman la clave de cada registro.
+        recuperaciones (list): Acciones con las que se recuperaron, al
+            arrancar, operaciones interrumpidas por una caída.
+        campos_de_texto (list): Columnas en las que busca ``buscar_texto``.
+    """
+
+    atributos = []
+    campos_clave = []
+    recuperaciones = []
+    campos_de_texto = []
+
+    def __init__(self, atributos, campos_clave, normalizar=None, texto=()):
+        """Inicializa los datos comunes a todos los almacenamientos.
+
+        Args:
+            atributos (list): Columnas de la entidad, en orden.
+            campos_clave (list): Columnas que forman la clave.
+            normalizar (callable): Función opcional que se aplica a cada valor
+                de la clave antes de compararlo, por ejemplo ``str.casefold``.
+            texto (list): Columnas de texto para las búsquedas aproximadas.
+        """
+        self.atributos = list(atributos)
+        self.campos_clave = list(campos_clave)
+        self.normalizar = normalizar
+        self.campos_de_texto = list(texto)
+        self.__texto = None
+
+    def clave_de(self, valores):
+        """Calcula la clave normalizada a partir de los valores de la clave.
+
+        Args:
+            valores (list): Valores de las columnas clave, en orden.
+
+        Returns:
+            str | tuple: Clave normalizada; una tupla si la clave es compuesta.
+        """
+        if self.normalizar is not None:
+            valores = [self.normalizar(str(valor)) for valor in valores]
+        else:
+            valores = [str(valor) for valor in valores]
+        if len(valores) == 1:
+            return valores[0]
+        return tuple(valores)
+
+    @property
+    @abstractmethod
+    def encabezados(self):
+        """Columnas con las que se guardan los registros."""
+        pass
+
+    @abstractmethod
+    def firma(self):
+        """Valor que cambia cada vez que cambian los registros guardados."""
+        pass
+
+    @abstractmethod
+    def compartido(self):
+        """Administrador de contexto para un bloque de lecturas."""
+        pass
+
+    @abstractmethod
+    def exclusivo(self):
+        """Administrador de contexto para un bloque de escrituras atómico."""
+        pass
+
+    def referenciado(self):
+        """Administrador de contexto que toma quien verifica referencias a
+        estos registros y escribe en otro almacenamiento; por omisión, el
+        bloqueo compartido."""
+        return self.compartido()
+
+    @abstractmethod
+    def existe(self, *valores):
+        """Verifica si existe un registro con la clave indicada."""
+        pass
+
+    @abstractmethod
+    def obtener(self, *valores):
+        """Obtiene un registro como diccionario, o None si no existe."""
+        pass
+
+    def obtener_fila(self, *valores):
+        """Obtiene un registro como lista, sin construir un diccionario.
+
+        Args:
+            *valores: Valores de las columnas clave.
+
+        Returns:
+            list: Valores en el orden de ``encabezados``, o None si no existe.
+        """
+        registro = self.obtener(*valores)
+        return None if registro is None else list(registro.values())
+
+    def agregar(self, datos):
+        """Agrega un registro nuevo.
+
+        Args:
+            datos (list): Valores del registro en el orden de ``encabezados``.
+        """
+        self.agregar_lote([datos])
+
+    @abstractmethod
+    def agregar_lote(self, filas):
+        """Agrega varios registros nuevos con una sola escritura."""
+        pass
+
+    @abstractmethod
+    def editar(self, cambios):
+        """Aplica varios cambios de una sola vez.
+
+        Args:
+            cambios (list): Tuplas (clave, campos) donde ``clave`` es la lista
+                de valores clave y ``campos`` un diccionario campo -> valor.
+        """
+        pass
+
+    @abstractmethod
+    def eliminar(self, claves):
+        """Elimina varios registros de una sola vez.
+
+        Args:
+            claves (list): Listas con los valores clave de cada registro.
+        """
+        pass
+
+    @abstractmethod
+    def filas(self):
+        """Todos los registros como listas en el orden de ``encabezados``.
+
+        Las filas se toman de una vez, de modo que recorrerlas no se ve
+        afectado por las escrituras que se hagan mientras tanto.
+        """
+        pass
+
+    def buscar_prefijo(self, prefijo):
+        """Obtiene los registros cuyo primer campo clave comienza con un prefijo.
+
+        Args:
+            prefijo (str): Prefijo a buscar.
+
+        Returns:
+            list: Registros encontrados como diccionarios.
+        """
+        prefijo = self.clave_de([prefijo] * len(self.campos_clave))
+        prefijo = prefijo[0] if isinstance(prefijo, tuple) else prefijo
+        posicion = self.encabezados.index(self.campos_clave[0])
+        registros = []
+        for fila in self.filas():
+            valor = self.clave_de([fila[posicion]] * len(self.campos_clave))
+            valor = valor[0] if isinstance(valor, tuple) else valor
+            if valor.startswith(prefijo):
+                registros.append(dict(zip(self.encabezados, fila)))
+        return registros
+
+    def buscar(self, consulta, limite=None):
+        """Recorre los registros que cumplen una consulta.
+
+        Las condiciones se evalúan sobre las filas crudas y solo las filas
+        aceptadas se convierten en diccionario.
+
+        Args:
+            consulta (Consulta): Filtros y proyección ya compilados.
+            limite (int): Número máximo de registros; por omisión, todos.
+
+        Yields:
+            dict: Cada registro encontrado, con las columnas de la proyección.
+        """
+        for fila in self.buscar_filas(consulta, limite):
+            yield consulta.proyectar(fila)
+
+    def buscar_filas(self, consulta, limite=None):
+        """Como ``buscar``, pero entrega las filas crudas sin proyectarlas.
+
+        Yields:
+            list: Valores de cada registro en el orden de ``encabezados``.
+        """
+        if limite is not None and limite <= 0:
+            return
+        encontrados = examinadas = 0
+        try:
+            for fila in self._candidatas(consulta):
+                examinadas += 1
+                if consulta.acepta(fila):
+                    yield fila
+                    encontrados += 1
+                    if limite is not None and encontrados >= limite:
+                        return
+        finally:
+            METRICAS.sumar('filas_examinadas', examinadas)
+
+    def ordenar(self, consulta, campo, descendente=False, limite=None):
+        """Recorre los registros que cumplen una consulta, ordenados por una columna.
+
+        Args:
+            consulta (Consulta): Filtros y proyección ya compilados.
+            campo (str): Columna por la que se ordena; se compara con la
+                conversión de la consulta para esa columna, si la tiene.
+            descendente (bool): Si es True, de mayor a menor.
+            limite (int): Número máximo de registros; por omisión, todos.
+
+        Yields:
+            dict: Cada registro encontrado, con las columnas de la proyección.
+        """
+        for fila in self.ordenar_filas(consulta, campo, descendente, limite):
+            yield consulta.proyectar(fila)
+
+    def ordenar_filas(self, consulta, campo, descendente=False, limite=None):
+        """Como ``ordenar``, pero entrega las filas crudas sin proyectarlas.
+
+        Por omisión se ordenan en memoria todas las filas que cumplen la
+        consulta; con ``limite`` solo se conservan las ``limite`` primeras.
+        A igualdad de valor se respeta el orden de los registros, y las filas
+        cuyo valor no puede convertirse se omiten.
+
+        Yields:
+            list: Valores de cada registro en el orden de ``encabezados``.
+        """
+        if limite is not None and limite <= 0:
+            return
+        posicion = self.encabezados.index(campo)
+        convertir = consulta.tipos.get(campo) or str
+        claves = []
+        for orden, fila in enumerate(self.buscar_filas(consulta)):
+            try:
+                valor = convertir(fila[posicion])
+            except (TypeError, ValueError):
+                continue
+            claves.append(((valor, -orden if descendente else orden), fila))
+        if limite is None:
+            claves.sort(key=lambda par: par[0], reverse=descendente)
+        elif descendente:
+            claves = heapq.nlargest(limite, claves, key=lambda par: par[0])
+        else:
+            claves = heapq.nsmallest(limite, claves, key=lambda par: par[0])
+        for _, fila in claves:
+            yield fila
+
+    def conteos(self, campo):
+        """Número de registros por cada valor de una columna, sin recorrerlos.
+
+        Por omisión no hay forma de obtenerlos sin recorrer los registros;
+        los almacenamientos con índices sobre la columna los responden.
+
+        Args:
+            campo (str): Columna a contar.
+
+        Returns:
+            dict: Valor -> número de registros, o None si no se pueden
+            obtener sin recorrer los registros.
+        """
+        return None
+
+    def buscar_texto(self, texto, limite=10, umbral=UMBRAL):
+        """Registros cuyas columnas de texto se parecen más a un texto buscado.
+
+        La comparación usa trigramas y no distingue acentos ni mayúsculas.
+        Por omisión se construye un ``IndiceDeTexto`` en memoria que se
+        reutiliza mientras ``firma`` no cambie; los almacenamientos que
+        mantienen sus propios índices lo actualizan con cada cambio.
+
+        Args:
+            texto (str): Texto aproximado; puede tener varias palabras.
+            limite (int): Número máximo de registros; None para todos.
+            umbral (float): Similitud mínima de cada palabra, entre 0 y 1.
+
+        Returns:
+            list: Pares (fila, puntaje entre 0 y 1), del más parecido al menos
+            parecido.
+        """
+        campos = [campo for campo in self.campos_de_texto if campo in self.encabezados]
+        if not campos:
+            return []
+        with self.compartido():
+            firma = self.firma()
+            if self.__texto is None or self.__texto[0] != firma:
+                posiciones = [self.encabezados.index(campo) for campo in campos]
+                claves = [self.encabezados.index(campo) for campo in self.campos_clave]
+                indice = IndiceDeTexto(campos, posiciones)
+                valores = []
+                for numero, fila in enumerate(self.filas()):
+                    indice.agregar(numero, fila)
+                    valores.append([fila[posicion] for posicion in claves])
+                self.__texto = (firma, indice, valores)
+            _, indice, valores = self.__texto
+            return [(self.obtener_fila(*valores[numero]), puntaje)
+                    for numero, puntaje in indice.buscar(texto, limite, umbral)]
+
+    def _candidatas(self, consulta):
+        """Filas que podrían cumplir una consulta.
+
+        Por omisión son todas; los almacenamientos con índices pueden
+        reducirlas a partir de los filtros de igualdad sobre la clave. Las
+        filas se toman de una vez, bajo el bloqueo compartido, para que quien
+        recorre una búsqueda pueda escribir en la tabla mientras tanto.
+        """
+        return self.filas()
+
+    def instantanea(self):
+        """Obtiene una instantánea columnar con el contenido actual.
+
+        Permite recorrer columnas completas sin crear un diccionario por
+        registro. Por omisión se construye en memoria; los almacenamientos
+        que pueden guardarla en disco la reutilizan mientras no cambien.
+
+        Returns:
+            InstantaneaColumnar: Instantánea del contenido actual.
+        """
+        with self.compartido():
+            return InstantaneaColumnar(codificar(self.encabezados, self.filas()))
+
+    @abstractmethod
+    def exportar(self, destino):
+        """Escribe todos los registros en un archivo CSV con encabezados."""
+        pass
+
+    @abstractmethod
+    def compactar(self):
+        """Consolida los cambios pendientes del almacenamiento."""
+        pass
@@ -0,0 +1,249 @@
+import csv
+import os
+
+from Almacenamiento import Almacenamiento
+from BitacoraDeCambios import BitacoraDeCambios
+from BloqueoDeArchivo import BloqueoDeArchivo
+from EscritorDeAnexos import EscritorDeAnexos
+from IndiceCompuesto import IndiceCompuesto
+from IndiceDeTexto import UMBRAL
+from IndicePrimario import IndicePrimario
+from Instrumentacion import METRICAS
+from ReescrituraCSV import recuperar_csv, reescribir_csv
+
+
+class AlmacenamientoCSV(Almacenamiento):
+    """Almacenamiento de registros en un archivo CSV.
+
+    Mantiene un índice en memoria por clave y admite dos modos: en modo
+    'reescritura' cada edición o baja reescribe el archivo en una sola pasada;
+    en modo 'bitacora' los cambios se anexan a una bitácora que se compacta
+    al superar un umbral de tamaño. El acceso concurrente de varios hilos y
+    procesos se coordina con un bloqueo de archivo. Las reescrituras
+    reemplazan el archivo de forma atómica y, al crear el almacenamiento, se
+    recuperan las operaciones que una caída haya dejado a medias. Las altas se anexan con
+    un escritor que mantiene el archivo abierto y agrupa las llamadas a
+    fsync según la política de durabilidad. Junto al CSV se guarda
+    una instantánea columnar que acelera el arranque mientras el CSV no cambie.
+
+    Attributes:
+        archivo (str): Ruta al archivo CSV.
+        modo (str): Modo de almacenamiento, 'reescritura' o 'bitacora'.
+        indice (IndicePrimario): Índice en memoria de los registros.
+        bitacora (BitacoraDeCambios): Bitácora de cambios pendientes.
+        escritor (EscritorDeAnexos): Escritor de las altas en el CSV.
+        bloqueo (BloqueoDeArchivo): Bloqueo sobre los archivos de la entidad.
+        ruta_instantanea (str): Ruta de la instantánea columnar del CSV.
+        recuperaciones (list): Acciones de recuperación realizadas al arrancar.
+    """
+
+    archivo = ""
+    modo = ""
+    indice = None
+    bitacora = None
+    escritor = None
+    bloqueo = None
+    ruta_instantanea = ""
+    recuperaciones = None
+
+    def __init__(self, archivo, atributos, campos_clave, normalizar=None,
+                 modo='reescritura', umbral_bitacora=1024 * 1024,
+                 durabilidad='grupo', filas_por_fsync=100, ms_por_fsync=50.0, indices=(),
+                 fechas=(), texto=()):
+        """Inicializa el almacenamiento, recupera las operaciones interrumpidas
+        y crea el archivo si no existe.
+
+        Args:
+            archivo (str): Ruta al archivo CSV.
+            atributos (list): Columnas de la entidad, en orden.
+            campos_clave (list): Columnas que forman la clave.
+            normalizar (callable): Función que se aplica a cada valor de la clave.
+            modo (str): 'reescritura' o 'bitacora'.
+            umbral_bitacora (int): Tamaño en bytes de la bitácora a partir del
+                cual se compacta.
+            durabilidad (str): Política de fsync de las escrituras anexadas:
+                'fila', 'grupo', 'periodica' o 'ninguna'.
+            filas_por_fsync (int): Filas por fsync con la política 'grupo'.
+            ms_por_fsync (float): Demora máxima, en milisegundos, de un fsync pendiente.
+            indices (list): Columnas con índice secundario en memoria.
+            fechas (list): Columnas de fechas con índice ordenado en memoria.
+            texto (list): Columnas con índice de trigramas en memoria.
+        """
+        super().__init__(atributos, campos_clave, normalizar, texto)
+        self.archivo = archivo
+        self.modo = modo
+        self.ruta_instantanea = self.archivo + ".col"
+        self.bloqueo = BloqueoDeArchivo(self.archivo)
+        self.bitacora = BitacoraDeCambios(self.archivo, umbral_bitacora, durabilidad, filas_por_fsync, ms_por_fsync)
+        self.escritor = EscritorDeAnexos(self.archivo, durabilidad, filas_por_fsync, ms_por_fsync)
+        with self.bloqueo.exclusivo():
+            self.recuperaciones = recuperar_csv(self.archivo, self.atributos) + self.bitacora.recuperar()
+            if not os.path.exists(self.archivo) or os.path.getsize(self.archivo) == 0:
+                self.__inicializar_archivo()
+            if len(self.campos_clave) > 1:
+                self.indice = IndiceCompuesto(self.archivo, self.campos_clave, normalizar, bitacora=self.bitacora,
+                                              instantanea=self.ruta_instantanea, secundarios=indices,
+                                              fechas=fechas, texto=texto)
+            else:
+                self.indice = IndicePrimario(self.archivo, self.campos_clave, normalizar, bitacora=self.bitacora,
+                                             instantanea=self.ruta_instantanea, secundarios=indices,
+                                             fechas=fechas, texto=texto)
+            if self.modo != 'bitacora' and self.bitacora.pendiente():
+                self.bitacora.compactar(self.indice)
+
+    def __inicializar_archivo(self):
+        """Crea el archivo CSV con los encabezados de la entidad."""
+        with open(self.archivo, mode='w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.atributos)
+
+    @property
+    def encabezados(self):
+        return self.indice.encabezados
+
+    def firma(self):
+        with self.bloqueo.compartido():
+            return self.indice.firma()
+
+    def compartido(self):
+        return self.bloqueo.compartido()
+
+    def exclusivo(self):
+        return self.bloqueo.exclusivo()
+
+    def existe(self, *valores):
+        with self.bloqueo.compartido():
+            return self.indice.contiene(*valores)
+
+    def obtener(self, *valores):
+        with self.bloqueo.compartido():
+            return self.indice.obtener(*valores)
+
+    def obtener_fila(self, *valores):
+        with self.bloqueo.compartido():
+            fila = self.indice.fila(*valores)
+            return None if fila is None else list(fila)
+
+    def __clave_de_fila(self, row):
+        """Obtiene la clave normalizada de una fila leída como diccionario."""
+        return self.indice.clave_de([row[campo] for campo in self.campos_clave])
+
+    def __compactar_si_excede(self):
+        """Compacta la bitácora si el modo es 'bitacora' y superó su umbral."""
+        if self.modo == 'bitacora' and self.bitacora.excede_umbral():
+            self.bitacora.compactar(self.indice)
+
+    def agregar_lote(self, filas):
+        with self.bloqueo.exclusivo():
+            filas = [[str(dato) for dato in fila] for fila in filas]
+            if self.modo == 'bitacora':
+                posiciones = [self.encabezados.index(campo) for campo in self.campos_clave]
+                self.bitacora.registrar_altas([([fila[posicion] for posicion in posiciones], fila) for fila in filas])
+            else:
+                self.escritor.anexar_filas(filas)
+            for fila in filas:
+                self.indice.agregar(fila)
+            self.indice.sincronizar()
+            self.__compactar_si_excede()
+
+    def editar(self, cambios):
+        with self.bloqueo.exclusivo():
+            if self.modo == 'bitacora':
+                self.bitacora.registrar_ediciones(cambios)
+            else:
+                por_clave = {}
+                for clave, campos in cambios:
+                    por_clave.setdefault(self.indice.clave_de(clave), {}).update(campos)
+
+                def editar(row):
+                    campos = por_clave.get(self.__clave_de_fila(row))
+                    if campos is not None:
+                        row.update(campos)
+                    return row
+
+                reescribir_csv(self.archivo, editar)
+            for clave, campos in cambios:
+                for campo, valor in campos.items():
+                    self.indice.actualizar(campo, valor, *clave)
+            self.indice.sincronizar()
+            self.__compactar_si_excede()
+
+    def eliminar(self, claves):
+        with self.bloqueo.exclusivo():
+            if self.modo == 'bitacora':
+                self.bitacora.registrar_bajas(claves)
+            else:
+                por_eliminar = {self.indice.clave_de(clave) for clave in claves}
+                reescribir_csv(self.archivo, lambda row: row if self.__clave_de_fila(row) not in por_eliminar else None)
+            for clave in claves:
+                self.indice.eliminar(*clave)
+            self.indice.sincronizar()
+            self.__compactar_si_excede()
+
+    def filas(self):
+        with self.bloqueo.compartido():
+            return self.indice.filas()
+
+    def buscar_prefijo(self, prefijo):
+        with self.bloqueo.compartido():
+            if isinstance(self.indice, IndiceCompuesto):
+                return self.indice.buscar_prefijo(prefijo)
+            return super().buscar_prefijo(prefijo)
+
+    def buscar_filas(self, consulta, limite=None):
+        """Como en ``Almacenamiento``, pero si los índices secundarios
+        resuelven toda la consulta sus filas se entregan sin volver a evaluarla.
+        """
+        with self.bloqueo.compartido():
+            filas = self.indice.filas_por_secundarios(consulta, completas=True)
+        if filas is not None:
+            filas = filas if limite is None else filas[:max(0, limite)]
+            METRICAS.sumar('filas_examinadas', len(filas))
+            yield from filas
+            return
+        yield from super().buscar_filas(consulta, limite)
+
+    def conteos(self, campo):
+        with self.bloqueo.compartido():
+            return self.indice.conteos(campo)
+
+    def buscar_texto(self, texto, limite=10, umbral=UMBRAL):
+        with self.bloqueo.compartido():
+            return self.indice.buscar_texto(texto, limite, umbral) or []
+
+    def ordenar_filas(self, consulta, campo, descendente=False, limite=None):
+        """Como en ``Almacenamiento``, pero recorre el índice de fechas si la
+        columna lo tiene, sin ordenar todas las filas.
+        """
+        if limite is not None and limite <= 0:
+            return
+        with self.bloqueo.compartido():
+            filas = self.indice.filas_ordenadas(consulta, campo, descendente, limite)
+        if filas is not None:
+            yield from filas
+            return
+        yield from super().ordenar_filas(consulta, campo, descendente, limite)
+
+    def _candidatas(self, consulta):
+        with self.bloqueo.compartido():
+            clave = consulta.clave()
+            if clave is not None:
+                fila = self.indice.fila(*clave)
+                return [] if fila is None else [fila]
+            primero = consulta.igualdad(self.campos_clave[0])
+            if primero is not None and isinstance(self.indice, IndiceCompuesto):
+                return self.indice.filas_con_prefijo(primero)
+            filas = self.indice.filas_por_secundarios(consulta)
+            return self.indice.filas() if filas is None else filas
+
+    def exportar(self, destino):
+        with self.bloqueo.compartido():
+            self.indice.exportar(destino)
+
+    def instantanea(self):
+        with self.bloqueo.compartido():
+            return self.indice.instantanea()
+
+    def compactar(self):
+        with self.bloqueo.exclusivo():
+            self.bitacora.compactar(self.indice)
@@ -0,0 +1,452 @@
+import csv
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+
+from Almacenamiento import Almacenamiento
+from Consulta import fecha
+from IndiceDeFechas import OPERADORES as OPERADORES_DE_RANGO, ordinal
+
+# Separa los valores de una clave compuesta dentro de la columna ``_clave``.
+SEPARADOR = "\x1f"
+
+
+class _Conexion:
+    """Conexión a una base compartida por todas las tablas de un proceso.
+
+    Compartir la conexión permite que una transacción abarque varias tablas,
+    por ejemplo al eliminar en cascada, sin que la segunda tabla espere el
+    bloqueo de escritura que ya tiene la primera.
+    """
+
+    __abiertas = {}
+    __candado_abiertas = threading.Lock()
+
+    def __init__(self, ruta):
+        self.candado = threading.RLock()
+        self.profundidad = 0
+        # Escrituras de este proceso por tabla, para la firma de cada tabla.
+        self.escrituras = {}
+        self.sql = sqlite3.connect(ruta, timeout=30, isolation_level=None, check_same_thread=False)
+        self.sql.execute("PRAGMA journal_mode=WAL")
+        self.sql.execute("PRAGMA synchronous=NORMAL")
+
+    @classmethod
+    def abrir(cls, ruta):
+        """Obtiene la conexión del proceso actual a una base, creándola si hace falta."""
+        llave = (os.getpid(), os.path.abspath(ruta))
+        with cls.__candado_abiertas:
+            if llave not in cls.__abiertas:
+                cls.__abiertas[llave] = cls(ruta)
+            return cls.__abiertas[llave]
+
+
+class AlmacenamientoSQLite(Almacenamiento):
+    """Almacenamiento de registros en una tabla de SQLite.
+
+    La base usa el modo WAL, de modo que las lecturas no bloquean a las
+    escrituras. Además de las columnas de la entidad, cada tabla guarda en la
+    columna ``_clave`` la clave ya normalizada (por ejemplo, con
+    ``str.casefold``, que a diferencia de ``COLLATE NOCASE`` también cubre
+    letras acentuadas) y tiene un índice único sobre ella. Las sentencias se
+    construyen una sola vez por tabla y se ejecutan con parámetros, por lo que
+    ``sqlite3`` las reutiliza ya preparadas.
+
+    Un bloque ``exclusivo`` es una transacción ``BEGIN IMMEDIATE``: la
+    verificación de existencia y la escritura de una operación ocurren de
+    forma atómica aunque haya otros procesos usando la misma base. Las
+    tablas de una misma base comparten la conexión dentro de cada proceso,
+    así que sus bloques se anidan en una sola transacción.
+
+    Las columnas de fechas se guardan tal como se escribieron, que pueden
+    no tener ceros a la izquierda (``2001-1-5``), así que no se ordenan bien
+    como texto. Cada una tiene además una columna oculta ``_fecha_<columna>``
+    con el ordinal de la fecha, o NULL si no es válida, y un índice sobre
+    ella; los rangos de fechas y el orden por fecha se resuelven con esa
+    columna.
+
+    Attributes:
+        ruta (str): Ruta al archivo de la base de datos.
+        tabla (str): Nombre de la tabla de la entidad.
+    """
+
+    ruta = ""
+    tabla = ""
+
+    def __init__(self, ruta, tabla, atributos, campos_clave, normalizar=None, indices=(), fechas=(), texto=()):
+        """Abre la base de datos y crea la tabla y sus índices si no existen.
+
+        Args:
+            ruta (str): Ruta al archivo de la base de datos.
+            tabla (str): Nombre de la tabla de la entidad.
+            atributos (list): Columnas de la entidad, en orden.
+            campos_clave (list): Columnas que forman la clave.
+            normalizar (callable): Función que se aplica a cada valor de la
+                clave antes de guardarla en ``_clave``.
+            indices (list): Columnas con índice secundario. Las columnas
+                clave ya están cubiertas por el índice de ``_clave``.
+            fechas (list): Columnas de fechas YYYY-MM-DD con índice por fecha.
+            texto (list): Columnas de texto para las búsquedas aproximadas.
+        """
+        super().__init__(atributos, campos_clave, normalizar, texto)
+        self.ruta = ruta
+        self.tabla = tabla
+        self.__compartida = _Conexion.abrir(ruta)
+        self.__conexion = self.__compartida.sql
+        self.__fechas = {campo: self.__nombre('_fecha_' + campo) for campo in fechas}
+        self.__posiciones_fecha = [self.atributos.index(campo) for campo in self.__fechas]
+
+        tabla_sql = self.__nombre(tabla)
+        columnas = ", ".join(f"{self.__nombre(campo)} TEXT NOT NULL DEFAULT ''" for campo in self.atributos)
+        self.__conexion.execute(f"CREATE TABLE IF NOT EXISTS {tabla_sql} (_clave TEXT NOT NULL, {columnas})")
+        self.__conexion.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {self.__nombre(tabla + '_clave')} ON {tabla_sql} (_clave)"
+        )
+        for campo in indices:
+            if campo not in self.campos_clave:
+                self.__conexion.execute(f"CREATE INDEX IF NOT EXISTS {self.__nombre(tabla + '_' + campo)} "
+                                        f"ON {tabla_sql} ({self.__nombre(campo)})")
+        if self.__fechas:
+            self.__agregar_columnas_de_fecha()
+
+        lista_columnas = ", ".join(self.__nombre(campo) for campo in self.atributos)
+        columnas_ocultas = "".join(", " + columna for columna in self.__fechas.values())
+        marcadores = ", ".join("?" for _ in list(self.atributos) + list(self.__fechas))
+        self.__posiciones_clave = [self.atributos.index(campo) for campo in self.campos_clave]
+        self.__sql_existe = f"SELECT 1 FROM {tabla_sql} WHERE _clave = ? LIMIT 1"
+        self.__sql_obtener = f"SELECT {lista_columnas} FROM {tabla_sql} WHERE _clave = ? LIMIT 1"
+        self.__sql_insertar = (f"INSERT INTO {tabla_sql} (_clave, {lista_columnas}{columnas_ocultas}) "
+                               f"VALUES (?, {marcadores})")
+        self.__sql_migrar = (f"INSERT OR IGNORE INTO {tabla_sql} (_clave, {lista_columnas}{columnas_ocultas}) "
+                             f"VALUES (?, {marcadores})")
+        self.__sql_eliminar = f"DELETE FROM {tabla_sql} WHERE _clave = ?"
+        self.__sql_filas = f"SELECT {lista_columnas} FROM {tabla_sql} ORDER BY rowid"
+        self.__sql_prefijo = (f"SELECT {lista_columnas} FROM {tabla_sql} "
+                              f"WHERE _clave >= ? AND _clave < ? ORDER BY _clave")
+        self.__sql_contar = f"SELECT COUNT(*) FROM {tabla_sql}"
+
+    def __agregar_columnas_de_fecha(self):
+        """Crea las columnas ocultas de fechas y sus índices si no existen.
+
+        En una tabla creada antes de tenerlas, las columnas se agregan y se
+        llenan a partir de los valores ya guardados.
+        """
+        tabla_sql = self.__nombre(self.tabla)
+        with self.exclusivo():
+            existentes = {fila[1] for fila in self.__conexion.execute(f"PRAGMA table_info({tabla_sql})")}
+            for campo, columna in self.__fechas.items():
+                if '_fecha_' + campo not in existentes:
+                    self.__conexion.execute(f"ALTER TABLE {tabla_sql} ADD COLUMN {columna} INTEGER")
+                    filas = self.__conexion.execute(f"SELECT rowid, {self.__nombre(campo)} FROM {tabla_sql}")
+                    self.__conexion.executemany(f"UPDATE {tabla_sql} SET {columna} = ? WHERE rowid = ?",
+                                                [(ordinal(valor), rowid) for rowid, valor in filas])
+                indice = self.__nombre(self.tabla + '_fecha_' + campo)
+                self.__conexion.execute(f"CREATE INDEX IF NOT EXISTS {indice} ON {tabla_sql} ({columna})")
+
+    @staticmethod
+    def __nombre(identificador):
+        """Escribe un identificador entre comillas dobles para SQL."""
+        return '"' + identificador.replace('"', '""') + '"'
+
+    def __clave_sql(self, valores):
+        """Convierte los valores de la clave en el texto que se guarda en ``_clave``."""
+        clave = self.clave_de(valores)
+        return SEPARADOR.join(clave) if isinstance(clave, tuple) else clave
+
+    def __registro(self, fila):
+        """Antepone la clave normalizada a los valores de una fila y agrega
+        el ordinal de cada columna de fechas."""
+        fila = [str(dato) for dato in fila]
+        return ([self.__clave_sql([fila[posicion] for posicion in self.__posiciones_clave])] + fila
+                + [ordinal(fila[posicion]) for posicion in self.__posiciones_fecha])
+
+    @property
+    def encabezados(self):
+        return self.atributos
+
+    @contextmanager
+    def __transaccion(self, inicio):
+        """Abre una transacción en el bloque más externo y la confirma al salir."""
+        compartida = self.__compartida
+        with compartida.candado:
+            externa = compartida.profundidad == 0
+            if externa:
+                self.__conexion.execute(inicio)
+            compartida.profundidad += 1
+            try:
+                yield
+            except BaseException:
+                compartida.profundidad -= 1
+                if externa:
+                    self.__conexion.execute("ROLLBACK")
+                raise
+            else:
+                compartida.profundidad -= 1
+                if externa:
+                    self.__conexion.execute("COMMIT")
+
+    def firma(self):
+        """Firma de la tabla: cambia con las escrituras de este proceso en la
+        tabla y con las de otros procesos en cualquier tabla de la base."""
+        with self.__compartida.candado:
+            version = self.__conexion.execute("PRAGMA data_version").fetchone()[0]
+            return (version, self.__compartida.escrituras.get(self.tabla, 0))
+
+    def compartido(self):
+        return self.__transaccion("BEGIN")
+
+    def exclusivo(self):
+        return self.__transaccion("BEGIN IMMEDIATE")
+
+    def referenciado(self):
+        # La escritura de la otra tabla se anida en esta transacción, que
+        # debe empezar como de escritura: una transacción ``BEGIN`` que
+        # luego escribe puede fallar si otro proceso escribió mientras tanto.
+        return self.exclusivo()
+
+    @contextmanager
+    def __operacion(self):
+        """Hace que una operación de escritura se aplique completa o no se aplique."""
+        with self.exclusivo():
+            self.__conexion.execute("SAVEPOINT operacion")
+            escrituras = self.__compartida.escrituras
+            escrituras[self.tabla] = escrituras.get(self.tabla, 0) + 1
+            try:
+                yield
+            except BaseException:
+                self.__conexion.execute("ROLLBACK TO operacion")
+                self.__conexion.execute("RELEASE operacion")
+                raise
+            self.__conexion.execute("RELEASE operacion")
+
+    def existe(self, *valores):
+        with self.compartido():
+            return self.__conexion.execute(self.__sql_existe, [self.__clave_sql(valores)]).fetchone() is not None
+
+    def obtener(self, *valores):
+        with self.compartido():
+            fila = self.__conexion.execute(self.__sql_obtener, [self.__clave_sql(valores)]).fetchone()
+        if fila is None:
+            return None
+        return dict(zip(self.atributos, fila))
+
+    def obtener_fila(self, *valores):
+        with self.compartido():
+            fila = self.__conexion.execute(self.__sql_obtener, [self.__clave_sql(valores)]).fetchone()
+        return None if fila is None else list(fila)
+
+    def agregar_lote(self, filas):
+        with self.__operacion():
+            self.__conexion.executemany(self.__sql_insertar, (self.__registro(fila) for fila in filas))
+
+    def editar(self, cambios):
+        with self.__operacion():
+            for clave, campos in cambios:
+                asignaciones = [f"{self.__nombre(campo)} = ?" for campo in campos]
+                valores = [str(valor) for valor in campos.values()]
+                for campo, valor in campos.items():
+                    if campo in self.__fechas:
+                        asignaciones.append(f"{self.__fechas[campo]} = ?")
+                        valores.append(ordinal(str(valor)))
+                self.__conexion.execute(
+                    f"UPDATE {self.__nombre(self.tabla)} SET {', '.join(asignaciones)} WHERE _clave = ?",
+                    valores + [self.__clave_sql(clave)],
+                )
+
+    def eliminar(self, claves):
+        with self.__operacion():
+            self.__conexion.executemany(self.__sql_eliminar, ([self.__clave_sql(clave)] for clave in claves))
+
+    def filas(self):
+        with self.compartido():
+            return [list(fila) for fila in self.__conexion.execute(self.__sql_filas)]
+
+    def buscar_prefijo(self, prefijo):
+        desde = self.normalizar(prefijo) if self.normalizar is not None else prefijo
+        with self.compartido():
+            filas = self.__conexion.execute(self.__sql_prefijo, [desde, desde + "\U0010ffff"]).fetchall()
+        return [dict(zip(self.atributos, fila)) for fila in filas]
+
+    def buscar_filas(self, consulta, limite=None):
+        """Filas de los registros que cumplen una consulta.
+
+        Las condiciones que comparan texto se traducen a SQL y las igualdades
+        sobre la clave usan el índice de ``_clave``; el resto (las que
+        convierten valores, como fechas o claves normalizadas) se evalúan en
+        Python sobre las filas que devuelve SQLite. Los rangos sobre columnas
+        de fechas se traducen además a SQL sobre su columna oculta, para que
+        SQLite use su índice.
+        Varias alternativas se traducen a una disyunción de sus condiciones
+        de texto.
+        """
+        return self.__recorrer(consulta, limite)
+
+    def ordenar_filas(self, consulta, campo, descendente=False, limite=None):
+        """Como en ``Almacenamiento``, pero ordena SQLite con ORDER BY.
+
+        Las columnas de fechas se ordenan por su columna oculta, así que
+        SQLite entrega las filas ya en orden usando su índice y la búsqueda
+        se detiene al reunir ``limite`` filas.
+        """
+        return self.__recorrer(consulta, limite, campo, descendente)
+
+    def __recorrer(self, consulta, limite=None, campo=None, descendente=False):
+        """Ejecuta una búsqueda, ordenada por ``campo`` o en el orden de inserción.
+
+        Las filas se reúnen dentro de la transacción de lectura y se
+        devuelven ya leídas, para que quien las recorre pueda escribir en la
+        tabla sin afectar el cursor.
+
+        Returns:
+            list: Filas encontradas.
+        """
+        if limite is not None and limite <= 0:
+            return []
+        # ``restantes`` son las condiciones que se evalúan en Python; None
+        # indica que hay que evaluar la consulta completa.
+        donde, parametros, restantes = [], [], []
+        orden = "rowid"
+        clave = consulta.clave()
+        if clave is not None:
+            donde.append("_clave = ?")
+            parametros.append(self.__clave_sql(clave))
+        elif len(self.campos_clave) > 1 and consulta.igualdad(self.campos_clave[0]) is not None:
+            primero = self.clave_de([consulta.igualdad(self.campos_clave[0])] * len(self.campos_clave))[0]
+            donde.append("_clave >= ? AND _clave < ?")
+            parametros += [primero + SEPARADOR, primero + SEPARADOR + "\U0010ffff"]
+            orden = "_clave"
+
+        if len(consulta.alternativas) == 1:
+            restantes = self.__traducir(consulta.condiciones, donde, parametros)
+        else:
+            disyuncion, valores = [], []
+            for condiciones in consulta.alternativas:
+                conjuncion = []
+                if self.__traducir(condiciones, conjuncion, valores):
+                    restantes = None
+                if not conjuncion:
+                    disyuncion = None
+                    break
+                disyuncion.append("(" + " AND ".join(conjuncion) + ")")
+            if disyuncion is not None:
+                donde.append("(" + " OR ".join(disyuncion) + ")")
+                parametros += valores
+            else:
+                restantes = None
+
+        convertir = None
+        if campo is not None:
+            columna = self.__nombre(campo)
+            convertir = consulta.tipos.get(campo)
+            if campo in self.__fechas and convertir is fecha:
+                # Las filas sin fecha válida tienen NULL y no se entregan.
+                columna = self.__fechas[campo]
+                donde.append(f"{columna} IS NOT NULL")
+                convertir = None
+            orden = f"{columna} {'DESC' if descendente else 'ASC'}, rowid"
+            posicion = self.atributos.index(campo)
+        sql = f"SELECT {', '.join(self.__nombre(campo) for campo in self.atributos)} FROM {self.__nombre(self.tabla)}"
+        if donde:
+            sql += " WHERE " + " AND ".join(donde)
+        sql += f" ORDER BY {orden}"
+        if limite is not None and restantes == [] and convertir is None:
+            sql += " LIMIT ?"
+            parametros.append(limite)
+
+        encontrados = []
+        with self.compartido():
+            for fila in self.__conexion.execute(sql, parametros):
+                if restantes is None:
+                    if not consulta.acepta(fila):
+                        continue
+                elif restantes and not consulta.acepta(fila, restantes):
+                    continue
+                if convertir is not None:
+                    try:
+                        convertir(fila[posicion])
+                    except (TypeError, ValueError):
+                        continue
+                encontrados.append(fila)
+                if limite is not None and len(encontrados) >= limite:
+                    break
+        return encontrados
+
+    def conteos(self, campo):
+        """Cuenta con GROUP BY, que SQLite resuelve con el índice de la columna si lo tiene."""
+        if campo not in self.atributos:
+            return None
+        sql = f"SELECT {self.__nombre(campo)}, COUNT(*) FROM {self.__nombre(self.tabla)} GROUP BY 1"
+        with self.compartido():
+            return dict(self.__conexion.execute(sql).fetchall())
+
+    def __traducir(self, condiciones, donde, parametros):
+        """Traduce a SQL las condiciones que comparan texto.
+
+        Args:
+            condiciones (list): Condiciones que deben cumplirse todas.
+            donde (list): Lista a la que se agregan las expresiones SQL.
+            parametros (list): Lista a la que se agregan sus parámetros.
+
+        Returns:
+            list: Condiciones que no se pudieron traducir.
+        """
+        restantes = []
+        for condicion in condiciones:
+            columna = self.__nombre(condicion.campo)
+            if condicion.tiene_conversion:
+                restantes.append(condicion)
+                if (condicion.campo in self.__fechas and condicion.convertir is fecha
+                        and condicion.operador in OPERADORES_DE_RANGO):
+                    # Acota por la columna oculta para usar su índice; la
+                    # condición se sigue evaluando en Python sobre lo que
+                    # devuelva SQLite.
+                    valores = condicion.valor if condicion.operador == 'entre' else [condicion.valor]
+                    valores = [fecha(valor if isinstance(valor, date) else str(valor)).toordinal()
+                               for valor in valores]
+                    operador = 'BETWEEN ? AND' if condicion.operador == 'entre' else condicion.operador
+                    donde.append(f"{self.__fechas[condicion.campo]} {operador} ?")
+                    parametros += valores
+            elif condicion.operador == 'en':
+                valores = [str(valor) for valor in condicion.valor]
+                donde.append(f"{columna} IN ({', '.join('?' for _ in valores)})" if valores else "0")
+                parametros += valores
+            elif condicion.operador == 'comienza':
+                donde.append(f"substr({columna}, 1, ?) = ?")
+                parametros += [len(str(condicion.valor)), str(condicion.valor)]
+            elif condicion.operador == 'contiene':
+                donde.append(f"instr({columna}, ?) > 0")
+                parametros.append(str(condicion.valor))
+            elif condicion.operador == 'entre':
+                donde.append(f"{columna} BETWEEN ? AND ?")
+                parametros += [str(valor) for valor in condicion.valor]
+            else:
+                donde.append(f"{columna} {condicion.operador} ?")
+                parametros.append(str(condicion.valor))
+        return restantes
+
+    def exportar(self, destino):
+        with open(destino, mode='w', newline='') as salida:
+            writer = csv.writer(salida)
+            writer.writerow(self.atributos)
+            writer.writerows(self.filas())
+
+    def compactar(self):
+        with self.__compartida.candado:
+            if self.__compartida.profundidad == 0:
+                self.__conexion.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def migrar(self, filas):
+        """Copia registros existentes a la tabla, omitiendo claves repetidas.
+
+        Args:
+            filas (iterable): Listas de valores en el orden de ``atributos``.
+
+        Returns:
+            int: Número de registros insertados.
+        """
+        with self.__operacion():
+            antes = self.__conexion.execute(self.__sql_contar).fetchone()[0]
+            self.__conexion.executemany(self.__sql_migrar, (self.__registro(fila) for fila in filas))
+            return self.__conexion.execute(self.__sql_contar).fetchone()[0] - antes
@@ -0,0 +1,218 @@
+"""Mide el rendimiento de las operaciones CRUD con distintos tamaños de datos.
+
+Para cada tamaño se genera, en un directorio temporal, un conjunto sintético
+de atletas y disciplinas válidos según ``ValidadorDeDatos`` y se cronometran
+``agregar_datos``, ``consultar_datos``, ``editar_datos`` y ``eliminar_datos``
+de ``Atleta`` y ``Disciplina`` sobre claves elegidas al azar. Cada tamaño se
+ejecuta en un proceso aparte para que la memoria máxima (RSS) reportada
+corresponda solo a ese tamaño. El resultado se escribe como JSON para poder
+comparar corridas y detectar regresiones.
+
+En modo 'reescritura' cada edición y cada baja reescribe el archivo
+completo, por lo que con 1 000 000 de registros cada una tarda segundos; se
+puede reducir ``--operaciones`` o elegir ``--tamanos`` más pequeños.
+
+Uso:
+    python BenchmarkCRUD.py --tamanos 1000 100000 1000000 --salida resultados.json
+    python BenchmarkCRUD.py --almacenamiento sqlite --modo bitacora
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import Configuracion
+from Atleta import Atleta
+from Disciplina import Disciplina
+from MigracionSQLite import migrar
+
+CATEGORIAS = ['Individual', 'Equipo']
+
+
+def generar_datos(filas, almacenamiento):
+    """Escribe en archivos/ los CSV sintéticos de atletas y disciplinas.
+
+    Con almacenamiento SQLite los registros se migran además a la base.
+
+    Args:
+        filas (int): Número de registros por entidad.
+        almacenamiento (str): 'csv' o 'sqlite'.
+    """
+    with open("archivos/Atleta.csv", mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['ID', 'Nombre', 'Apellido Paterno', 'Apellido Materno', 'Nacionalidad',
+                         'Fecha de Nacimiento', 'Disciplina', 'Genero', 'Telefono', 'Correo'])
+        writer.writerows(datos_de_atleta(i) for i in range(filas))
+    with open("archivos/disciplina.csv", mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['Nombre', 'Categoria', 'Participantes', 'Patrocinadores'])
+        writer.writerows(datos_de_disciplina(i) for i in range(filas))
+    if almacenamiento == 'sqlite':
+        with contextlib.redirect_stdout(io.StringIO()):
+            migrar(Configuracion.RUTA_SQLITE)
+
+
+def datos_de_atleta(i):
+    """Genera los datos válidos del atleta con ID ``i``."""
+    return [str(i), f"Nombre{i}", "Paterno", "Materno", "Mexico",
+            f"{1970 + i % 40}-{1 + i % 12:02d}-{1 + i % 28:02d}", "Futbol",
+            "M" if i % 2 == 0 else "F", f"55{i % 100000000:08d}", f"atleta{i}@correo.com"]
+
+
+def datos_de_disciplina(i):
+    """Genera los datos válidos de la disciplina número ``i``."""
+    return [f"Disciplina{i}", CATEGORIAS[i % 2], f"Participante{i}", f"Patrocinador{i}"]
+
+
+def cronometrar(operacion, argumentos):
+    """Ejecuta una operación con cada juego de argumentos y mide su latencia.
+
+    Returns:
+        dict: Operaciones por segundo, latencias p50 y p99 en milisegundos y
+        número de operaciones.
+    """
+    latencias = []
+    for args in argumentos:
+        inicio = time.perf_counter()
+        operacion(*args)
+        latencias.append(time.perf_counter() - inicio)
+    latencias.sort()
+    total = sum(latencias)
+    return {
+        'operaciones': len(latencias),
+        'ops_por_segundo': round(len(latencias) / total, 1) if total > 0 else None,
+        'p50_ms': round(percentil(latencias, 50) * 1000, 4),
+        'p99_ms': round(percentil(latencias, 99) * 1000, 4),
+    }
+
+
+def percentil(valores, p):
+    """Obtiene el percentil ``p`` de una lista ordenada por el rango más cercano."""
+    if not valores:
+        return 0.0
+    posicion = max(0, min(len(valores) - 1, -(-len(valores) * p // 100) - 1))
+    return valores[posicion]
+
+
+def medir(filas, operaciones, almacenamiento, modo, semilla):
+    """Genera un conjunto de ``filas`` registros y cronometra las operaciones.
+
+    Returns:
+        dict: Resultados del tamaño indicado.
+    """
+    azar = random.Random(semilla)
+    generar_datos(filas, almacenamiento)
+    opciones = {'almacenamiento': almacenamiento, 'modo': modo}
+    resultado = {'filas': filas, 'operaciones': {}}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicio = time.perf_counter()
+        atletas = Atleta(**opciones)
+        disciplinas = Disciplina(**opciones)
+        resultado['carga_s'] = round(time.perf_counter() - inicio, 4)
+
+        existentes = azar.sample(range(filas), min(operaciones, filas))
+        nuevos = range(filas, filas + operaciones)
+        pruebas = {
+            'Atleta.agregar_datos': (atletas.agregar_datos, [(datos_de_atleta(i),) for i in nuevos]),
+            'Atleta.consultar_datos': (atletas.consultar_datos, [(str(i),) for i in existentes]),
+            'Atleta.editar_datos': (atletas.editar_datos, [(str(i), 'Nombre', f"Editado{i}") for i in existentes]),
+            'Atleta.eliminar_datos': (atletas.eliminar_datos, [(str(i),) for i in existentes]),
+            'Disciplina.agregar_datos': (disciplinas.agregar_datos, [(datos_de_disciplina(i),) for i in nuevos]),
+            'Disciplina.consultar_datos': (disciplinas.consultar_datos,
+                                           [tuple(datos_de_disciplina(i)[:2]) for i in existentes]),
+            'Disciplina.editar_datos': (disciplinas.editar_datos,
+                                        [tuple(datos_de_disciplina(i)[:2]) + ('Participantes', f"Editado{i}")
+                                         for i in existentes]),
+            'Disciplina.eliminar_datos': (disciplinas.eliminar_datos,
+                                          [tuple(datos_de_disciplina(i)[:2]) for i in existentes]),
+        }
+        for nombre, (operacion, argumentos) in pruebas.items():
+            resultado['operaciones'][nombre] = cronometrar(operacion, argumentos)
+
+    if resource is not None:
+        # En Linux ru_maxrss está en KiB; en macOS, en bytes.
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        resultado['rss_maximo_kb'] = rss // 1024 if platform.system() == 'Darwin' else rss
+    else:
+        resultado['rss_maximo_kb'] = None
+    return resultado
+
+
+def ejecutar_tamano(conexion, filas, operaciones, almacenamiento, modo, semilla):
+    """Mide un tamaño en un directorio temporal propio y envía el resultado."""
+    directorio = tempfile.mkdtemp(prefix="benchmark-")
+    try:
+        os.chdir(directorio)
+        os.makedirs("archivos")
+        conexion.send(medir(filas, operaciones, almacenamiento, modo, semilla))
+    except Exception as e:
+        conexion.send({'filas': filas, 'error': str(e)})
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+        conexion.close()
+
+
+def main(argv=None):
+    """Ejecuta el benchmark y escribe los resultados como JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark de las operaciones CRUD de Atleta y Disciplina.")
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[1000, 100000, 1000000],
+                        help="Número de registros de cada conjunto de datos.")
+    parser.add_argument('--operaciones', type=int, default=20,
+                        help="Número de veces que se repite cada operación por tamaño.")
+    parser.add_argument('--almacenamiento', choices=['csv', 'sqlite'], default='csv')
+    parser.add_argument('--modo', choices=['reescritura', 'bitacora'], default='reescritura')
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--salida', default=None, help="Archivo JSON de salida; por omisión, la salida estándar.")
+    argumentos = parser.parse_args(argv)
+
+    resultados = []
+    for filas in argumentos.tamanos:
+        receptor, emisor = multiprocessing.Pipe(duplex=False)
+        proceso = multiprocessing.Process(target=ejecutar_tamano,
+                                          args=(emisor, filas, argumentos.operaciones,
+                                                argumentos.almacenamiento, argumentos.modo, argumentos.semilla))
+        proceso.start()
+        emisor.close()
+        try:
+            resultados.append(receptor.recv())
+        except EOFError:
+            resultados.append({'filas': filas, 'error': f"el proceso terminó con código {proceso.exitcode}"})
+        proceso.join()
+
+    reporte = {
+        'parametros': {
+            'almacenamiento': argumentos.almacenamiento,
+            'modo': argumentos.modo,
+            'operaciones': argumentos.operaciones,
+            'semilla': argumentos.semilla,
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+        },
+        'resultados': resultados,
+    }
+    texto = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if argumentos.salida:
+        with open(argumentos.salida, mode='w') as file:
+            file.write(texto + "\n")
+    else:
+        print(texto)
+    return 1 if any('error' in resultado for resultado in resultados) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+"""Mide las altas por segundo con cada política de durabilidad.
+
+Para cada política de ``EscritorDeAnexos.POLITICAS`` se crea, en un
+directorio temporal y en un proceso aparte, un conjunto inicial de atletas y
+se cronometran altas sucesivas con ``Atleta.agregar_datos``. El tiempo total
+incluye el fsync final de lo que haya quedado pendiente, para que las
+políticas que difieren la sincronización no parezcan más rápidas de lo que
+son. Se reportan las altas por segundo, las latencias p50 y p99 y el número
+de fsync realizados.
+
+Uso:
+    python BenchmarkDurabilidad.py --altas 5000 --salida durabilidad.json
+    python BenchmarkDurabilidad.py --modo bitacora --filas-por-fsync 50 --ms-por-fsync 20
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import tempfile
+import time
+
+import Configuracion
+from Atleta import Atleta
+from BenchmarkCRUD import datos_de_atleta, generar_datos, percentil
+from EscritorDeAnexos import POLITICAS
+
+
+def medir(politica, altas, filas, modo, filas_por_fsync, ms_por_fsync):
+    """Cronometra ``altas`` altas de atletas con la política indicada.
+
+    Returns:
+        dict: Resultados de la política.
+    """
+    Configuracion.DURABILIDAD = politica
+    Configuracion.FILAS_POR_FSYNC = filas_por_fsync
+    Configuracion.MS_POR_FSYNC = ms_por_fsync
+    generar_datos(filas, 'csv')
+    atletas = Atleta(modo=modo, almacenamiento='csv')
+    almacen = atletas.almacen
+    escritor = almacen.bitacora.escritor if modo == 'bitacora' else almacen.escritor
+
+    latencias = []
+    inicio = time.perf_counter()
+    for i in range(filas, filas + altas):
+        antes = time.perf_counter()
+        resultado = atletas.agregar_datos(datos_de_atleta(i))
+        latencias.append(time.perf_counter() - antes)
+        if not resultado:
+            raise RuntimeError(resultado.mensaje)
+    escritor.sincronizar()
+    segundos = time.perf_counter() - inicio
+    latencias.sort()
+    return {
+        'politica': politica,
+        'altas': altas,
+        'segundos': round(segundos, 4),
+        'altas_por_segundo': round(altas / segundos, 1),
+        'p50_ms': round(percentil(latencias, 50) * 1000, 4),
+        'p99_ms': round(percentil(latencias, 99) * 1000, 4),
+        'fsync': escritor.sincronizaciones,
+    }
+
+
+def ejecutar_politica(conexion, politica, *argumentos):
+    """Mide una política en un directorio temporal propio y envía el resultado."""
+    directorio = tempfile.mkdtemp(prefix="durabilidad-")
+    try:
+        os.chdir(directorio)
+        os.makedirs("archivos")
+        conexion.send(medir(politica, *argumentos))
+    except Exception as e:
+        conexion.send({'politica': politica, 'error': str(e)})
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+        conexion.close()
+
+
+def main(argv=None):
+    """Ejecuta el benchmark y escribe los resultados como JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark de altas por segundo según la política de durabilidad.")
+    parser.add_argument('--politicas', nargs='+', choices=POLITICAS, default=list(POLITICAS))
+    parser.add_argument('--altas', type=int, default=2000, help="Número de altas por política.")
+    parser.add_argument('--filas', type=int, default=1000, help="Registros iniciales del archivo.")
+    parser.add_argument('--modo', choices=['reescritura', 'bitacora'], default='reescritura')
+    parser.add_argument('--filas-por-fsync', type=int, default=Configuracion.FILAS_POR_FSYNC)
+    parser.add_argument('--ms-por-fsync', type=float, default=Configuracion.MS_POR_FSYNC)
+    parser.add_argument('--salida', default=None, help="Archivo JSON de salida; por omisión, la salida estándar.")
+    argumentos = parser.parse_args(argv)
+
+    resultados = []
+    for politica in argumentos.politicas:
+        receptor, emisor = multiprocessing.Pipe(duplex=False)
+        proceso = multiprocessing.Process(target=ejecutar_politica,
+                                          args=(emisor, politica, argumentos.altas, argumentos.filas, argumentos.modo,
+                                                argumentos.filas_por_fsync, argumentos.ms_por_fsync))
+        proceso.start()
+        emisor.close()
+        try:
+            resultados.append(receptor.recv())
+        except EOFError:
+            resultados.append({'politica': politica, 'error': f"el proceso terminó con código {proceso.exitcode}"})
+        proceso.join()
+
+    reporte = {
+        'parametros': {
+            'modo': argumentos.modo,
+            'altas': argumentos.altas,
+            'filas': argumentos.filas,
+            'filas_por_fsync': argumentos.filas_por_fsync,
+            'ms_por_fsync': argumentos.ms_por_fsync,
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+        },
+        'resultados': resultados,
+    }
+    texto = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if argumentos.salida:
+        with open(argumentos.salida, mode='w') as file:
+            file.write(texto + "\n")
+    else:
+        print(texto)
+    return 1 if any('error' in resultado for resultado in resultados) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
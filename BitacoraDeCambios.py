@@ -0,0 +1,179 @@
+import json
+import os
+
+from EscritorDeAnexos import EscritorDeAnexos
+from Instrumentacion import METRICAS
+from ReescrituraCSV import crear_temporal, reemplazar, sincronizar_directorio, truncar_linea_incompleta
+
+
+class BitacoraDeCambios:
+    """Bitácora de solo anexado con los cambios pendientes de una entidad.
+
+    En el modo de almacenamiento con bitácora las altas, ediciones y bajas no
+    reescriben el archivo CSV: cada cambio se anexa como una línea JSON al
+    archivo de bitácora, de modo que su costo no depende del tamaño de la
+    tabla. Las lecturas combinan el CSV base con la bitácora y, cuando esta
+    supera un umbral de tamaño, se compacta reescribiendo el CSV una sola vez.
+
+    Cada línea de la bitácora tiene una de las formas:
+        {"op": "agregar", "clave": [...], "fila": [...]}
+        {"op": "editar", "clave": [...], "campos": {"campo": "valor"}}
+        {"op": "eliminar", "clave": [...]}
+
+    Attributes:
+        archivo (str): Ruta al archivo de bitácora.
+        archivo_base (str): Ruta al archivo CSV al que se aplican los cambios.
+        umbral (int): Tamaño en bytes a partir del cual conviene compactar.
+        escritor (EscritorDeAnexos): Escritor que anexa las entradas.
+    """
+
+    archivo = ""
+    archivo_base = ""
+    umbral = 0
+    escritor = None
+
+    def __init__(self, archivo_base, umbral=1024 * 1024, durabilidad='grupo', filas_por_fsync=100, ms_por_fsync=50.0):
+        """Inicializa la bitácora asociada a un archivo CSV.
+
+        Args:
+            archivo_base (str): Ruta al archivo CSV de la entidad.
+            umbral (int): Tamaño en bytes a partir del cual se compacta.
+            durabilidad (str): Política de fsync de la bitácora (ver ``EscritorDeAnexos``).
+            filas_por_fsync (int): Entradas por fsync con la política 'grupo'.
+            ms_por_fsync (float): Demora máxima de un fsync pendiente.
+        """
+        self.archivo_base = archivo_base
+        self.archivo = os.path.splitext(archivo_base)[0] + ".log"
+        self.umbral = umbral
+        self.escritor = EscritorDeAnexos(self.archivo, durabilidad, filas_por_fsync, ms_por_fsync, encoding='utf-8')
+
+    def tamano(self):
+        """Obtiene el tamaño actual de la bitácora en bytes.
+
+        Returns:
+            int: Tamaño del archivo, o 0 si no existe.
+        """
+        try:
+            return os.path.getsize(self.archivo)
+        except OSError:
+            return 0
+
+    def pendiente(self):
+        """Indica si la bitácora tiene cambios que aún no están en el CSV.
+
+        Returns:
+            bool: True si hay cambios pendientes.
+        """
+        return self.tamano() > 0
+
+    def excede_umbral(self):
+        """Indica si la bitácora ya superó el umbral de compactación.
+
+        Returns:
+            bool: True si conviene compactar.
+        """
+        return self.tamano() >= self.umbral
+
+    def registrar(self, entradas):
+        """Anexa una o varias entradas a la bitácora con una sola escritura.
+
+        Args:
+            entradas (list): Diccionarios con las entradas a registrar.
+        """
+        self.escritor.anexar_lineas([json.dumps(entrada, ensure_ascii=False) + "\n" for entrada in entradas])
+
+    def registrar_altas(self, altas):
+        """Registra el alta de uno o varios registros completos.
+
+        Args:
+            altas (list): Tuplas (clave, fila) donde ``clave`` es la lista de
+                valores clave y ``fila`` los valores del registro en el orden
+                de los encabezados.
+        """
+        self.registrar([{"op": "agregar", "clave": list(clave), "fila": [str(dato) for dato in fila]}
+                        for clave, fila in altas])
+
+    def registrar_ediciones(self, cambios):
+        """Registra la edición de uno o varios registros.
+
+        Args:
+            cambios (list): Tuplas (clave, campos) donde ``clave`` es la lista
+                de valores clave y ``campos`` un diccionario campo -> valor.
+        """
+        self.registrar([{"op": "editar", "clave": list(clave), "campos": dict(campos)}
+                        for clave, campos in cambios])
+
+    def registrar_bajas(self, claves):
+        """Registra la baja (lápida) de uno o varios registros.
+
+        Args:
+            claves (list): Listas con los valores clave de cada registro.
+        """
+        self.registrar([{"op": "eliminar", "clave": list(clave)} for clave in claves])
+
+    def entradas(self):
+        """Recorre las entradas registradas en orden.
+
+        Una última línea incompleta (por ejemplo, tras una interrupción a mitad
+        de una escritura) se ignora.
+
+        Yields:
+            dict: Cada entrada de la bitácora.
+        """
+        if not os.path.exists(self.archivo):
+            return
+        with open(self.archivo, mode='r', encoding='utf-8') as file:
+            leidos = 0
+            try:
+                for linea in file:
+                    leidos += len(linea)
+                    try:
+                        yield json.loads(linea)
+                    except ValueError:
+                        return
+            finally:
+                METRICAS.sumar('bytes_leidos', leidos)
+
+    def recuperar(self):
+        """Descarta la última entrada si quedó a medias por una interrupción.
+
+        Returns:
+            list: Descripción de la acción realizada, si hubo alguna.
+        """
+        eliminados = truncar_linea_incompleta(self.archivo)
+        if eliminados:
+            return [f"Se descartaron {eliminados} bytes de una entrada incompleta al final de {self.archivo}."]
+        return []
+
+    def vaciar(self):
+        """Elimina todas las entradas de la bitácora."""
+        self.escritor.cerrar()
+        if os.path.exists(self.archivo):
+            os.remove(self.archivo)
+            sincronizar_directorio(self.archivo)
+
+    def compactar(self, indice):
+        """Incorpora los cambios de la bitácora al CSV base y la vacía.
+
+        Args:
+            indice (IndicePrimario): Índice que combina el CSV con esta bitácora.
+
+        Si el proceso se interrumpe después de reemplazar el CSV y antes de
+        vaciar la bitácora, al arrancar se vuelve a aplicar sobre el CSV ya
+        compactado; el resultado es el mismo porque un alta de una clave que
+        ya existe se ignora y las ediciones y bajas se repiten en orden.
+
+        Raises:
+            Exception: Si ocurre un error al escribir; en ese caso el CSV
+                base y la bitácora quedan intactos.
+        """
+        temp_archivo = crear_temporal(self.archivo_base)
+        try:
+            indice.exportar(temp_archivo)
+            reemplazar(temp_archivo, self.archivo_base)
+        except Exception:
+            if os.path.exists(temp_archivo):
+                os.remove(temp_archivo)
+            raise
+        self.vaciar()
+        indice.sincronizar()
@@ -0,0 +1,157 @@
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class BloqueoDeArchivo:
+    """Bloqueo de lectores y escritor para coordinar el acceso a los archivos de una entidad.
+
+    Dentro del proceso, los hilos que comparten una instancia pueden leer a
+    la vez; una escritura espera a que terminen las lecturas en curso y,
+    mientras espera, las lecturas nuevas esperan a que termine, para que las
+    escrituras no se queden sin turno. Entre instancias y procesos se
+    coordina con ``fcntl.flock`` sobre un archivo auxiliar ``.lock``: el
+    proceso lo tiene en modo compartido mientras alguno de sus hilos lee y en
+    modo exclusivo mientras uno escribe. El descriptor del archivo auxiliar
+    se abre una sola vez y queda abierto mientras exista la instancia.
+
+    Los bloqueos son reentrantes: un método que ya tiene el bloqueo puede
+    llamar a otro que también lo pide, y quien escribe puede leer. Lo
+    contrario no se permite: un hilo que lee no puede pedir el bloqueo
+    exclusivo, porque tendría que soltar su lectura (y lo que leyó dejaría
+    de estar protegido) o esperar a los demás lectores, que podrían estar
+    esperándolo a él. Quien lee y luego escribe debe pedir desde el inicio
+    el bloqueo exclusivo. En sistemas sin ``fcntl`` solo se coordinan los
+    hilos del proceso actual.
+
+    Attributes:
+        archivo (str): Ruta al archivo auxiliar sobre el que se toma el bloqueo.
+    """
+
+    archivo = ""
+
+    def __init__(self, archivo_base):
+        """Inicializa el bloqueo asociado a un archivo CSV.
+
+        Args:
+            archivo_base (str): Ruta al archivo CSV de la entidad.
+        """
+        self.archivo = os.path.splitext(archivo_base)[0] + ".lock"
+        self.__condicion = threading.Condition(threading.Lock())
+        self.__hilo = threading.local()
+        self.__descriptor = None
+        self.__lectores = 0
+        self.__escritor = None
+        self.__escritores_en_espera = 0
+
+    def __flock(self, operacion):
+        """Cambia el modo del bloqueo entre procesos; se llama con la condición tomada.
+
+        Args:
+            operacion (str): 'LOCK_SH', 'LOCK_EX' o 'LOCK_UN'.
+        """
+        if fcntl is None:
+            return
+        if self.__descriptor is None:
+            self.__descriptor = os.open(self.archivo, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self.__descriptor, getattr(fcntl, operacion))
+
+    def __entrar_lectura(self):
+        with self.__condicion:
+            while self.__escritor is not None or self.__escritores_en_espera:
+                self.__condicion.wait()
+            if self.__lectores == 0:
+                self.__flock('LOCK_SH')
+            self.__lectores += 1
+
+    def __salir_lectura(self):
+        with self.__condicion:
+            self.__lectores -= 1
+            if self.__lectores == 0:
+                self.__flock('LOCK_UN')
+                self.__condicion.notify_all()
+
+    def __entrar_escritura(self):
+        with self.__condicion:
+            self.__escritores_en_espera += 1
+            try:
+                while self.__escritor is not None or self.__lectores:
+                    self.__condicion.wait()
+            finally:
+                self.__escritores_en_espera -= 1
+            self.__flock('LOCK_EX')
+            self.__escritor = threading.get_ident()
+
+    def __salir_escritura(self):
+        with self.__condicion:
+            self.__escritor = None
+            self.__flock('LOCK_UN')
+            self.__condicion.notify_all()
+
+    @contextmanager
+    def __adquirir(self, exclusivo):
+        """Adquiere el bloqueo en el modo indicado mientras dura el bloque.
+
+        Raises:
+            RuntimeError: Si el hilo tiene el bloqueo compartido y pide el exclusivo.
+        """
+        hilo = self.__hilo
+        modo = getattr(hilo, 'modo', None)
+        if modo == 'compartido' and exclusivo:
+            raise RuntimeError(f"No se puede pedir el bloqueo exclusivo de {self.archivo} "
+                               "mientras se tiene el compartido.")
+        if modo is not None:
+            hilo.profundidad += 1
+            try:
+                yield
+            finally:
+                hilo.profundidad -= 1
+            return
+
+        if exclusivo:
+            self.__entrar_escritura()
+        else:
+            self.__entrar_lectura()
+        hilo.modo, hilo.profundidad = ('exclusivo' if exclusivo else 'compartido'), 1
+        try:
+            yield
+        finally:
+            hilo.modo, hilo.profundidad = None, 0
+            if exclusivo:
+                self.__salir_escritura()
+            else:
+                self.__salir_lectura()
+
+    def compartido(self):
+        """Bloqueo para lecturas; otros lectores pueden leer al mismo tiempo.
+
+        Returns:
+            Administrador de contexto que mantiene el bloqueo.
+        """
+        return self.__adquirir(False)
+
+    def exclusivo(self):
+        """Bloqueo para escrituras; nadie más puede leer ni escribir.
+
+        Returns:
+            Administrador de contexto que mantiene el bloqueo.
+        """
+        return self.__adquirir(True)
+
+    def cerrar(self):
+        """Cierra el descriptor del archivo auxiliar; se vuelve a abrir si se usa de nuevo."""
+        with self.__condicion:
+            if self.__descriptor is not None and not self.__lectores and self.__escritor is None:
+                os.close(self.__descriptor)
+                self.__descriptor = None
+
+    def __del__(self):
+        try:
+            self.cerrar()
+        except Exception:
+            pass
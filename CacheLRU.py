@@ -0,0 +1,144 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class CacheLRU:
+    """Caché acotada de registros que desaloja primero al menos usado.
+
+    La caché guarda la firma del almacenamiento con la que sus registros son
+    válidos. Si la firma cambia sin que la entidad lo sepa (otro proceso
+    modificó los registros), la caché se vacía. Las escrituras de la propia
+    entidad se hacen dentro de ``escritura``, que invalida solo las claves
+    afectadas y registra la firma nueva.
+
+    Attributes:
+        capacidad (int): Número máximo de registros; 0 desactiva la caché.
+        aciertos (int): Consultas resueltas desde la caché.
+        fallos (int): Consultas que tuvieron que leer el almacenamiento.
+        desalojos (int): Registros desalojados por falta de espacio.
+    """
+
+    capacidad = 0
+    aciertos = 0
+    fallos = 0
+    desalojos = 0
+
+    def __init__(self, capacidad=1024):
+        """Inicializa la caché vacía.
+
+        Args:
+            capacidad (int): Número máximo de registros; 0 desactiva la caché.
+
+        Raises:
+            ValueError: Si la capacidad es negativa.
+        """
+        if capacidad < 0:
+            raise ValueError("La capacidad de la caché no puede ser negativa.")
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.__registros = OrderedDict()
+        self.__firma = None
+        self.__candado = threading.RLock()
+
+    def validar(self, firma):
+        """Vacía la caché si la firma del almacenamiento cambió.
+
+        Args:
+            firma: Firma actual del almacenamiento.
+        """
+        with self.__candado:
+            if firma != self.__firma:
+                self.__registros.clear()
+                self.__firma = firma
+
+    def obtener(self, firma, clave, cargar):
+        """Obtiene un registro de la caché o lo carga del almacenamiento.
+
+        Args:
+            firma: Firma actual del almacenamiento.
+            clave: Clave normalizada del registro.
+            cargar (callable): Función sin argumentos que lee el registro;
+                si devuelve None, el resultado no se guarda.
+
+        Returns:
+            El registro, o None si no existe.
+        """
+        with self.__candado:
+            self.validar(firma)
+            if clave in self.__registros:
+                self.__registros.move_to_end(clave)
+                self.aciertos += 1
+                return self.__registros[clave]
+            self.fallos += 1
+            registro = cargar()
+            if registro is not None:
+                self.guardar(clave, registro)
+            return registro
+
+    def guardar(self, clave, registro):
+        """Guarda o reemplaza un registro, desalojando al menos usado si hace falta."""
+        with self.__candado:
+            if self.capacidad == 0:
+                return
+            self.__registros[clave] = registro
+            self.__registros.move_to_end(clave)
+            while len(self.__registros) > self.capacidad:
+                self.__registros.popitem(last=False)
+                self.desalojos += 1
+
+    def invalidar(self, *claves):
+        """Descarta los registros con las claves indicadas."""
+        with self.__candado:
+            for clave in claves:
+                self.__registros.pop(clave, None)
+
+    def limpiar(self):
+        """Descarta todos los registros."""
+        with self.__candado:
+            self.__registros.clear()
+            self.__firma = None
+
+    @contextmanager
+    def escritura(self, firma):
+        """Rodea una escritura de la entidad sobre su almacenamiento.
+
+        Antes de escribir se descartan los registros si otro proceso cambió
+        el almacenamiento; al terminar se registra la firma nueva, para que
+        la escritura propia no vacíe la caché. Dentro del bloque, la entidad
+        invalida o actualiza las claves que modifica. Si la escritura falla,
+        la caché se vacía.
+
+        Debe usarse con el bloqueo exclusivo del almacenamiento tomado.
+
+        Args:
+            firma (callable): Función que devuelve la firma del almacenamiento.
+        """
+        with self.__candado:
+            self.validar(firma())
+            try:
+                yield
+            except BaseException:
+                self.limpiar()
+                raise
+            self.__firma = firma()
+
+    def estadisticas(self):
+        """Contadores de uso de la caché.
+
+        Returns:
+            dict: Aciertos, fallos, desalojos, registros guardados y capacidad.
+        """
+        with self.__candado:
+            return {
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'desalojos': self.desalojos,
+                'registros': len(self.__registros),
+                'capacidad': self.capacidad,
+            }
+
+    def __len__(self):
+        return len(self.__registros)
@@ -0,0 +1,57 @@
+import os
+
+from AlmacenamientoCSV import AlmacenamientoCSV
+from AlmacenamientoSQLite import AlmacenamientoSQLite
+
+# Tipo de almacenamiento que usan las entidades: 'csv' o 'sqlite'.
+ALMACENAMIENTO = os.environ.get('ALMACENAMIENTO', 'csv')
+
+# Ruta de la base de datos cuando se usa el almacenamiento 'sqlite'.
+RUTA_SQLITE = os.environ.get('RUTA_SQLITE', 'archivos/datos.db')
+
+# Número de registros que cada entidad guarda en su caché de consultas; 0 la desactiva.
+TAMANO_CACHE = int(os.environ.get('TAMANO_CACHE', '1024'))
+
+# Política de fsync de las escrituras anexadas al CSV y a la bitácora:
+# 'fila' (un fsync por escritura), 'grupo' (uno cada FILAS_POR_FSYNC filas o
+# MS_POR_FSYNC milisegundos), 'periodica' (uno cada MS_POR_FSYNC milisegundos)
+# o 'ninguna' (lo decide el sistema operativo).
+DURABILIDAD = os.environ.get('DURABILIDAD', 'grupo')
+FILAS_POR_FSYNC = int(os.environ.get('FILAS_POR_FSYNC', '100'))
+MS_POR_FSYNC = float(os.environ.get('MS_POR_FSYNC', '50'))
+
+
+def crear_almacenamiento(tabla, archivo, atributos, campos_clave, normalizar=None,
+                         tipo=None, modo='reescritura', umbral_bitacora=1024 * 1024, indices=(),
+                         fechas=(), texto=()):
+    """Crea el almacenamiento configurado para una entidad.
+
+    Args:
+        tabla (str): Nombre de la tabla cuando se usa SQLite.
+        archivo (str): Ruta al archivo CSV cuando se usa CSV.
+        atributos (list): Columnas de la entidad, en orden.
+        campos_clave (list): Columnas que forman la clave.
+        normalizar (callable): Función que se aplica a cada valor de la clave.
+        tipo (str): 'csv' o 'sqlite'. Por omisión se usa ``ALMACENAMIENTO``.
+        modo (str): Modo del almacenamiento CSV, 'reescritura' o 'bitacora'.
+        umbral_bitacora (int): Umbral de compactación de la bitácora CSV.
+        indices (list): Columnas de pocos valores distintos con índice secundario.
+        fechas (list): Columnas de fechas con índice ordenado por fecha.
+        texto (list): Columnas de texto para las búsquedas aproximadas por trigramas.
+
+    Returns:
+        Almacenamiento: El almacenamiento creado.
+
+    Raises:
+        ValueError: Si el tipo de almacenamiento no existe.
+    """
+    tipo = tipo or ALMACENAMIENTO
+    if tipo == 'csv':
+        return AlmacenamientoCSV(archivo, atributos, campos_clave, normalizar,
+                                 modo=modo, umbral_bitacora=umbral_bitacora, durabilidad=DURABILIDAD,
+                                 filas_por_fsync=FILAS_POR_FSYNC, ms_por_fsync=MS_POR_FSYNC, indices=indices,
+                                 fechas=fechas, texto=texto)
+    if tipo == 'sqlite':
+        return AlmacenamientoSQLite(RUTA_SQLITE, tabla, atributos, campos_clave, normalizar,
+                                   indices=indices, fechas=fechas, texto=texto)
+    raise ValueError(f"El almacenamiento {tipo} no existe; usa 'csv' o 'sqlite'.")
@@ -0,0 +1,265 @@
+import argparse
+import json
+import shlex
+import sys
+
+from Atleta import Atleta
+from Disciplina import Disciplina
+from Entrenador import Entrenador
+from Presentacion import a_json
+from Resultado import Resultado
+
+# Entidad de cada subcomando y los argumentos que forman su clave.
+ENTIDADES = {
+    'atletas': (Atleta, ['id']),
+    'entrenadores': (Entrenador, ['id']),
+    'disciplinas': (Disciplina, ['nombre', 'categoria']),
+}
+
+OPERADORES = ('=', '!=', '<', '<=', '>', '>=', 'entre', 'en', 'comienza', 'contiene')
+
+
+class ErrorDeArgumentos(Exception):
+    """Error en los argumentos de un comando del modo guion."""
+
+
+class _Parser(argparse.ArgumentParser):
+    """Parser que lanza una excepción en lugar de terminar el proceso.
+
+    Así un comando mal escrito en el modo guion se reporta como un
+    resultado fallido y no detiene los comandos siguientes. Pedir la ayuda
+    con ``-h`` también es un resultado fallido, con la ayuda como mensaje,
+    para que no se mezcle con las líneas JSON de la salida.
+    """
+
+    def error(self, message):
+        raise ErrorDeArgumentos(message)
+
+    def print_help(self, file=None):
+        raise ErrorDeArgumentos(self.format_help())
+
+    def exit(self, status=0, message=None):
+        raise ErrorDeArgumentos(message or f"El comando terminó con el código {status}.")
+
+
+def crear_parser(clase=argparse.ArgumentParser):
+    """Crea el parser de los comandos ``<entidad> <accion> ...``.
+
+    Args:
+        clase (type): Clase del parser principal y de sus subparsers.
+
+    Returns:
+        argparse.ArgumentParser: El parser configurado.
+    """
+    parser = clase(description="Gestión de atletas, entrenadores y disciplinas sin menús interactivos. "
+                               "Cada comando escribe su resultado como una línea JSON.")
+    parser.add_argument('--almacenamiento', choices=['csv', 'sqlite'], default=None,
+                        help="Almacenamiento a usar; por omisión, el de Configuracion.")
+    parser.add_argument('--modo', choices=['reescritura', 'bitacora'], default='reescritura',
+                        help="Modo del almacenamiento CSV: 'reescritura' (por omisión) reescribe el archivo en "
+                             "cada edición o baja; 'bitacora' anexa los cambios a una bitácora que se compacta "
+                             "al crecer.")
+    entidades = parser.add_subparsers(dest='entidad', required=True, parser_class=clase)
+
+    guion = entidades.add_parser('guion', help="Ejecuta varios comandos, uno por línea, en un solo proceso.")
+    guion.add_argument('origen', nargs='?', default='-',
+                       help="Archivo con los comandos; '-' (por omisión) para la entrada estándar.")
+
+    for nombre, (_, clave) in ENTIDADES.items():
+        entidad = entidades.add_parser(nombre, help=f"Operaciones sobre {nombre}.")
+        acciones = entidad.add_subparsers(dest='accion', required=True, parser_class=clase)
+
+        agregar = acciones.add_parser('agregar', help="Agrega un registro.")
+        agregar.add_argument('valores', nargs='+', help="Valores del registro en el orden de sus atributos.")
+
+        consultar = acciones.add_parser('consultar', help="Consulta un registro por su clave.")
+        editar = acciones.add_parser('editar', help="Edita un campo de un registro.")
+        eliminar = acciones.add_parser('eliminar', help="Elimina un registro por su clave.")
+        for accion in (consultar, editar, eliminar):
+            for campo in clave:
+                accion.add_argument(campo)
+        editar.add_argument('campo', help="Nombre del campo a editar.")
+        editar.add_argument('valor', help="Nuevo valor del campo.")
+
+        buscar = acciones.add_parser('buscar', help="Busca los registros que cumplen todos los filtros.")
+        buscar.add_argument('--filtro', nargs=3, action='append', default=[], metavar=('CAMPO', 'OPERADOR', 'VALOR'),
+                            help=f"Filtro sobre un campo; operadores: {', '.join(OPERADORES)}. Con 'en', "
+                                 "los valores se separan por comas; con 'entre', se escriben desde y hasta "
+                                 "separados por una coma e incluye ambos. Cada campo admite un solo filtro.")
+        buscar.add_argument('--campos', nargs='+', default=None, help="Campos que se devuelven; por omisión, todos.")
+        buscar.add_argument('--limite', type=int, default=None, help="Número máximo de resultados.")
+    return parser
+
+
+def filtros_de(filtros):
+    """Convierte los ``--filtro CAMPO OPERADOR VALOR`` al formato de ``buscar``.
+
+    Args:
+        filtros (list): Ternas [campo, operador, valor].
+
+    Returns:
+        dict: Filtros ``{campo: (operador, valor)}``.
+
+    Raises:
+        ValueError: Si un operador no es válido, si 'entre' no recibe dos
+            valores o si un campo tiene más de un filtro.
+    """
+    resultado = {}
+    usados = set()
+    for campo, operador, valor in filtros:
+        if operador not in OPERADORES:
+            raise ValueError(f"El operador {operador} no es válido.")
+        if campo.casefold() in usados:
+            raise ValueError(f"El campo {campo} tiene más de un filtro; para un rango usa "
+                             f"--filtro '{campo}' entre DESDE,HASTA.")
+        usados.add(campo.casefold())
+        if operador == 'entre':
+            valor = valor.split(',')
+            if len(valor) != 2:
+                raise ValueError(f"El operador 'entre' de {campo} necesita dos valores: DESDE,HASTA.")
+            valor = tuple(valor)
+        elif operador == 'en':
+            valor = valor.split(',')
+        resultado[campo] = (operador, valor)
+    return resultado
+
+
+class Consola:
+    """Ejecuta comandos sobre las entidades sin pasar por los menús.
+
+    Cada entidad se crea una sola vez, la primera vez que un comando la usa,
+    y se reutiliza en los comandos siguientes, de modo que un guion con
+    muchos comandos paga una sola vez el arranque y la carga del índice.
+    El ``Resultado`` de cada operación se devuelve convertido a JSON.
+
+    Attributes:
+        almacenamiento (str): 'csv', 'sqlite' o None para el configurado.
+        modo (str): Modo de escritura del almacenamiento CSV.
+    """
+
+    almacenamiento = None
+    modo = 'reescritura'
+
+    def __init__(self, almacenamiento=None, modo='reescritura'):
+        """Inicializa la consola sin cargar ninguna entidad.
+
+        Args:
+            almacenamiento (str): 'csv', 'sqlite' o None para el configurado.
+            modo (str): 'reescritura' o 'bitacora'.
+        """
+        self.almacenamiento = almacenamiento
+        self.modo = modo
+        self.__entidades = {}
+        self.__parser = crear_parser(_Parser)
+
+    def entidad(self, nombre):
+        """Obtiene la instancia de una entidad, creándola la primera vez.
+
+        Args:
+            nombre (str): 'atletas', 'entrenadores' o 'disciplinas'.
+
+        Returns:
+            Entidad: La instancia compartida por todos los comandos.
+        """
+        if nombre not in self.__entidades:
+            clase, _ = ENTIDADES[nombre]
+            self.__entidades[nombre] = clase(modo=self.modo, almacenamiento=self.almacenamiento)
+        return self.__entidades[nombre]
+
+    def ejecutar(self, argumentos):
+        """Ejecuta un comando ya interpretado por el parser.
+
+        Args:
+            argumentos (argparse.Namespace): Entidad, acción y sus argumentos.
+
+        Returns:
+            dict: Resultado con las llaves 'comando', 'exito', 'mensajes',
+            'errores' y 'resultado' (el registro, los registros encontrados o None).
+        """
+        try:
+            respuesta = self.__ejecutar(argumentos)
+        except Exception as e:
+            respuesta = a_json(Resultado(False, f"Error al ejecutar {argumentos.entidad} {argumentos.accion}: {e}"))
+        return {'comando': f"{argumentos.entidad} {argumentos.accion}", **respuesta}
+
+    def __ejecutar(self, argumentos):
+        """Llama a la operación de la entidad y convierte su resultado a JSON."""
+        entidad = self.entidad(argumentos.entidad)
+        clave = [getattr(argumentos, campo, None) for campo in ENTIDADES[argumentos.entidad][1]]
+
+        if argumentos.accion == 'agregar':
+            return a_json(entidad.agregar_datos(argumentos.valores))
+        if argumentos.accion == 'consultar':
+            return a_json(entidad.consultar_datos(*clave))
+        if argumentos.accion == 'editar':
+            return a_json(entidad.editar_datos(*clave, argumentos.campo, argumentos.valor))
+        if argumentos.accion == 'eliminar':
+            return a_json(entidad.eliminar_datos(*clave))
+        registros = list(entidad.buscar(filtros_de(argumentos.filtro), argumentos.campos, argumentos.limite))
+        return {**a_json(Resultado(True, f"Se encontraron {len(registros)} registros.")), 'resultado': registros}
+
+    def ejecutar_linea(self, linea):
+        """Interpreta y ejecuta una línea del modo guion.
+
+        Args:
+            linea (str): Comando con la misma sintaxis que la línea de
+                órdenes, por ejemplo ``atletas consultar 7``.
+
+        Returns:
+            dict: El resultado del comando, o None si la línea está vacía o
+            es un comentario.
+        """
+        try:
+            partes = shlex.split(linea, comments=True)
+            if not partes:
+                return None
+            argumentos = self.__parser.parse_args(partes)
+        except (ErrorDeArgumentos, ValueError) as e:
+            return {'comando': linea.strip(), **a_json(Resultado(False, str(e)))}
+        if argumentos.entidad == 'guion':
+            return {'comando': linea.strip(), **a_json(Resultado(False, "No es posible anidar un guion dentro de otro."))}
+        return self.ejecutar(argumentos)
+
+    def ejecutar_guion(self, lineas, salida=sys.stdout):
+        """Ejecuta un comando por línea y escribe cada resultado como JSON.
+
+        Args:
+            lineas (iterable): Líneas con los comandos.
+            salida (file): Archivo donde se escribe una línea JSON por comando.
+
+        Returns:
+            int: Número de comandos que fallaron.
+        """
+        fallidos = 0
+        for linea in lineas:
+            resultado = self.ejecutar_linea(linea)
+            if resultado is None:
+                continue
+            fallidos += not resultado['exito']
+            salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            salida.flush()
+        return fallidos
+
+
+def main(argv=None):
+    """Punto de entrada para ``python Consola.py <entidad> <accion> ...``.
+
+    Returns:
+        int: 0 si todos los comandos tuvieron éxito, 1 en caso contrario.
+    """
+    argumentos = crear_parser().parse_args(argv)
+    consola = Consola(argumentos.almacenamiento, argumentos.modo)
+
+    if argumentos.entidad != 'guion':
+        resultado = consola.ejecutar(argumentos)
+        print(json.dumps(resultado, ensure_ascii=False))
+        return 0 if resultado['exito'] else 1
+
+    if argumentos.origen == '-':
+        return 1 if consola.ejecutar_guion(sys.stdin) else 0
+    with open(argumentos.origen, encoding='utf-8') as origen:
+        return 1 if consola.ejecutar_guion(origen) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,272 @@
+from datetime import date, datetime
+
+
+def fecha(valor):
+    """Convierte una fecha con formato YYYY-MM-DD en ``datetime.date``.
+
+    Args:
+        valor (str | date): Fecha a convertir.
+
+    Returns:
+        date: La fecha convertida.
+
+    Raises:
+        ValueError: Si el texto no tiene el formato esperado.
+    """
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    return datetime.strptime(valor, "%Y-%m-%d").date()
+
+
+def fecha_para_edad(edad, hoy=None):
+    """Última fecha de nacimiento con la que se tienen al menos ``edad`` años.
+
+    Sirve para filtrar por edad sobre la fecha de nacimiento; por ejemplo,
+    ``{'Fecha de Nacimiento': ('<=', fecha_para_edad(50))}`` busca a quienes
+    ya cumplieron 50 años. Quien nació un 29 de febrero cumple años el 28 en
+    los años que no son bisiestos.
+
+    Args:
+        edad (int): Edad en años cumplidos.
+        hoy (date): Fecha de referencia; por omisión, la de hoy.
+
+    Returns:
+        date: La fecha de nacimiento límite.
+    """
+    hoy = hoy or date.today()
+    try:
+        return hoy.replace(year=hoy.year - edad)
+    except ValueError:
+        return hoy.replace(year=hoy.year - edad, day=28)
+
+
+class Condicion:
+    """Filtro sobre una sola columna, ya compilado contra los encabezados.
+
+    Attributes:
+        campo (str): Nombre de la columna tal como aparece en los encabezados.
+        posicion (int): Posición de la columna en cada fila.
+        operador (str): Uno de ``Consulta.OPERADORES``.
+        valor: Valor original del filtro.
+        convertir (callable): Conversión que se aplica al valor de la fila
+            antes de compararlo, o None si se compara el texto tal cual.
+    """
+
+    campo = ""
+    posicion = 0
+    operador = ""
+    valor = None
+    convertir = None
+
+    def __init__(self, campo, posicion, operador, valor, convertir=None):
+        self.campo = campo
+        self.posicion = posicion
+        self.operador = operador
+        self.valor = valor
+        self.convertir = convertir
+
+        if operador == 'en':
+            if isinstance(valor, (str, bytes)):
+                raise ValueError(f"El operador 'en' de {campo} necesita una lista de valores.")
+            self.__objetivo = {self.__convertir(v) for v in valor}
+        elif operador == 'entre':
+            if isinstance(valor, (str, bytes)) or len(valor) != 2:
+                raise ValueError(f"El operador 'entre' de {campo} necesita dos valores: desde y hasta.")
+            self.__objetivo = tuple(self.__convertir(v) for v in valor)
+        else:
+            self.__objetivo = self.__convertir(valor)
+        if operador in ('comienza', 'contiene') and not isinstance(self.__objetivo, str):
+            raise ValueError(f"El operador '{operador}' solo se aplica a texto.")
+        self.__comparar = Consulta.OPERADORES[operador]
+
+    def __convertir(self, valor):
+        """Convierte un valor del filtro al mismo tipo que las filas."""
+        if self.convertir is None:
+            return str(valor)
+        try:
+            return self.convertir(valor if isinstance(valor, (date, int, float)) else str(valor))
+        except (TypeError, ValueError):
+            raise ValueError(f"El valor {valor!r} no es válido para el campo {self.campo}.")
+
+    @property
+    def tiene_conversion(self):
+        """True si la condición compara valores convertidos y no el texto."""
+        return self.convertir is not None
+
+    def acepta(self, texto):
+        """Evalúa la condición sobre el texto de la columna de una fila.
+
+        Los valores que no pueden convertirse no cumplen la condición.
+        """
+        if self.convertir is not None:
+            try:
+                texto = self.convertir(texto)
+            except (TypeError, ValueError):
+                return False
+        return self.__comparar(texto, self.__objetivo)
+
+    @property
+    def costo(self):
+        """Costo relativo de evaluar la condición, para ordenar las condiciones."""
+        if self.convertir is not None:
+            return 2
+        return 0 if self.operador in ('=', 'en') else 1
+
+
+class Consulta:
+    """Filtros y proyección de una búsqueda, compilados una sola vez.
+
+    Los filtros son un diccionario ``{campo: valor}`` para igualdad o
+    ``{campo: (operador, valor)}`` con cualquiera de ``OPERADORES``; 'entre'
+    recibe un par ``(desde, hasta)`` e incluye ambos extremos. Todas las
+    condiciones deben cumplirse. También pueden ser una lista de esos
+    diccionarios: una fila se acepta si cumple alguno de ellos (O de Y). Las
+    condiciones se evalúan sobre las filas crudas, de la más barata a la más
+    cara, y solo las filas que pasan se convierten en diccionario.
+
+    Attributes:
+        encabezados (list): Columnas de las filas que se van a filtrar.
+        nombres (list): Nombre con el que se devuelve cada columna de
+            ``encabezados``.
+        alternativas (list): Una lista de condiciones, ordenadas por costo,
+            por cada diccionario de filtros.
+        condiciones (list): Condiciones de la única alternativa; vacía si hay
+            varias.
+        proyeccion (list): Posiciones de las columnas que se devuelven.
+        campos_clave (list): Columnas que forman la clave del almacenamiento.
+        tipos (dict): Conversión de cada columna que se compara por valor.
+    """
+
+    OPERADORES = {
+        '=': lambda a, b: a == b,
+        '!=': lambda a, b: a != b,
+        '<': lambda a, b: a < b,
+        '<=': lambda a, b: a <= b,
+        '>': lambda a, b: a > b,
+        '>=': lambda a, b: a >= b,
+        'en': lambda a, b: a in b,
+        'entre': lambda a, b: b[0] <= a <= b[1],
+        'comienza': lambda a, b: a.startswith(b),
+        'contiene': lambda a, b: b in a,
+    }
+
+    encabezados = []
+    nombres = []
+    alternativas = []
+    condiciones = []
+    proyeccion = []
+    campos_clave = []
+    tipos = {}
+
+    def __init__(self, filtros, encabezados, campos=None, tipos=None, normalizar=None, campos_clave=(),
+                 nombres=None):
+        """Compila los filtros y la proyección.
+
+        Args:
+            filtros (dict | list): Filtros de la búsqueda, o lista de filtros
+                alternativos; None o vacío para todos.
+            encabezados (list): Columnas de las filas, en orden.
+            campos (list): Columnas que se devuelven; por omisión, todas.
+            tipos (dict): Conversión por columna para comparar por valor y no
+                por texto, por ejemplo ``{'Fecha de Nacimiento': fecha}``.
+            normalizar (callable): Normalización de las columnas clave, para
+                que se comparen igual que en el índice.
+            campos_clave (list): Columnas que forman la clave.
+            nombres (list): Nombre con el que se devuelve cada columna en los
+                diccionarios de ``proyectar``; por omisión, el encabezado.
+
+        Raises:
+            ValueError: Si un campo o un operador no existen, o si un valor
+                del filtro no es válido para su campo.
+        """
+        self.encabezados = list(encabezados)
+        self.nombres = list(nombres) if nombres is not None else self.encabezados
+        self.campos_clave = [self.__resolver(campo) for campo in campos_clave]
+        self.tipos = tipos = {self.__resolver(campo): convertir for campo, convertir in (tipos or {}).items()
+                              if self.__buscar(campo) is not None}
+
+        alternativas = filtros if isinstance(filtros, (list, tuple)) and filtros else [filtros]
+        self.alternativas = [self.__compilar(alternativa, tipos, normalizar) for alternativa in alternativas]
+        self.condiciones = self.alternativas[0] if len(self.alternativas) == 1 else []
+
+        if campos is None:
+            self.proyeccion = list(range(len(self.encabezados)))
+        else:
+            self.proyeccion = [self.encabezados.index(self.__resolver(campo)) for campo in campos]
+
+    def __compilar(self, filtros, tipos, normalizar):
+        """Compila un diccionario de filtros en condiciones ordenadas por costo."""
+        condiciones = []
+        for campo, filtro in (filtros or {}).items():
+            campo = self.__resolver(campo)
+            operador, valor = filtro if isinstance(filtro, tuple) else ('=', filtro)
+            if operador not in self.OPERADORES:
+                raise ValueError(f"El operador {operador} no existe; usa uno de {list(self.OPERADORES)}.")
+            convertir = tipos.get(campo)
+            if convertir is None and normalizar is not None and campo in self.campos_clave:
+                convertir = normalizar
+            condiciones.append(Condicion(campo, self.encabezados.index(campo), operador, valor, convertir))
+        return sorted(condiciones, key=lambda condicion: condicion.costo)
+
+    def __buscar(self, campo):
+        """Encuentra una columna por nombre, sin distinguir mayúsculas y minúsculas."""
+        if campo in self.encabezados:
+            return campo
+        for encabezado in self.encabezados:
+            if encabezado.casefold() == str(campo).casefold():
+                return encabezado
+        return None
+
+    def __resolver(self, campo):
+        """Como ``__buscar``, pero falla si la columna no existe."""
+        encabezado = self.__buscar(campo)
+        if encabezado is None:
+            raise ValueError(f"El campo {campo} no existe.")
+        return encabezado
+
+    def igualdad(self, campo):
+        """Valor con el que se compara un campo por igualdad, o None si no hay.
+
+        Args:
+            campo (str): Columna a revisar.
+
+        Returns:
+            str: Valor original del filtro de igualdad, como texto.
+        """
+        for condicion in self.condiciones:
+            if condicion.campo == campo and condicion.operador == '=':
+                return str(condicion.valor)
+        return None
+
+    def clave(self):
+        """Valores de la clave si los filtros la fijan completa, o None."""
+        valores = [self.igualdad(campo) for campo in self.campos_clave]
+        if not valores or None in valores:
+            return None
+        return valores
+
+    def acepta(self, fila, condiciones=None):
+        """Evalúa las condiciones sobre una fila cruda.
+
+        Args:
+            fila (list): Valores de la fila en el orden de ``encabezados``.
+            condiciones (list): Condiciones que deben cumplirse todas; por
+                omisión, las de la consulta.
+
+        Returns:
+            bool: True si la fila cumple las condiciones.
+        """
+        if condiciones is None:
+            if len(self.alternativas) > 1:
+                return any(self.acepta(fila, alternativa) for alternativa in self.alternativas)
+            condiciones = self.condiciones
+        for condicion in condiciones:
+            if not condicion.acepta(fila[condicion.posicion]):
+                return False
+        return True
+
+    def proyectar(self, fila):
+        """Convierte una fila aceptada en diccionario con las columnas pedidas."""
+        return {self.nombres[posicion]: fila[posicion] for posicion in self.proyeccion}
@@ -1,24 +1,60 @@
 from abc import ABC, abstractmethod
 
+from Instrumentacion import instrumentar_clase
+
 class Entidad(ABC):
-    """Interfaz que define los métodos básicos para gestionar entidades."""
+    """Interfaz que define los métodos básicos para gestionar entidades.
+
+    Las operaciones no imprimen: devuelven un ``Resultado`` (o una lista de
+    ellos en las operaciones por lotes) y ``Presentacion`` los muestra.
+
+    Los métodos públicos de cada subclase se instrumentan al definirla (ver
+    ``Instrumentacion``); mientras la instrumentación esté desactivada no
+    registran nada. Una base genérica, como ``Tabla``, se declara con
+    ``instrumentar=False`` para que sus métodos se midan en cada entidad.
+    """
+
+    def __init_subclass__(cls, instrumentar=True, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if instrumentar:
+            instrumentar_clase(cls)
 
     @abstractmethod
     def agregar_datos(self, datos):
-        """Agrega una nueva entidad."""
+        """Agrega una nueva entidad y devuelve su ``Resultado``."""
         pass
 
     @abstractmethod
     def consultar_datos(self, id):
-        """Consulta la información de una entidad por su ID."""
+        """Consulta una entidad por su ID; el ``Resultado`` trae el registro."""
         pass
 
     @abstractmethod
     def editar_datos(self, id, campo, valor):
-        """Edita la los datos de un campo de una entidad."""
+        """Edita la los datos de un campo de una entidad y devuelve su ``Resultado``."""
         pass
 
     @abstractmethod
     def eliminar_datos(self, id):
-        """Elimina una entidad por su ID."""
-        pass
\ No newline at end of file
+        """Elimina una entidad por su ID y devuelve su ``Resultado``."""
+        pass
+
+    @abstractmethod
+    def buscar(self, filtros, campos=None, limite=None):
+        """Devuelve un generador con las entidades que cumplen unos filtros."""
+        pass
+
+    @abstractmethod
+    def registros(self, filtros=None, limite=None):
+        """Devuelve un generador con los registros tipados que cumplen unos filtros."""
+        pass
+
+    @abstractmethod
+    def editar_lote(self, cambios):
+        """Edita varias entidades en una sola pasada; devuelve un ``Resultado`` por cambio."""
+        pass
+
+    @abstractmethod
+    def eliminar_lote(self, claves):
+        """Elimina varias entidades en una sola pasada; devuelve un ``Resultado`` por clave."""
+        pass
@@ -0,0 +1,185 @@
+import atexit
+import csv
+import os
+import threading
+import weakref
+
+from Instrumentacion import METRICAS, instrumentar
+
+# Políticas de durabilidad, de la más segura a la más rápida:
+#   'fila'      fsync al terminar cada escritura; nada escrito se pierde.
+#   'grupo'     un fsync por cada ``filas_por_fsync`` filas o, a más tardar,
+#               ``ms_por_fsync`` milisegundos después de la primera fila sin
+#               sincronizar (commit en grupo).
+#   'periodica' un fsync cada ``ms_por_fsync`` milisegundos si hay cambios.
+#   'ninguna'   sin fsync; el sistema operativo decide cuándo escribir.
+POLITICAS = ('fila', 'grupo', 'periodica', 'ninguna')
+
+_ABIERTOS = weakref.WeakSet()
+
+
+class EscritorDeAnexos:
+    """Escritor que anexa filas a un archivo manteniendo abierto su descriptor.
+
+    En lugar de abrir y cerrar el archivo en cada alta, el escritor conserva
+    el archivo abierto en modo de anexado y agrupa las llamadas a ``fsync``
+    según la política de durabilidad. Cada escritura se vacía al sistema
+    operativo antes de volver, para que otros procesos y el índice vean las
+    filas de inmediato; lo que la política agrupa es solo la sincronización
+    con el disco.
+
+    Si el archivo se reemplaza (por una reescritura o una compactación) o se
+    elimina, el escritor lo detecta por su inodo y vuelve a abrirlo. Debe
+    usarse con el bloqueo exclusivo del almacenamiento tomado.
+
+    Attributes:
+        archivo (str): Ruta del archivo al que se anexa.
+        politica (str): Una de ``POLITICAS``.
+        filas_por_fsync (int): Filas que disparan un fsync con la política 'grupo'.
+        ms_por_fsync (float): Demora máxima, en milisegundos, de un fsync
+            pendiente con las políticas 'grupo' y 'periodica'.
+        sincronizaciones (int): Número de fsync realizados.
+    """
+
+    archivo = ""
+    politica = 'grupo'
+    filas_por_fsync = 100
+    ms_por_fsync = 50.0
+    sincronizaciones = 0
+
+    def __init__(self, archivo, politica='grupo', filas_por_fsync=100, ms_por_fsync=50.0, encoding=None):
+        """Inicializa el escritor sin abrir todavía el archivo.
+
+        Args:
+            archivo (str): Ruta del archivo al que se anexa.
+            politica (str): Una de ``POLITICAS``.
+            filas_por_fsync (int): Filas que disparan un fsync con 'grupo'.
+            ms_por_fsync (float): Demora máxima de un fsync pendiente.
+            encoding (str): Codificación del archivo; por omisión, la del sistema.
+
+        Raises:
+            ValueError: Si la política no existe.
+        """
+        if politica not in POLITICAS:
+            raise ValueError(f"La política de durabilidad {politica} no existe; usa una de {', '.join(POLITICAS)}.")
+        self.archivo = archivo
+        self.politica = politica
+        self.filas_por_fsync = max(1, filas_por_fsync)
+        self.ms_por_fsync = ms_por_fsync
+        self.sincronizaciones = 0
+        self.__encoding = encoding
+        self.__archivo = None
+        self.__writer = None
+        self.__inodo = None
+        self.__pendientes = 0
+        self.__temporizador = None
+        self.__candado = threading.RLock()
+        _ABIERTOS.add(self)
+
+    def __abierto(self):
+        """Devuelve el archivo abierto, reabriéndolo si fue reemplazado o eliminado."""
+        try:
+            inodo = os.stat(self.archivo).st_ino
+        except OSError:
+            inodo = None
+        if self.__archivo is None or inodo != self.__inodo:
+            self.__cerrar_archivo()
+            self.__archivo = open(self.archivo, mode='a', newline='', encoding=self.__encoding)
+            self.__writer = csv.writer(self.__archivo)
+            self.__inodo = os.fstat(self.__archivo.fileno()).st_ino
+        return self.__archivo
+
+    @instrumentar("EscritorDeAnexos.anexar")
+    def anexar_filas(self, filas):
+        """Anexa filas CSV con una sola escritura al sistema operativo.
+
+        Args:
+            filas (list): Listas de valores de cada fila.
+        """
+        with self.__candado:
+            inicio = self.__abierto().tell()
+            self.__writer.writerows(filas)
+            self.__terminar(len(filas), inicio)
+
+    @instrumentar("EscritorDeAnexos.anexar")
+    def anexar_lineas(self, lineas):
+        """Anexa líneas de texto ya terminadas en salto de línea.
+
+        Args:
+            lineas (list): Líneas a escribir.
+        """
+        with self.__candado:
+            archivo = self.__abierto()
+            inicio = archivo.tell()
+            archivo.writelines(lineas)
+            self.__terminar(len(lineas), inicio)
+
+    def __terminar(self, filas, inicio):
+        """Vacía la escritura al sistema operativo y aplica la política de fsync."""
+        self.__archivo.flush()
+        METRICAS.sumar('bytes_escritos', self.__archivo.tell() - inicio)
+        if self.politica == 'ninguna' or filas == 0:
+            return
+        self.__pendientes += filas
+        if self.politica == 'fila' or (self.politica == 'grupo' and self.__pendientes >= self.filas_por_fsync):
+            self.__fsync()
+        elif self.__temporizador is None:
+            self.__temporizador = threading.Timer(self.ms_por_fsync / 1000, self.__al_vencer)
+            self.__temporizador.daemon = True
+            self.__temporizador.start()
+
+    def __al_vencer(self):
+        """Sincroniza las filas pendientes cuando vence la demora máxima."""
+        with self.__candado:
+            self.__temporizador = None
+            if self.__pendientes:
+                self.__fsync()
+
+    def __fsync(self):
+        """Sincroniza con el disco lo escrito hasta ahora."""
+        if self.__archivo is not None:
+            with METRICAS.operacion("EscritorDeAnexos.fsync"):
+                os.fsync(self.__archivo.fileno())
+            self.sincronizaciones += 1
+        self.__pendientes = 0
+        if self.__temporizador is not None:
+            self.__temporizador.cancel()
+            self.__temporizador = None
+
+    def sincronizar(self):
+        """Sincroniza con el disco las filas pendientes, sin esperar a la política."""
+        with self.__candado:
+            if self.__pendientes:
+                self.__fsync()
+
+    def __cerrar_archivo(self):
+        """Sincroniza lo pendiente y cierra el archivo abierto, si lo hay."""
+        if self.__archivo is None:
+            return
+        try:
+            if self.__pendientes:
+                self.__fsync()
+        finally:
+            self.__archivo.close()
+            self.__archivo = None
+            self.__writer = None
+            self.__inodo = None
+
+    def cerrar(self):
+        """Sincroniza lo pendiente y cierra el archivo.
+
+        El escritor puede seguir usándose: la siguiente escritura vuelve a
+        abrir el archivo.
+        """
+        with self.__candado:
+            self.__cerrar_archivo()
+
+
+@atexit.register
+def cerrar_todos():
+    """Sincroniza y cierra los escritores abiertos al terminar el proceso."""
+    for escritor in list(_ABIERTOS):
+        try:
+            escritor.cerrar()
+        except OSError:
+            pass
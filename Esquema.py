@@ -0,0 +1,158 @@
+from ValidadorDeDatos import ReglasDeValidacion
+
+# Validadores que puede declarar una columna y el argumento de
+# ``ReglasDeValidacion`` que les corresponde.
+VALIDADORES = {'id': 'ids', 'fecha': 'fechas', 'telefono': 'telefonos', 'correo': 'correos'}
+
+
+class Esquema:
+    """Definición declarativa de una tabla de ``Tabla``.
+
+    Describe las columnas, la clave, las columnas que pueden quedar vacías,
+    el validador de cada columna, el separador de las columnas con varios
+    valores y los índices en memoria. Al crearse compila una sola vez las
+    posiciones de las columnas y las reglas de validación, que comparten
+    todas las instancias de la entidad. Por ejemplo::
+
+        Esquema('disciplina', "archivos/disciplina.csv",
+                ['Nombre', 'Categoria', 'Participantes', 'Patrocinadores'],
+                ['Nombre', 'Categoria'], RegistroDisciplina, 'disciplina', 'disciplinas',
+                femenino=True, normalizar=str.casefold, indices=['Categoria'])
+
+    Attributes:
+        tabla (str): Nombre de la tabla cuando se usa SQLite.
+        archivo (str): Ruta al archivo CSV cuando se usa CSV.
+        atributos (list): Columnas, en orden.
+        campos_clave (list): Columnas que forman la clave.
+        registro (type): Registro tipado de ``Registros`` de cada fila.
+        singular (str): Nombre de un registro en los mensajes, por ejemplo 'atleta'.
+        plural (str): Nombre de varios registros en los mensajes.
+        femenino (bool): Si el nombre es femenino, para concordar los mensajes.
+        normalizar (callable): Función que se aplica a cada valor de la clave.
+        opcionales (list): Columnas que pueden estar vacías.
+        validadores (dict): Columna -> 'id', 'fecha', 'telefono' o 'correo'.
+        separadores (dict): Columna con varios valores -> separador con el
+            que se validan uno por uno; por omisión, la coma.
+        indices (list): Columnas de pocos valores distintos con índice secundario.
+        fechas (list): Columnas de fechas con índice ordenado.
+        texto (list): Columnas con índice de trigramas para buscar por nombre aproximado.
+        nacimiento (str): Columna de fecha de nacimiento para ordenar por
+            edad, o None si la tabla no tiene.
+        posiciones (dict): Columna -> posición en las filas.
+        posiciones_clave (list): Posición de cada columna de la clave.
+        reglas (ReglasDeValidacion): Reglas de validación compiladas.
+    """
+
+    tabla = ""
+    archivo = ""
+    atributos = []
+    campos_clave = []
+    registro = None
+    singular = ""
+    plural = ""
+    femenino = False
+    normalizar = None
+    opcionales = []
+    validadores = {}
+    separadores = {}
+    indices = []
+    fechas = []
+    texto = []
+    nacimiento = None
+    posiciones = {}
+    posiciones_clave = []
+    reglas = None
+
+    def __init__(self, tabla, archivo, atributos, campos_clave, registro, singular, plural, femenino=False,
+                 normalizar=None, opcionales=(), validadores=None, separadores=None, indices=(), fechas=(),
+                 texto=(), nacimiento=None):
+        """Define la tabla y compila sus posiciones y reglas.
+
+        Raises:
+            ValueError: Si una columna no existe o un validador no es válido.
+        """
+        self.tabla = tabla
+        self.archivo = archivo
+        self.atributos = list(atributos)
+        self.campos_clave = list(campos_clave)
+        self.registro = registro
+        self.singular = singular
+        self.plural = plural
+        self.femenino = femenino
+        self.normalizar = normalizar
+        self.opcionales = list(opcionales)
+        self.validadores = dict(validadores or {})
+        self.separadores = dict(separadores or {})
+        self.indices = list(indices)
+        self.fechas = list(fechas)
+        self.texto = list(texto)
+        self.nacimiento = nacimiento
+
+        for campo in (self.campos_clave + self.opcionales + list(self.validadores) + list(self.separadores)
+                      + self.indices + self.fechas + self.texto + ([nacimiento] if nacimiento else [])):
+            if campo not in self.atributos:
+                raise ValueError(f"El campo {campo} no es un atributo de {self.singular}.")
+        por_tipo = {argumento: [] for argumento in VALIDADORES.values()}
+        for campo, tipo in self.validadores.items():
+            if tipo not in VALIDADORES:
+                raise ValueError(f"El validador {tipo} de {campo} no existe.")
+            por_tipo[VALIDADORES[tipo]].append(campo)
+
+        self.posiciones = {campo: posicion for posicion, campo in enumerate(self.atributos)}
+        self.posiciones_clave = [self.posiciones[campo] for campo in self.campos_clave]
+        self.reglas = ReglasDeValidacion(self.atributos, self.opcionales, separadores=self.separadores, **por_tipo)
+
+    @property
+    def articulo(self):
+        """Artículo definido del nombre: 'el' o 'la'."""
+        return "la" if self.femenino else "el"
+
+    @property
+    def contraccion(self):
+        """Preposición 'de' con el artículo: 'del' o 'de la'."""
+        return "de la" if self.femenino else "del"
+
+    def concordar(self, palabra):
+        """Palabra terminada en 'o' concordada con el nombre, por ejemplo 'registrada'."""
+        return palabra[:-1] + "a" if self.femenino else palabra
+
+    def clave(self, valores):
+        """Clave con la que se reporta un registro: el valor si la clave
+        tiene una columna, o la tupla de valores si tiene varias."""
+        return valores[0] if len(self.campos_clave) == 1 else tuple(valores)
+
+    def valores_de_clave(self, clave):
+        """Valores de las columnas clave a partir de una clave de ``clave``."""
+        return [clave] if len(self.campos_clave) == 1 else list(clave)
+
+    def clave_de_datos(self, datos):
+        """Clave de una fila de datos.
+
+        Si la fila no tiene todas las columnas, la clave es su primer valor
+        cuando la clave tiene una sola columna, o None.
+        """
+        if len(datos) != len(self.atributos):
+            return datos[0] if len(self.campos_clave) == 1 and datos else None
+        return self.clave([datos[posicion] for posicion in self.posiciones_clave])
+
+    def nombres(self, encabezados):
+        """Nombre de cada encabezado de un almacenamiento según el esquema.
+
+        Los encabezados de un CSV pueden escribir una columna con otras
+        mayúsculas, por ejemplo 'Fecha de nacimiento'; los registros se
+        devuelven siempre con el nombre del esquema. Un encabezado que no
+        corresponde a ninguna columna conserva su nombre.
+
+        Args:
+            encabezados (list): Encabezados del almacenamiento, en orden.
+
+        Returns:
+            list: El nombre de cada encabezado, en el mismo orden.
+        """
+        por_plegado = {campo.casefold(): campo for campo in self.atributos}
+        return [por_plegado.get(encabezado.casefold(), encabezado) for encabezado in encabezados]
+
+    def describir(self, valores):
+        """Texto que identifica un registro, por ejemplo 'ID 5' o
+        'Nombre Futbol y Categoria Equipo'."""
+        return " y ".join(f"{campo} {valor}" for campo, valor in zip(self.campos_clave, valores))
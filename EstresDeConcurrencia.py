@@ -0,0 +1,198 @@
+"""Prueba de estrés del almacenamiento con varios hilos y procesos a la vez.
+
+Cada trabajador agrega atletas, entrenadores y disciplinas con claves propias
+y después edita y elimina parte de ellos, usando tanto las operaciones
+individuales como las de lote. Los hilos de un mismo proceso comparten las
+instancias de las entidades y los procesos usan instancias independientes,
+de modo que se ejercitan tanto el candado entre hilos como el bloqueo de
+archivo entre procesos. Al final se verifica que no se perdió ni se duplicó
+ningún registro y que todas las ediciones quedaron aplicadas.
+
+Uso:
+    python EstresDeConcurrencia.py --procesos 4 --hilos 4 --operaciones 50
+    python EstresDeConcurrencia.py --almacenamiento sqlite
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+
+from Atleta import Atleta
+from Disciplina import Disciplina
+from Entrenador import Entrenador
+from ReescrituraCSV import crear_temporal
+
+BLOQUE = 100000
+
+
+def datos_de_persona(clave, extra):
+    """Genera datos válidos de un atleta o entrenador con el ID indicado."""
+    return [str(clave), f"N{clave}", "Paterno", "", "Mexico", "2000-01-01", extra, "Futbol",
+            "1234567890", f"p{clave}@correo.com"]
+
+
+def trabajar(trabajador, operaciones, atletas, entrenadores, disciplinas):
+    """Ejecuta la carga de un trabajador sobre las instancias recibidas."""
+    base = trabajador * BLOQUE
+    for i in range(operaciones):
+        atletas.agregar_datos(datos_de_persona(base + i, "Futbol")[:7] + ["M", "1234567890", ""])
+        entrenadores.agregar_datos(datos_de_persona(base + i, f"N{base + i}"))
+        disciplinas.agregar_datos([f"D{base + i}", "Equipo", "Participante", "Patrocinador"])
+
+    pares = [i for i in range(operaciones) if i % 2 == 0]
+    for i in pares[:len(pares) // 2]:
+        atletas.editar_datos(str(base + i), 'Nombre', f"E{base + i}")
+        entrenadores.editar_datos(str(base + i), 'Nombre', f"E{base + i}")
+        disciplinas.editar_datos(f"d{base + i}", "EQUIPO", 'Participantes', f"E{base + i}")
+    resto = pares[len(pares) // 2:]
+    atletas.editar_lote([(base + i, 'Nombre', f"E{base + i}") for i in resto])
+    entrenadores.editar_lote([(base + i, 'Nombre', f"E{base + i}") for i in resto])
+    disciplinas.editar_lote([(f"D{base + i}", "Equipo", 'Participantes', f"E{base + i}") for i in resto])
+
+    tercios = [i for i in range(operaciones) if i % 3 == 0]
+    for i in tercios[:len(tercios) // 2]:
+        atletas.eliminar_datos(str(base + i))
+        entrenadores.eliminar_datos(str(base + i))
+        disciplinas.eliminar_datos(f"D{base + i}", "Equipo")
+    resto = tercios[len(tercios) // 2:]
+    atletas.eliminar_lote([base + i for i in resto])
+    entrenadores.eliminar_lote([base + i for i in resto])
+    disciplinas.eliminar_lote([(f"D{base + i}", "Equipo") for i in resto])
+
+
+def ejecutar_proceso(proceso, hilos, operaciones, modo, almacenamiento, directorio):
+    """Ejecuta varios hilos que comparten las instancias de un proceso."""
+    os.chdir(directorio)
+    opciones = {'modo': modo, 'umbral_bitacora': 4096, 'almacenamiento': almacenamiento}
+    with contextlib.redirect_stdout(io.StringIO()):
+        atletas = Atleta(**opciones)
+        entrenadores = Entrenador(**opciones)
+        disciplinas = Disciplina(**opciones)
+        trabajadores = [
+            threading.Thread(target=trabajar,
+                             args=(proceso * hilos + hilo + 1, operaciones, atletas, entrenadores, disciplinas))
+            for hilo in range(hilos)
+        ]
+        for trabajador in trabajadores:
+            trabajador.start()
+        for trabajador in trabajadores:
+            trabajador.join()
+
+
+def esperados(trabajadores, operaciones):
+    """Calcula las claves que deben sobrevivir y cuáles deben estar editadas."""
+    claves = {}
+    for trabajador in range(1, trabajadores + 1):
+        base = trabajador * BLOQUE
+        for i in range(operaciones):
+            if i % 3 != 0:
+                claves[base + i] = i % 2 == 0
+    return claves
+
+
+def leer_exportacion(entidad):
+    """Exporta la vista combinada de una entidad y la devuelve como filas."""
+    destino = crear_temporal("archivos/exportacion.csv")
+    with contextlib.redirect_stdout(io.StringIO()):
+        entidad.exportar_csv(destino)
+    with open(destino, mode='r', newline='') as file:
+        filas = list(csv.DictReader(file))
+    os.remove(destino)
+    return filas
+
+
+def verificar(nombre, filas, columna_clave, columna_editada, clave_de, valor_editado, claves):
+    """Compara las filas de una entidad contra las claves esperadas.
+
+    Returns:
+        list: Descripción de cada problema encontrado.
+    """
+    problemas = []
+    vistas = {}
+    for fila in filas:
+        clave = clave_de(fila[columna_clave])
+        if clave is None:
+            continue
+        if clave in vistas:
+            problemas.append(f"{nombre}: clave {clave} duplicada")
+        vistas[clave] = fila
+    faltantes = set(claves) - set(vistas)
+    sobrantes = set(vistas) - set(claves)
+    if faltantes:
+        problemas.append(f"{nombre}: faltan {len(faltantes)} registros, por ejemplo {sorted(faltantes)[:5]}")
+    if sobrantes:
+        problemas.append(f"{nombre}: sobran {len(sobrantes)} registros, por ejemplo {sorted(sobrantes)[:5]}")
+    for clave, editada in claves.items():
+        fila = vistas.get(clave)
+        if fila is not None and editada and fila[columna_editada] != valor_editado(clave):
+            problemas.append(f"{nombre}: la edición de {clave} se perdió")
+    return problemas
+
+
+def main(argv=None):
+    """Ejecuta la prueba de estrés y devuelve 0 si no hubo problemas."""
+    parser = argparse.ArgumentParser(description="Prueba de estrés concurrente del almacenamiento.")
+    parser.add_argument('--procesos', type=int, default=4)
+    parser.add_argument('--hilos', type=int, default=4)
+    parser.add_argument('--operaciones', type=int, default=30)
+    parser.add_argument('--modo', choices=['reescritura', 'bitacora'], default='reescritura')
+    parser.add_argument('--almacenamiento', choices=['csv', 'sqlite'], default='csv')
+    argumentos = parser.parse_args(argv)
+
+    directorio = tempfile.mkdtemp(prefix="estres-")
+    os.makedirs(os.path.join(directorio, "archivos"))
+    origen = os.getcwd()
+    try:
+        procesos = [
+            multiprocessing.Process(target=ejecutar_proceso,
+                                    args=(proceso, argumentos.hilos, argumentos.operaciones,
+                                          argumentos.modo, argumentos.almacenamiento, directorio))
+            for proceso in range(argumentos.procesos)
+        ]
+        for proceso in procesos:
+            proceso.start()
+        for proceso in procesos:
+            proceso.join()
+
+        os.chdir(directorio)
+        claves = esperados(argumentos.procesos * argumentos.hilos, argumentos.operaciones)
+        with contextlib.redirect_stdout(io.StringIO()):
+            opciones = {'almacenamiento': argumentos.almacenamiento}
+            atletas, entrenadores, disciplinas = Atleta(**opciones), Entrenador(**opciones), Disciplina(**opciones)
+        numero = lambda valor: int(valor)
+        disciplina = lambda valor: int(valor[1:]) if valor.startswith("D") else None
+        problemas = []
+        problemas += verificar("Atleta", leer_exportacion(atletas), 'ID', 'Nombre',
+                               numero, lambda clave: f"E{clave}", claves)
+        problemas += verificar("Entrenador", leer_exportacion(entrenadores), 'ID', 'Nombre',
+                               numero, lambda clave: f"E{clave}", claves)
+        problemas += verificar("Disciplina", leer_exportacion(disciplinas), 'Nombre', 'Participantes',
+                               disciplina, lambda clave: f"E{clave}", claves)
+        temporales = [nombre for nombre in os.listdir("archivos") if nombre.endswith(".tmp")]
+        if temporales:
+            problemas.append(f"Quedaron archivos temporales: {temporales}")
+    finally:
+        os.chdir(origen)
+        shutil.rmtree(directorio, ignore_errors=True)
+
+    fallos = [proceso.exitcode for proceso in procesos if proceso.exitcode != 0]
+    if fallos:
+        problemas.append(f"{len(fallos)} procesos terminaron con error")
+
+    total = argumentos.procesos * argumentos.hilos
+    print(f"{total} trabajadores, {argumentos.operaciones} registros por entidad cada uno, "
+          f"almacenamiento {argumentos.almacenamiento}, modo {argumentos.modo}.")
+    for problema in problemas:
+        print(problema)
+    print("Sin registros perdidos ni duplicados." if not problemas else f"{len(problemas)} problemas encontrados.")
+    return 0 if not problemas else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
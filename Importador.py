@@ -0,0 +1,211 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import time
+
+from Atleta import Atleta
+from Disciplina import Disciplina
+from Entrenador import Entrenador
+
+ENTIDADES = {
+    'atletas': Atleta,
+    'entrenadores': Entrenador,
+    'disciplinas': Disciplina,
+}
+
+
+class Importador:
+    """Carga masiva de registros desde un archivo CSV o JSONL.
+
+    Los registros se leen de forma secuencial por bloques; cada bloque se
+    valida columna por columna con las mismas reglas que ``agregar_datos``
+    (``validar_lote``) y cada registro se revisa contra el índice de la
+    entidad, que también detecta los repetidos dentro del mismo archivo.
+    Durante toda la carga se mantiene el bloqueo exclusivo del almacenamiento.
+    Los registros válidos se acumulan y se escriben por lotes, con una sola
+    escritura (o una sola sentencia en SQLite) por lote, y los rechazados se
+    escriben, junto con el motivo, en un archivo de rechazos.
+
+    Attributes:
+        entidad (Entidad): Entidad en la que se cargan los registros.
+        tamano_lote (int): Número de registros que se escriben a la vez.
+    """
+
+    entidad = None
+    tamano_lote = 0
+
+    def __init__(self, entidad, tamano_lote=10000):
+        """Inicializa el importador.
+
+        Args:
+            entidad (Entidad): Entidad en la que se cargan los registros.
+            tamano_lote (int): Número de registros que se escriben a la vez.
+        """
+        self.entidad = entidad
+        self.tamano_lote = tamano_lote
+
+    def __leer_csv(self, origen, encabezados):
+        """Recorre un archivo CSV y ordena sus columnas según la entidad.
+
+        Yields:
+            tuple: (número de línea, datos ordenados o None, valores originales).
+        """
+        with open(origen, mode='r', newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            entrada = [columna.strip().casefold() for columna in next(reader, [])]
+            faltantes = [campo for campo in encabezados if campo.casefold() not in entrada]
+            if faltantes:
+                raise ValueError(f"El archivo {origen} no contiene las columnas {faltantes}")
+            posiciones = [entrada.index(campo.casefold()) for campo in encabezados]
+            for numero, fila in enumerate(reader, start=2):
+                if not fila:
+                    continue
+                if len(fila) != len(entrada):
+                    yield numero, None, fila
+                else:
+                    yield numero, [fila[posicion] for posicion in posiciones], fila
+
+    def __leer_jsonl(self, origen, encabezados):
+        """Recorre un archivo JSONL con un objeto por línea.
+
+        Yields:
+            tuple: (número de línea, datos ordenados o None, valores originales).
+        """
+        with open(origen, mode='r', encoding='utf-8') as file:
+            for numero, linea in enumerate(file, start=1):
+                if not linea.strip():
+                    continue
+                try:
+                    objeto = json.loads(linea)
+                except ValueError:
+                    yield numero, None, [linea.rstrip('\n')]
+                    continue
+                if not isinstance(objeto, dict):
+                    yield numero, None, [linea.rstrip('\n')]
+                    continue
+                valores = {str(campo).casefold(): valor for campo, valor in objeto.items()}
+                if any(campo.casefold() not in valores for campo in encabezados):
+                    yield numero, None, list(objeto.values())
+                    continue
+                datos = []
+                for campo in encabezados:
+                    valor = valores[campo.casefold()]
+                    datos.append("" if valor is None else str(valor))
+                yield numero, datos, datos
+
+    def importar(self, origen, rechazos=None):
+        """Importa los registros de un archivo CSV o JSONL.
+
+        Args:
+            origen (str): Ruta del archivo a importar. Los archivos con
+                extensión .jsonl o .json se leen como JSONL; el resto como CSV
+                con encabezados.
+            rechazos (str): Ruta del archivo de rechazos. Por omisión se usa
+                el nombre del origen con el sufijo ``.rechazos.csv``.
+
+        Returns:
+            dict: Resumen con las filas leídas, importadas y rechazadas, los
+            segundos transcurridos y las filas por segundo.
+        """
+        if rechazos is None:
+            rechazos = os.path.splitext(origen)[0] + ".rechazos.csv"
+
+        with self.entidad.almacen.exclusivo():
+            return self.__importar(origen, rechazos)
+
+    def __importar(self, origen, rechazos):
+        """Realiza la importación; quien llama ya tiene el bloqueo exclusivo."""
+        entidad = self.entidad
+        almacen = entidad.almacen
+        encabezados = list(almacen.encabezados)
+        posiciones_clave = [encabezados.index(campo) for campo in almacen.campos_clave]
+
+        if os.path.splitext(origen)[1].lower() in ('.jsonl', '.json'):
+            registros = self.__leer_jsonl(origen, encabezados)
+        else:
+            registros = self.__leer_csv(origen, encabezados)
+
+        vistas = set()
+        leidas = importadas = rechazadas = 0
+        inicio = time.perf_counter()
+
+        with open(rechazos, mode='w', newline='', encoding='utf-8') as archivo_rechazos:
+            writer_rechazos = csv.writer(archivo_rechazos)
+            writer_rechazos.writerow(['Linea', 'Motivo'] + encabezados)
+
+            while True:
+                bloque = list(itertools.islice(registros, self.tamano_lote))
+                if not bloque:
+                    break
+                leidas += len(bloque)
+                completos = [datos for _, datos, _ in bloque if datos is not None]
+                errores = iter(entidad.validar_lote(completos))
+                lote = []
+
+                for numero, datos, originales in bloque:
+                    motivo = None
+                    if datos is None:
+                        motivo = "El registro no tiene el número de campos esperado."
+                    else:
+                        errores_de_fila = next(errores)
+                        if errores_de_fila:
+                            motivo = " ".join(error.mensaje for error in errores_de_fila)
+                        else:
+                            valores_clave = [datos[posicion] for posicion in posiciones_clave]
+                            clave = almacen.clave_de(valores_clave)
+                            if clave in vistas:
+                                motivo = "Registro repetido dentro del archivo de origen."
+                            elif almacen.existe(*valores_clave):
+                                motivo = "El registro ya está registrado."
+
+                    if motivo is not None:
+                        rechazadas += 1
+                        writer_rechazos.writerow([numero, motivo] + list(originales))
+                        continue
+
+                    vistas.add(clave)
+                    lote.append(datos)
+
+                if lote:
+                    almacen.agregar_lote(lote)
+                    importadas += len(lote)
+
+        segundos = time.perf_counter() - inicio
+        resumen = {
+            'leidas': leidas,
+            'importadas': importadas,
+            'rechazadas': rechazadas,
+            'segundos': round(segundos, 3),
+            'filas_por_segundo': round(leidas / segundos, 1) if segundos > 0 else 0.0,
+            'rechazos': rechazos,
+        }
+        return resumen
+
+
+def main(argv=None):
+    """Punto de entrada para ``python -m Importador <entidad> <archivo>``."""
+    parser = argparse.ArgumentParser(description="Carga masiva de registros desde CSV o JSONL.")
+    parser.add_argument('entidad', choices=sorted(ENTIDADES), help="Entidad a la que se importan los registros.")
+    parser.add_argument('origen', help="Archivo CSV (con encabezados) o JSONL a importar.")
+    parser.add_argument('--rechazos', default=None, help="Archivo donde se escriben los registros rechazados.")
+    parser.add_argument('--lote', type=int, default=10000, help="Número de registros que se escriben a la vez.")
+    argumentos = parser.parse_args(argv)
+
+    importador = Importador(ENTIDADES[argumentos.entidad](), tamano_lote=argumentos.lote)
+    try:
+        resumen = importador.importar(argumentos.origen, argumentos.rechazos)
+    except Exception as e:
+        print(f"Error al importar {argumentos.origen}: {e}")
+        return 1
+
+    print(f"Filas leídas: {resumen['leidas']}")
+    print(f"Filas importadas: {resumen['importadas']}")
+    print(f"Filas rechazadas: {resumen['rechazadas']} (ver {resumen['rechazos']})")
+    print(f"Tiempo: {resumen['segundos']} s ({resumen['filas_por_segundo']} filas/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+from bisect import bisect_left, insort
+
+from IndicePrimario import IndicePrimario
+
+
+class IndiceCompuesto(IndicePrimario):
+    """Índice por clave compuesta que además permite búsquedas por prefijo.
+
+    Las claves se guardan normalizadas (por ejemplo, sin distinguir mayúsculas
+    y minúsculas) y, además del acceso directo por clave, se mantiene una
+    lista ordenada de claves para encontrar en tiempo logarítmico todos los
+    registros cuyo primer campo de la clave comienza con un prefijo dado.
+    Las claves insertadas se incorporan a la lista ordenada hasta que se
+    necesita, para que construir el índice no cueste una inserción ordenada
+    por registro.
+    """
+
+    def __init__(self, archivo, campos_clave, normalizar=str.casefold, bitacora=None, instantanea=None,
+                 secundarios=(), fechas=(), texto=()):
+        """Inicializa el índice compuesto.
+
+        Args:
+            archivo (str): Ruta al archivo CSV a indexar.
+            campos_clave (list): Columnas que forman la clave, al menos dos.
+            normalizar (callable): Función que se aplica a cada valor de la
+                clave. Por omisión ``str.casefold``.
+            bitacora (BitacoraDeCambios): Bitácora opcional cuyos cambios se
+                aplican sobre el contenido del archivo.
+            instantanea (str): Ruta opcional de la instantánea columnar.
+            secundarios (list): Columnas que tienen índice secundario.
+            fechas (list): Columnas de fechas que tienen índice ordenado.
+            texto (list): Columnas de texto que comparten el índice de trigramas.
+        """
+        self.__ordenadas = []
+        self.__pendientes = []
+        super().__init__(archivo, campos_clave, normalizar, bitacora, instantanea, secundarios, fechas, texto)
+
+    def _reiniciar(self):
+        self.__ordenadas = []
+        self.__pendientes = []
+
+    def _al_insertar(self, clave):
+        self.__pendientes.append(clave)
+
+    def __ordenar(self):
+        """Incorpora a la lista ordenada las claves pendientes.
+
+        Puede llamarse desde varias lecturas a la vez: la lista nueva se
+        prepara aparte y reemplaza a la anterior, que quien la esté
+        recorriendo sigue viendo completa.
+
+        Returns:
+            list: Lista ordenada de claves.
+        """
+        with self._candado:
+            if self.__pendientes:
+                ordenadas = list(self.__ordenadas)
+                if len(self.__pendientes) <= 16:
+                    for clave in self.__pendientes:
+                        insort(ordenadas, clave)
+                else:
+                    ordenadas.extend(self.__pendientes)
+                    ordenadas.sort()
+                self.__ordenadas = ordenadas
+                self.__pendientes = []
+            return self.__ordenadas
+
+    def _al_eliminar(self, clave):
+        ordenadas = self.__ordenar()
+        posicion = bisect_left(ordenadas, clave)
+        if posicion < len(ordenadas) and ordenadas[posicion] == clave:
+            del ordenadas[posicion]
+
+    def __claves_con_prefijo(self, prefijo):
+        """Recorre en orden las claves cuyo primer campo comienza con un prefijo."""
+        self.asegurar_vigente()
+        ordenadas = self.__ordenar()
+        prefijo = self.clave_de([prefijo] + [''] * (len(self.campos_clave) - 1))[0]
+        posicion = bisect_left(ordenadas, (prefijo,))
+        while posicion < len(ordenadas) and ordenadas[posicion][0].startswith(prefijo):
+            yield ordenadas[posicion]
+            posicion += 1
+
+    def buscar_prefijo(self, prefijo):
+        """Obtiene los registros cuyo primer campo clave comienza con un prefijo.
+
+        Args:
+            prefijo (str): Prefijo a buscar, por ejemplo ``'Atl'``.
+
+        Returns:
+            list: Registros encontrados como diccionarios, ordenados por clave.
+        """
+        return [self._registro(clave) for clave in self.__claves_con_prefijo(prefijo)]
+
+    def filas_con_prefijo(self, prefijo):
+        """Filas crudas cuyo primer campo clave comienza con un prefijo.
+
+        Args:
+            prefijo (str): Prefijo a buscar.
+
+        Returns:
+            list: Valores de cada fila, en orden de clave.
+        """
+        filas = (self.fila(*clave) for clave in list(self.__claves_con_prefijo(prefijo)))
+        return [fila for fila in filas if fila is not None]
@@ -0,0 +1,212 @@
+import heapq
+import unicodedata
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from functools import lru_cache
+
+# Similitud mínima, entre 0 y 1, para que una palabra del índice cuente como
+# coincidencia aproximada de una palabra buscada.
+UMBRAL = 0.3
+
+
+def normalizar_texto(texto):
+    """Texto sin acentos, en minúsculas y con solo letras, dígitos y espacios.
+
+    Por ejemplo, "José Núñez-Peña" se convierte en "jose nunez pena".
+    """
+    descompuesto = unicodedata.normalize('NFKD', str(texto))
+    sin_acentos = "".join(caracter for caracter in descompuesto if not unicodedata.combining(caracter))
+    return "".join(caracter if caracter.isalnum() else " " for caracter in sin_acentos.casefold())
+
+
+@lru_cache(maxsize=65536)
+def palabras(texto):
+    """Palabras normalizadas de un texto, sin repetir y en orden de aparición.
+
+    Los nombres se repiten mucho entre registros, así que los resultados se
+    guardan en una caché acotada.
+
+    Returns:
+        tuple: Las palabras.
+    """
+    return tuple(dict.fromkeys(normalizar_texto(texto).split()))
+
+
+def trigramas(palabra):
+    """Trigramas de una palabra normalizada.
+
+    La palabra se rodea de espacios, dos al inicio y uno al final, para que
+    los trigramas del principio pesen más que los del final, como en
+    ``pg_trgm``: "ana" da "  a", " an", "ana" y "na ".
+    """
+    rodeada = f"  {palabra} "
+    return {rodeada[posicion:posicion + 3] for posicion in range(len(rodeada) - 2)}
+
+
+class IndiceDeTexto:
+    """Índice de trigramas para buscar registros por nombre aproximado.
+
+    Indexa las palabras de varias columnas de texto (por ejemplo, nombre y
+    apellidos) sin acentos ni mayúsculas. Como los nombres se repiten mucho,
+    el índice se organiza por palabras distintas: cada trigrama apunta a las
+    palabras que lo contienen y cada palabra a las filas donde aparece, en un
+    arreglo ordenado de números de fila (``array('q')``).
+
+    Una búsqueda compara cada palabra buscada con las palabras del índice
+    que comparten algún trigrama con ella, sin recorrer las filas; solo las
+    palabras suficientemente parecidas se expanden a sus filas. La similitud
+    de dos palabras es la proporción de trigramas comunes entre los trigramas
+    distintos de ambas (índice de Jaccard), y el puntaje de una fila es el
+    promedio, sobre las palabras buscadas, de la mejor similitud que alguna
+    de sus palabras alcanza.
+
+    Tiene la misma interfaz de mantenimiento que ``IndiceSecundario``;
+    ``IndicePrimario`` asigna los números de fila y lo mantiene al día.
+
+    Attributes:
+        campos (list): Columnas indexadas.
+        posiciones (list): Posición de cada columna en las filas.
+    """
+
+    campos = []
+    posiciones = []
+
+    def __init__(self, campos, posiciones):
+        self.campos = list(campos)
+        self.posiciones = list(posiciones)
+        self.__vaciar()
+
+    def __vaciar(self):
+        """Deja el índice sin palabras ni filas."""
+        self.__identificadores = {}
+        self.__tamanos = array('q')
+        self.__filas = []
+        self.__por_trigrama = {}
+
+    def __palabras_de(self, fila):
+        """Palabras distintas de las columnas indexadas de una fila."""
+        return set().union(*(palabras(fila[posicion]) for posicion in self.posiciones))
+
+    def __identificador(self, palabra):
+        """Identificador de una palabra, que se registra si es nueva."""
+        identificador = self.__identificadores.get(palabra)
+        if identificador is None:
+            identificador = self.__identificadores[palabra] = len(self.__filas)
+            tres = trigramas(palabra)
+            self.__tamanos.append(len(tres))
+            self.__filas.append(array('q'))
+            for trigrama in tres:
+                lista = self.__por_trigrama.get(trigrama)
+                if lista is None:
+                    lista = self.__por_trigrama[trigrama] = array('q')
+                lista.append(identificador)
+        return identificador
+
+    def construir(self, filas):
+        """Indexa de una vez todas las filas numeradas.
+
+        Args:
+            filas (iterable): Filas en orden; su posición es su número.
+        """
+        self.__vaciar()
+        agregar = self.agregar
+        for numero, fila in enumerate(filas):
+            agregar(numero, fila)
+
+    def agregar(self, numero, fila):
+        """Indexa una fila nueva."""
+        for palabra in self.__palabras_de(fila):
+            lista = self.__filas[self.__identificador(palabra)]
+            if not lista or lista[-1] < numero:
+                lista.append(numero)
+            else:
+                insort(lista, numero)
+
+    def __quitar_palabras(self, numero, quitadas):
+        """Quita una fila de las listas de las palabras indicadas."""
+        for palabra in quitadas:
+            identificador = self.__identificadores.get(palabra)
+            if identificador is None:
+                continue
+            lista = self.__filas[identificador]
+            posicion = bisect_left(lista, numero)
+            if posicion < len(lista) and lista[posicion] == numero:
+                del lista[posicion]
+
+    def quitar(self, numero, fila):
+        """Quita una fila del índice.
+
+        Las palabras que se quedan sin filas se conservan; solo ocupan su
+        entrada hasta la siguiente reconstrucción.
+        """
+        self.__quitar_palabras(numero, self.__palabras_de(fila))
+
+    def cambiar(self, numero, anterior, nueva):
+        """Reindexa una fila editada, si cambiaron las palabras de sus columnas.
+
+        Args:
+            numero (int): Número de la fila.
+            anterior (list): Valores de la fila antes de la edición.
+            nueva (list): Valores de la fila después de la edición.
+        """
+        if all(anterior[posicion] == nueva[posicion] for posicion in self.posiciones):
+            return
+        antes, despues = self.__palabras_de(anterior), self.__palabras_de(nueva)
+        self.__quitar_palabras(numero, antes - despues)
+        for palabra in despues - antes:
+            insort(self.__filas[self.__identificador(palabra)], numero)
+
+    def __parecidas(self, buscada, umbral):
+        """Palabras del índice parecidas a una palabra buscada.
+
+        Returns:
+            dict: Identificador de palabra -> similitud, para las que
+            alcanzan el umbral.
+        """
+        tres = trigramas(buscada)
+        comunes = Counter()
+        for trigrama in tres:
+            lista = self.__por_trigrama.get(trigrama)
+            if lista is not None:
+                comunes.update(lista)
+        tamano, tamanos = len(tres), self.__tamanos
+        parecidas = {}
+        for identificador, cuenta in comunes.items():
+            valor = cuenta / (tamano + tamanos[identificador] - cuenta)
+            if valor >= umbral:
+                parecidas[identificador] = valor
+        return parecidas
+
+    def buscar(self, texto, limite=10, umbral=UMBRAL):
+        """Filas cuyas palabras se parecen más al texto buscado.
+
+        Args:
+            texto (str): Nombre aproximado; puede tener varias palabras.
+            limite (int): Número máximo de filas; None para todas las que
+                alcanzan el umbral.
+            umbral (float): Similitud mínima de una palabra para contar.
+
+        Returns:
+            list: Pares (número de fila, puntaje entre 0 y 1), del puntaje
+            más alto al más bajo y, a igual puntaje, en el orden del archivo.
+        """
+        buscadas = palabras(texto)
+        if not buscadas:
+            return []
+        puntajes = Counter()
+        for buscada in buscadas:
+            mejores = {}
+            # De la palabra más parecida a la menos, para que cada fila se
+            # quede con la primera (la mejor) similitud que la alcanza.
+            parecidas = sorted(self.__parecidas(buscada, umbral).items(), key=lambda par: -par[1])
+            for identificador, valor in parecidas:
+                for numero in self.__filas[identificador]:
+                    if numero not in mejores:
+                        mejores[numero] = valor
+            puntajes.update(mejores)
+        total = len(buscadas)
+        pares = ((numero, puntaje / total) for numero, puntaje in puntajes.items())
+        if limite is None:
+            return sorted(pares, key=lambda par: (-par[1], par[0]))
+        return heapq.nsmallest(limite, pares, key=lambda par: (-par[1], par[0]))
@@ -0,0 +1,785 @@
+import csv
+import gc
+import os
+import threading
+from contextlib import contextmanager
+
+from Consulta import fecha
+from IndiceDeFechas import OPERADORES as OPERADORES_DE_FECHA, IndiceDeFechas, ordinal
+from IndiceDeTexto import UMBRAL, IndiceDeTexto
+from IndiceSecundario import IndiceSecundario, intersecar, unir
+from InstantaneaColumnar import InstantaneaColumnar, codificar
+from Instrumentacion import METRICAS, instrumentar
+
+
+@contextmanager
+def sin_recolector():
+    """Suspende el recolector de ciclos mientras se crean muchas filas.
+
+    Las filas del índice son listas de texto que no forman ciclos, pero
+    crear un millón de ellas dispara decenas de recolecciones completas.
+    """
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
+
+
+class _FilasDeInstantanea:
+    """Filas del índice cargadas desde una instantánea columnar.
+
+    Se usa como el diccionario clave -> fila del índice, pero guarda las
+    columnas de la instantánea y arma la lista de una fila solo cuando se
+    pide. Una fila pedida por clave se conserva, para que las ediciones que
+    el índice hace sobre ella persistan; los recorridos completos arman cada
+    fila al vuelo sin conservarla.
+    """
+
+    def __init__(self, claves, columnas):
+        """Prepara las filas a partir de las claves y las columnas, en el mismo orden."""
+        self.__columnas = columnas
+        self.__numeros = dict(zip(claves, range(len(claves))))
+        self.__armadas = {}
+        self.__siguiente = len(claves)
+
+    def __armar(self, numero):
+        fila = self.__armadas.get(numero)
+        if fila is None:
+            fila = [columna[numero] for columna in self.__columnas]
+        return fila
+
+    def get(self, clave, defecto=None):
+        numero = self.__numeros.get(clave)
+        if numero is None:
+            return defecto
+        fila = self.__armadas.get(numero)
+        if fila is None:
+            fila = self.__armadas[numero] = [columna[numero] for columna in self.__columnas]
+        return fila
+
+    def __getitem__(self, clave):
+        fila = self.get(clave)
+        if fila is None:
+            raise KeyError(clave)
+        return fila
+
+    def __setitem__(self, clave, fila):
+        numero = self.__numeros.get(clave)
+        if numero is None:
+            numero = self.__numeros[clave] = self.__siguiente
+            self.__siguiente += 1
+        self.__armadas[numero] = fila
+
+    def pop(self, clave, defecto=None):
+        if clave not in self.__numeros:
+            return defecto
+        numero = self.__numeros.pop(clave)
+        fila = self.__armadas.pop(numero, None)
+        return fila if fila is not None else [columna[numero] for columna in self.__columnas]
+
+    def __contains__(self, clave):
+        return clave in self.__numeros
+
+    def __iter__(self):
+        return iter(self.__numeros)
+
+    def __len__(self):
+        return len(self.__numeros)
+
+    def values(self):
+        # Los números y las filas ya armadas se copian al llamar, para que el
+        # recorrido no cambie si se agregan o eliminan filas mientras tanto.
+        return self.__recorrer(list(self.__numeros.values()), dict(self.__armadas))
+
+    def __recorrer(self, numeros, armadas):
+        columnas = self.__columnas
+        for numero in numeros:
+            fila = armadas.get(numero)
+            yield [columna[numero] for columna in columnas] if fila is None else fila
+
+    def items(self):
+        return ((clave, self.__armar(numero)) for clave, numero in self.__numeros.items())
+
+
+class IndicePrimario:
+    """Índice en memoria que asocia la clave de cada registro con su fila.
+
+    El índice se construye una sola vez a partir del archivo CSV y se mantiene
+    actualizado con cada alta, edición o baja, de modo que verificar si un
+    registro existe o consultarlo no requiere volver a leer el archivo.
+    Antes de cada operación se compara la firma del archivo (inodo, fecha de
+    modificación y tamaño); si el archivo cambió por fuera de la entidad,
+    el índice se reconstruye. Si la entidad usa una bitácora de cambios, el
+    índice refleja el CSV base con la bitácora ya aplicada.
+
+    Si se indica una ruta de instantánea, el índice se carga desde la
+    instantánea columnar cuando esta corresponde a la firma actual, sin
+    analizar el CSV y sin armar la lista de cada fila hasta que se usa. Cuando hay que analizar el CSV y el archivo tiene al
+    menos ``FILAS_PARA_INSTANTANEA`` registros, la instantánea se regenera
+    para que el siguiente arranque sea rápido.
+
+    Las columnas declaradas como secundarias (de pocos valores distintos,
+    como la nacionalidad) tienen además un ``IndiceSecundario`` que asocia
+    cada valor con los números de las filas que lo tienen. Esos índices se
+    construyen la primera vez que una búsqueda los usa y desde entonces se
+    mantienen con cada alta, edición y baja. Las columnas de fecha tienen
+    un ``IndiceDeFechas`` ordenado, que resuelve rangos de fechas y recorre
+    las filas en orden de fecha sin ordenarlas en cada consulta. Las
+    columnas de texto, como el nombre, comparten un ``IndiceDeTexto`` de
+    trigramas para las búsquedas aproximadas, que se construye aparte la
+    primera vez que se busca por texto.
+
+    Varios hilos pueden leer a la vez mientras tienen el bloqueo compartido
+    del almacenamiento; las altas, ediciones y bajas se hacen con el bloqueo
+    exclusivo. Lo que una lectura construye o reconstruye (el índice tras un
+    cambio externo y los índices auxiliares) se prepara con un candado propio
+    y se publica al terminar, para que las demás lecturas nunca vean una
+    estructura a medio construir.
+
+    Attributes:
+        archivo (str): Ruta al archivo CSV indexado.
+        campos_clave (list): Columnas que forman la clave de cada registro.
+        encabezados (list): Encabezados leídos del archivo CSV.
+        campos_secundarios (list): Columnas con índice secundario.
+        campos_de_fecha (list): Columnas con índice de fechas.
+        campos_de_texto (list): Columnas con índice de trigramas.
+    """
+
+    FILAS_PARA_INSTANTANEA = 10000
+
+    archivo = ""
+    campos_clave = []
+    encabezados = []
+    campos_secundarios = []
+    campos_de_fecha = []
+    campos_de_texto = []
+
+    def __init__(self, archivo, campos_clave, normalizar=None, bitacora=None, instantanea=None, secundarios=(),
+                 fechas=(), texto=()):
+        """Inicializa el índice y lo construye a partir del archivo.
+
+        Args:
+            archivo (str): Ruta al archivo CSV a indexar.
+            campos_clave (list): Columnas que forman la clave. Si es una sola
+                columna la clave es su valor; si son varias, una tupla.
+            normalizar (callable): Función opcional que se aplica a cada valor
+                de la clave, por ejemplo ``str.casefold``.
+            bitacora (BitacoraDeCambios): Bitácora opcional cuyos cambios se
+                aplican sobre el contenido del archivo.
+            instantanea (str): Ruta opcional de la instantánea columnar.
+            secundarios (list): Columnas que tienen índice secundario.
+            fechas (list): Columnas de fechas YYYY-MM-DD que tienen índice ordenado.
+            texto (list): Columnas de texto que comparten el índice de trigramas.
+        """
+        self.archivo = archivo
+        self.__bitacora = bitacora
+        self.__instantanea = instantanea
+        self.campos_clave = list(campos_clave)
+        self.encabezados = []
+        self.__normalizar = normalizar
+        self.__posiciones = []
+        self.__filas = {}
+        self.__firma = None
+        self.campos_secundarios = list(secundarios)
+        self.campos_de_fecha = list(fechas)
+        self.campos_de_texto = list(texto)
+        self.__secundarios = None
+        self.__texto = None
+        self.__indices = []
+        self.__numeros = {}
+        self.__claves = []
+        self._candado = threading.RLock()
+        self.reconstruir()
+
+    @staticmethod
+    def __firma_de(ruta):
+        """Obtiene la firma (inodo, fecha de modificación, tamaño) de un archivo.
+
+        Returns:
+            tuple: Firma del archivo, o None si el archivo no existe.
+        """
+        try:
+            estado = os.stat(ruta)
+        except OSError:
+            return None
+        return (estado.st_ino, estado.st_mtime_ns, estado.st_size)
+
+    def __firma_actual(self):
+        """Obtiene la firma del archivo y, si la hay, de su bitácora.
+
+        Returns:
+            tuple: Firma combinada, o None si el archivo no existe.
+        """
+        firma = self.__firma_de(self.archivo)
+        if firma is None or self.__bitacora is None:
+            return firma
+        return firma + (self.__firma_de(self.__bitacora.archivo),)
+
+    def _reiniciar(self):
+        """Limpia las estructuras auxiliares antes de una reconstrucción."""
+        pass
+
+    def _al_insertar(self, clave):
+        """Se invoca cuando una clave nueva entra al índice."""
+        pass
+
+    def _al_eliminar(self, clave):
+        """Se invoca cuando una clave sale del índice."""
+        pass
+
+    @instrumentar("IndicePrimario.reconstruir")
+    def reconstruir(self):
+        """Lee el archivo completo y vuelve a construir el índice.
+
+        Mientras se reconstruye la firma registrada no coincide con la del
+        archivo, así que las lecturas de otros hilos esperan en
+        ``asegurar_vigente`` a que termine.
+        """
+        with self._candado:
+            # False no coincide con ninguna firma, ni con la de un archivo que no existe.
+            self.__firma = False
+            firma = self.__firma_actual()
+            try:
+                self.__reconstruir(firma)
+            finally:
+                self.__firma = firma
+
+    def __reconstruir(self, firma):
+        """Vuelve a construir el índice a partir de la instantánea o del archivo con la firma dada."""
+        self.__filas = {}
+        self.encabezados = []
+        self.__posiciones = []
+        self.__descartar_secundarios()
+        self._reiniciar()
+        if firma is None:
+            return
+        with sin_recolector():
+            if self.__cargar_instantanea(firma) or not self.__leer_archivo():
+                return
+            if self.__instantanea is not None and len(self.__filas) >= self.FILAS_PARA_INSTANTANEA:
+                try:
+                    self.__guardar_instantanea(firma)
+                except (OSError, ValueError):
+                    # La instantánea solo acelera el arranque; sin ella el
+                    # índice sigue siendo válido.
+                    pass
+
+    def __leer_archivo(self):
+        """Construye el índice a partir del CSV y de la bitácora.
+
+        Returns:
+            bool: False si el archivo no tiene las columnas clave.
+        """
+        with open(self.archivo, mode='r', newline='') as file:
+            reader = csv.reader(file)
+            self.encabezados = next(reader, [])
+            if not all(campo in self.encabezados for campo in self.campos_clave):
+                return False
+            self.__posiciones = [self.encabezados.index(campo) for campo in self.campos_clave]
+            for fila in reader:
+                if fila:
+                    self.__insertar(fila)
+            METRICAS.sumar('filas_examinadas', reader.line_num)
+            METRICAS.sumar('bytes_leidos', os.fstat(file.fileno()).st_size)
+        if self.__bitacora is not None:
+            self.__aplicar_bitacora()
+        return True
+
+    def __cargar_instantanea(self, firma):
+        """Carga el índice desde la instantánea si corresponde a la firma dada.
+
+        La instantánea ya incluye los cambios de la bitácora que refleja su
+        firma, por lo que no se vuelven a aplicar.
+
+        Returns:
+            bool: True si el índice se cargó desde la instantánea.
+        """
+        if self.__instantanea is None:
+            return False
+        instantanea = InstantaneaColumnar.abrir(self.__instantanea, repr(firma))
+        if instantanea is None or not all(campo in instantanea.encabezados for campo in self.campos_clave):
+            return False
+        self.encabezados = list(instantanea.encabezados)
+        self.__posiciones = [self.encabezados.index(campo) for campo in self.campos_clave]
+        # Las claves se calculan columna por columna; la instantánea se generó
+        # desde el índice, así que no tiene claves repetidas.
+        columnas = [instantanea.columna(campo).valores() for campo in self.encabezados]
+        claves = [columnas[posicion] for posicion in self.__posiciones]
+        if self.__normalizar is not None:
+            claves = [list(map(self.__normalizar, columna)) for columna in claves]
+        claves = claves[0] if len(claves) == 1 else list(zip(*claves))
+        self.__filas = _FilasDeInstantanea(claves, columnas)
+        for clave in claves:
+            self._al_insertar(clave)
+        return True
+
+    def __guardar_instantanea(self, firma):
+        """Escribe la instantánea con el contenido actual del índice y la firma dada."""
+        return InstantaneaColumnar.escribir(self.__instantanea, self.encabezados, self.__filas.values(),
+                                            repr(firma))
+
+    def instantanea(self):
+        """Obtiene una instantánea columnar con el contenido actual del índice.
+
+        Si el índice tiene ruta de instantánea, se reutiliza la del archivo
+        cuando corresponde a la firma actual y, si no, se regenera. Sin ruta,
+        la instantánea se construye en memoria.
+
+        Returns:
+            InstantaneaColumnar: Instantánea del contenido actual.
+
+        Raises:
+            ValueError: Si alguna fila no tiene tantos valores como encabezados.
+        """
+        self.asegurar_vigente()
+        if self.__instantanea is None:
+            return InstantaneaColumnar(codificar(self.encabezados, self.__filas.values()))
+        firma = self.__firma
+        instantanea = InstantaneaColumnar.abrir(self.__instantanea, repr(firma))
+        if instantanea is None:
+            with self._candado, sin_recolector():
+                instantanea = self.__guardar_instantanea(firma)
+        return instantanea
+
+    def __aplicar_bitacora(self):
+        """Aplica en orden las entradas de la bitácora sobre el índice."""
+        for entrada in self.__bitacora.entradas():
+            operacion = entrada.get('op')
+            if operacion == 'agregar':
+                self.__insertar(entrada['fila'])
+            elif operacion == 'editar':
+                for campo, valor in entrada['campos'].items():
+                    self.actualizar(campo, valor, *entrada['clave'])
+            elif operacion == 'eliminar':
+                self.eliminar(*entrada['clave'])
+
+    def vigente(self):
+        """Indica si el índice corresponde al contenido actual del archivo.
+
+        Returns:
+            bool: True si la firma del archivo no ha cambiado.
+        """
+        return self.__firma == self.__firma_actual()
+
+    def asegurar_vigente(self):
+        """Reconstruye el índice si el archivo cambió desde la última lectura.
+
+        Si otro hilo ya lo está reconstruyendo, espera a que termine.
+        """
+        if not self.vigente():
+            with self._candado:
+                if not self.vigente():
+                    self.reconstruir()
+
+    def firma(self):
+        """Firma vigente del archivo indexado; cambia con cada modificación.
+
+        Returns:
+            tuple: Firma del archivo y de su bitácora.
+        """
+        self.asegurar_vigente()
+        return self.__firma
+
+    def sincronizar(self):
+        """Registra la firma actual del archivo tras una escritura propia.
+
+        Debe llamarse después de que la entidad escribió en el archivo y
+        actualizó el índice, para que esa escritura no provoque una
+        reconstrucción innecesaria.
+        """
+        self.__firma = self.__firma_actual()
+
+    def clave_de(self, valores):
+        """Calcula la clave normalizada a partir de los valores de la clave.
+
+        Args:
+            valores (list): Valores de las columnas clave, en orden.
+
+        Returns:
+            str | tuple: Clave tal como se almacena en el índice.
+        """
+        if self.__normalizar is not None:
+            valores = [self.__normalizar(str(valor)) for valor in valores]
+        else:
+            valores = [str(valor) for valor in valores]
+        if len(valores) == 1:
+            return valores[0]
+        return tuple(valores)
+
+    def clave_de_fila(self, fila):
+        """Calcula la clave de una fila completa del archivo.
+
+        Args:
+            fila (list): Valores de la fila en el orden de los encabezados.
+
+        Returns:
+            str | tuple: Clave de la fila.
+        """
+        return self.clave_de([fila[posicion] for posicion in self.__posiciones])
+
+    def __insertar(self, fila):
+        """Inserta una fila si su clave aún no está en el índice.
+
+        Si el archivo contiene claves repetidas se conserva la primera
+        aparición, igual que una búsqueda secuencial.
+        """
+        clave = self.clave_de_fila(fila)
+        if clave not in self.__filas:
+            self.__filas[clave] = fila
+            self._al_insertar(clave)
+            if self.__secundarios is not None:
+                numero = self.__numeros[clave] = len(self.__claves)
+                self.__claves.append(clave)
+                for indice in self.__indices:
+                    indice.agregar(numero, fila)
+
+    def __construir_secundarios(self):
+        """Construye los índices secundarios si todavía no existen.
+
+        Las filas se numeran en el orden del índice, así que recorrer los
+        números en orden equivale a recorrer el archivo. Los índices se
+        publican cuando están completos.
+
+        Returns:
+            dict: Columna -> índice secundario o de fechas.
+        """
+        secundarios = self.__secundarios
+        if secundarios is not None:
+            return secundarios
+        with self._candado:
+            if self.__secundarios is not None:
+                return self.__secundarios
+            secundarios = {}
+            for campo in self.campos_secundarios:
+                if campo in self.encabezados:
+                    normalizar = self.__normalizar if campo in self.campos_clave else None
+                    secundarios[campo] = IndiceSecundario(campo, self.encabezados.index(campo), normalizar)
+            for campo in self.campos_de_fecha:
+                if campo in self.encabezados:
+                    secundarios[campo] = IndiceDeFechas(campo, self.encabezados.index(campo))
+            for indice in secundarios.values():
+                indice.construir(self.__filas.values())
+            self.__claves = list(self.__filas)
+            self.__numeros = {clave: numero for numero, clave in enumerate(self.__claves)}
+            self.__indices = list(secundarios.values())
+            self.__secundarios = secundarios
+            return secundarios
+
+    def conteos(self, campo):
+        """Número de filas por cada valor de una columna con índice secundario.
+
+        Args:
+            campo (str): Columna a contar.
+
+        Returns:
+            dict: Valor -> número de filas, o None si la columna no tiene
+            índice secundario o es parte de la clave (su índice guarda los
+            valores normalizados).
+        """
+        self.asegurar_vigente()
+        if campo not in self.campos_secundarios or campo not in self.encabezados or campo in self.campos_clave:
+            return None
+        return self.__construir_secundarios()[campo].conteos()
+
+    def __descartar_secundarios(self):
+        """Descarta los índices secundarios y de texto; se reconstruyen en el siguiente uso."""
+        self.__secundarios = None
+        self.__texto = None
+        self.__indices = []
+
+    def buscar_texto(self, texto, limite=10, umbral=UMBRAL):
+        """Filas cuyas columnas de texto se parecen más a un texto buscado.
+
+        Args:
+            texto (str): Texto aproximado, sin importar acentos ni mayúsculas.
+            limite (int): Número máximo de filas; None para todas.
+            umbral (float): Similitud mínima de cada palabra, entre 0 y 1.
+
+        Returns:
+            list: Pares (fila, puntaje) del más parecido al menos parecido,
+            o None si el índice no tiene columnas de texto.
+        """
+        self.asegurar_vigente()
+        campos = [campo for campo in self.campos_de_texto if campo in self.encabezados]
+        if not campos:
+            return None
+        self.__construir_secundarios()
+        indice = self.__texto
+        if indice is None:
+            with self._candado:
+                indice = self.__texto
+                if indice is None:
+                    indice = IndiceDeTexto(campos, [self.encabezados.index(campo) for campo in campos])
+                    indice.construir(self.__filas.values())
+                    self.__indices.append(indice)
+                    self.__texto = indice
+        return [(self.__filas[self.__claves[numero]], puntaje)
+                for numero, puntaje in indice.buscar(texto, limite, umbral)]
+
+    def __resoluble(self, condicion):
+        """Indica si un índice secundario o de fechas puede resolver una condición."""
+        if condicion.campo in self.campos_de_fecha:
+            return (condicion.campo in self.encabezados and condicion.convertir is fecha
+                    and condicion.operador in OPERADORES_DE_FECHA)
+        if condicion.campo not in self.campos_secundarios or condicion.operador not in ('=', 'en'):
+            return False
+        normalizar = self.__normalizar if condicion.campo in self.campos_clave else None
+        return condicion.campo in self.encabezados and condicion.convertir in (None, normalizar)
+
+    def filas_por_secundarios(self, consulta, completas=False):
+        """Filas de una consulta según los índices secundarios.
+
+        Cada alternativa de la consulta se resuelve intersecando las listas
+        de filas de sus condiciones de igualdad ('=' o 'en') sobre columnas
+        indexadas y de sus rangos sobre columnas de fecha indexadas, y las
+        alternativas se unen. Las filas devueltas cumplen
+        esas condiciones pero no necesariamente las demás, que quien llama
+        debe seguir evaluando.
+
+        Args:
+            consulta (Consulta): Consulta ya compilada.
+            completas (bool): Si es True, solo se responde cuando los índices
+                resuelven todas las condiciones, de modo que las filas
+                devueltas son exactamente las que cumplen la consulta.
+
+        Returns:
+            list: Filas en el orden del archivo, o None si los índices no
+            pueden resolver la consulta.
+        """
+        self.asegurar_vigente()
+        usables = []
+        for condiciones in consulta.alternativas:
+            resolubles = [condicion for condicion in condiciones if self.__resoluble(condicion)]
+            if not resolubles or (completas and len(resolubles) < len(condiciones)):
+                return None
+            usables.append(resolubles)
+        secundarios = self.__construir_secundarios()
+        alternativas = []
+        for condiciones in usables:
+            listas = [secundarios[condicion.campo].numeros_de(condicion) for condicion in condiciones]
+            alternativas.append(intersecar(listas))
+        return [self.__filas[self.__claves[numero]] for numero in unir(alternativas)]
+
+    def filas_ordenadas(self, consulta, campo, descendente=False, limite=None):
+        """Filas que cumplen una consulta, ordenadas por una columna de fecha.
+
+        Si los demás índices reducen la consulta a pocas filas, se ordenan
+        esas; si no, se recorre el índice de fechas en orden (acotado por el
+        rango de fechas de la consulta, si lo tiene) hasta reunir ``limite``
+        filas. A igualdad de fecha se respeta el orden del archivo.
+
+        Args:
+            consulta (Consulta): Consulta ya compilada.
+            campo (str): Columna de fecha por la que se ordena.
+            descendente (bool): Si es True, de la fecha más reciente a la más antigua.
+            limite (int): Número máximo de filas; por omisión, todas.
+
+        Returns:
+            list: Filas ordenadas, o None si la columna no tiene índice de fechas.
+        """
+        self.asegurar_vigente()
+        if campo not in self.campos_de_fecha or campo not in self.encabezados:
+            return None
+        indice = self.__construir_secundarios()[campo]
+        desde = hasta = None
+        for condicion in consulta.condiciones:
+            if condicion.campo == campo and self.__resoluble(condicion):
+                desde, hasta = indice.limites(condicion)
+
+        candidatas = self.filas_por_secundarios(consulta)
+        if candidatas is not None:
+            # Filas que habría que examinar recorriendo el índice, suponiendo
+            # las candidatas repartidas de forma pareja entre las fechas.
+            tramo = indice.contar(desde, hasta)
+            recorrido = tramo if limite is None else min(tramo, limite * tramo // max(1, len(candidatas)))
+            if len(candidatas) < recorrido:
+                METRICAS.sumar('filas_examinadas', len(candidatas))
+                posicion = indice.posicion
+                aceptadas = [fila for fila in candidatas
+                             if ordinal(fila[posicion]) is not None and consulta.acepta(fila)]
+                aceptadas.sort(key=lambda fila: ordinal(fila[posicion]), reverse=descendente)
+                return aceptadas if limite is None else aceptadas[:limite]
+        return self.__recorrer_por_fecha(indice, consulta, desde, hasta, descendente, limite)
+
+    def __recorrer_por_fecha(self, indice, consulta, desde, hasta, descendente, limite):
+        """Recorre el índice de fechas reuniendo las filas que cumplen la consulta."""
+        encontradas = []
+        examinadas = 0
+        with self._candado:
+            for numero in indice.recorrer(desde, hasta, descendente):
+                fila = self.__filas[self.__claves[numero]]
+                examinadas += 1
+                if consulta.acepta(fila):
+                    encontradas.append(fila)
+                    if len(encontradas) == limite:
+                        break
+        METRICAS.sumar('filas_examinadas', examinadas)
+        return encontradas
+
+    def contiene(self, *valores):
+        """Verifica si existe un registro con la clave indicada.
+
+        Args:
+            *valores: Valores de las columnas clave.
+
+        Returns:
+            bool: True si el registro existe.
+        """
+        self.asegurar_vigente()
+        return self.clave_de(valores) in self.__filas
+
+    def contiene_clave(self, clave):
+        """Verifica si una clave ya normalizada está en el índice.
+
+        A diferencia de ``contiene``, no revisa la firma del archivo; está
+        pensado para cargas masivas que ya aseguraron que el índice está
+        vigente y lo actualizan ellas mismas.
+
+        Args:
+            clave (str | tuple): Clave obtenida con ``clave_de``.
+
+        Returns:
+            bool: True si la clave está en el índice.
+        """
+        return clave in self.__filas
+
+    def obtener(self, *valores):
+        """Obtiene un registro como diccionario a partir de su clave.
+
+        Args:
+            *valores: Valores de las columnas clave.
+
+        Returns:
+            dict: Registro encontrado, o None si no existe.
+        """
+        self.asegurar_vigente()
+        return self._registro(self.clave_de(valores))
+
+    def fila(self, *valores):
+        """Obtiene la fila cruda de un registro a partir de su clave.
+
+        Args:
+            *valores: Valores de las columnas clave.
+
+        Returns:
+            list: Valores del registro en el orden de los encabezados, o None.
+        """
+        self.asegurar_vigente()
+        return self.__filas.get(self.clave_de(valores))
+
+    def _registro(self, clave):
+        """Obtiene como diccionario el registro con una clave ya normalizada."""
+        fila = self.__filas.get(clave)
+        if fila is None:
+            return None
+        return dict(zip(self.encabezados, fila))
+
+    def filas(self):
+        """Filas indexadas en el orden en que entraron al índice.
+
+        Las filas se toman de una vez, así que quien las recorre puede
+        agregar, editar o eliminar registros sin alterar el recorrido. Con
+        filas cargadas de una instantánea solo se copian sus números y cada
+        fila se arma al recorrerla.
+
+        Returns:
+            Iterable: Valores de cada fila en el orden de los encabezados.
+        """
+        self.asegurar_vigente()
+        with self._candado:
+            if isinstance(self.__filas, _FilasDeInstantanea):
+                return self.__filas.values()
+            return list(self.__filas.values())
+
+    def agregar(self, datos):
+        """Agrega al índice una fila recién escrita en el archivo.
+
+        Args:
+            datos (list): Valores de la fila en el orden de los encabezados.
+        """
+        self.__insertar([str(dato) for dato in datos])
+
+    def actualizar(self, campo, valor, *valores):
+        """Actualiza un campo de un registro ya indexado.
+
+        Args:
+            campo (str): Columna a modificar.
+            valor (str): Nuevo valor de la columna.
+            *valores: Valores de las columnas clave del registro.
+        """
+        clave = self.clave_de(valores)
+        anterior = self.__filas.get(clave)
+        if anterior is not None and campo in self.encabezados:
+            # La fila se reemplaza por una copia editada en lugar de cambiarse
+            # en su lugar, para que quien ya la obtuvo no la vea cambiar.
+            fila = list(anterior)
+            fila[self.encabezados.index(campo)] = str(valor)
+            self.__filas[clave] = fila
+            if self.__secundarios is not None:
+                numero = self.__numeros[clave]
+                for indice in self.__indices:
+                    indice.cambiar(numero, anterior, fila)
+
+    def eliminar(self, *valores):
+        """Elimina un registro del índice.
+
+        Args:
+            *valores: Valores de las columnas clave del registro.
+        """
+        clave = self.clave_de(valores)
+        fila = self.__filas.pop(clave, None)
+        if fila is not None:
+            self._al_eliminar(clave)
+            if self.__secundarios is not None:
+                numero = self.__numeros.pop(clave)
+                self.__claves[numero] = None
+                for indice in self.__indices:
+                    indice.quitar(numero, fila)
+                # Los números de las filas eliminadas no se reutilizan; si ya
+                # son la mayoría, los índices se renumeran en el siguiente uso.
+                if len(self.__claves) > 2 * len(self.__filas) + 1024:
+                    self.__descartar_secundarios()
+
+    @instrumentar("IndicePrimario.exportar")
+    def exportar(self, destino):
+        """Escribe en un CSV nuevo el contenido actual del índice.
+
+        Los registros conservan el orden del archivo base y los registros
+        nuevos se escriben al final. Si el archivo base contiene claves
+        repetidas, solo se escribe la primera aparición.
+
+        Args:
+            destino (str): Ruta del archivo CSV a escribir.
+
+        Raises:
+            ValueError: Si el archivo no tiene las columnas clave.
+        """
+        self.asegurar_vigente()
+        if not self.__posiciones:
+            raise ValueError(f"El archivo {self.archivo} no tiene las columnas {self.campos_clave}")
+        escritas = set()
+        with open(destino, mode='w', newline='') as salida:
+            writer = csv.writer(salida)
+            writer.writerow(self.encabezados)
+            with open(self.archivo, mode='r', newline='') as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                for fila in reader:
+                    if not fila:
+                        continue
+                    clave = self.clave_de_fila(fila)
+                    if clave in self.__filas and clave not in escritas:
+                        writer.writerow(self.__filas[clave])
+                        escritas.add(clave)
+            for clave, fila in self.__filas.items():
+                if clave not in escritas:
+                    writer.writerow(fila)
+            METRICAS.sumar('filas_examinadas', len(self.__filas))
+            METRICAS.sumar('bytes_escritos', salida.tell())
+
+    def __len__(self):
+        self.asegurar_vigente()
+        return len(self.__filas)
@@ -0,0 +1,160 @@
+from array import array
+from bisect import bisect_left, insort
+
+# Una lista se recorre con búsquedas binarias en las demás, en lugar de
+# convertirlas en conjuntos, cuando es al menos este número de veces más corta.
+PROPORCION_PARA_BISECCION = 16
+
+
+def intersecar(listas):
+    """Intersección de varias listas ordenadas de números de fila.
+
+    Se parte de la lista más corta. Contra una lista mucho más larga cada
+    número se busca por bisección, para no recorrerla completa; contra una
+    de tamaño parecido se usa la intersección de conjuntos.
+
+    Args:
+        listas (list): Secuencias ordenadas y sin repetidos.
+
+    Returns:
+        list: Números presentes en todas las listas, ordenados.
+    """
+    if not listas:
+        return []
+    listas = sorted(listas, key=len)
+    resultado = list(listas[0])
+    for lista in listas[1:]:
+        if not resultado:
+            break
+        if len(resultado) * PROPORCION_PARA_BISECCION <= len(lista):
+            comunes = []
+            for numero in resultado:
+                posicion = bisect_left(lista, numero)
+                if posicion < len(lista) and lista[posicion] == numero:
+                    comunes.append(numero)
+            resultado = comunes
+        else:
+            resultado = sorted(set(resultado).intersection(lista))
+    return resultado
+
+
+def unir(listas):
+    """Unión de varias listas ordenadas de números de fila.
+
+    Returns:
+        list: Números presentes en alguna de las listas, ordenados.
+    """
+    if not listas:
+        return []
+    if len(listas) == 1:
+        return list(listas[0])
+    return sorted(set().union(*listas))
+
+
+class IndiceSecundario:
+    """Índice invertido de una columna: cada valor con las filas que lo tienen.
+
+    Pensado para columnas con pocos valores distintos, como la nacionalidad,
+    la disciplina o el género. Cada valor guarda un arreglo compacto y
+    ordenado de números de fila (``array('q')``); ``IndicePrimario`` asigna
+    esos números y mantiene el índice al día con cada alta, edición y baja.
+
+    Attributes:
+        campo (str): Columna indexada.
+        posicion (int): Posición de la columna en cada fila.
+        normalizar (callable): Función que se aplica a cada valor antes de
+            indexarlo, o None para indexar el texto tal cual.
+    """
+
+    campo = ""
+    posicion = 0
+    normalizar = None
+
+    def __init__(self, campo, posicion, normalizar=None):
+        self.campo = campo
+        self.posicion = posicion
+        self.normalizar = normalizar
+        self.__listas = {}
+
+    def valor(self, texto):
+        """Valor con el que se indexa un texto de la columna."""
+        return texto if self.normalizar is None else self.normalizar(texto)
+
+    def construir(self, filas):
+        """Indexa de una vez todas las filas numeradas.
+
+        Args:
+            filas (iterable): Filas en orden; su posición es su número.
+        """
+        self.__listas = {}
+        agregar = self.agregar
+        for numero, fila in enumerate(filas):
+            agregar(numero, fila)
+
+    def agregar(self, numero, fila):
+        """Indexa una fila nueva; su número debe ser mayor que los ya indexados."""
+        valor = self.valor(fila[self.posicion])
+        lista = self.__listas.get(valor)
+        if lista is None:
+            lista = self.__listas[valor] = array('q')
+        lista.append(numero)
+
+    def quitar(self, numero, fila):
+        """Quita una fila del índice."""
+        self.__quitar(numero, fila[self.posicion])
+
+    def __quitar(self, numero, texto):
+        """Quita una fila del valor ``texto``."""
+        valor = self.valor(texto)
+        lista = self.__listas.get(valor)
+        if lista is None:
+            return
+        posicion = bisect_left(lista, numero)
+        if posicion < len(lista) and lista[posicion] == numero:
+            del lista[posicion]
+            if not lista:
+                del self.__listas[valor]
+
+    def cambiar(self, numero, anterior, nueva):
+        """Reindexa una fila editada, si cambió el valor de su columna.
+
+        Args:
+            numero (int): Número de la fila.
+            anterior (list): Valores de la fila antes de la edición.
+            nueva (list): Valores de la fila después de la edición.
+        """
+        anterior, nuevo = anterior[self.posicion], nueva[self.posicion]
+        if self.valor(anterior) == self.valor(nuevo):
+            return
+        self.__quitar(numero, anterior)
+        lista = self.__listas.get(self.valor(nuevo))
+        if lista is None:
+            lista = self.__listas[self.valor(nuevo)] = array('q')
+        insort(lista, numero)
+
+    def numeros(self, valores):
+        """Números de fila con alguno de los valores indicados, ordenados.
+
+        Args:
+            valores (iterable): Textos a buscar.
+
+        Returns:
+            Sequence: Arreglo ordenado de números de fila.
+        """
+        listas = [self.__listas[valor] for valor in {self.valor(str(texto)) for texto in valores}
+                  if valor in self.__listas]
+        if len(listas) == 1:
+            return listas[0]
+        return unir(listas)
+
+    def numeros_de(self, condicion):
+        """Números de fila que cumplen una condición '=' o 'en', ordenados."""
+        return self.numeros([condicion.valor] if condicion.operador == '=' else condicion.valor)
+
+    def conteos(self):
+        """Número de filas por cada valor indexado.
+
+        Returns:
+            dict: Valor -> número de filas.
+        """
+        return {valor: len(lista) for valor, lista in self.__listas.items()}
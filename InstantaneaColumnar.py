@@ -0,0 +1,398 @@
+"""Instantánea binaria y columnar del contenido de una entidad.
+
+El formato guarda cada columna por separado, con la codificación que mejor
+le corresponde:
+
+- 'entero': enteros de 64 bits, para columnas como ID cuyo texto es el de un
+  entero sin ceros a la izquierda.
+- 'fecha': ordinales de ``datetime.date`` de 32 bits, para columnas con
+  fechas YYYY-MM-DD; el texto vacío se guarda como 0.
+- 'diccionario': códigos de 8 o 16 bits sobre un diccionario ordenado de
+  valores, para columnas de baja cardinalidad como Nacionalidad, Genero,
+  Disciplina o Categoria. Como el diccionario está ordenado, el orden de
+  los códigos es el orden del texto.
+- 'texto': desplazamientos de 64 bits sobre un bloque de texto UTF-8, para
+  el resto.
+
+El archivo empieza con ``MAGIA``, la longitud de los metadatos (JSON) y los
+metadatos; después vienen los bloques de cada columna alineados a 8 bytes.
+Los metadatos incluyen la firma del CSV (inodo, fecha de modificación y
+tamaño) a partir del cual se generó la instantánea, para descartarla en
+cuanto el CSV cambie. La instantánea se abre con ``mmap`` y las columnas
+numéricas son vistas de memoria sobre el archivo, por lo que recorrer una
+columna no crea un diccionario ni una lista por registro.
+
+Uso:
+    python InstantaneaColumnar.py
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from itertools import accumulate
+from operator import eq
+
+from ReescrituraCSV import crear_temporal
+
+MAGIA = b"COL1"
+CABECERA = struct.Struct("<4sI")
+ALINEACION = 8
+
+# Una columna se codifica con diccionario si tiene a lo más esta cantidad de
+# valores distintos y estos son como máximo la mitad de sus filas.
+MAXIMO_DICCIONARIO = 65535
+
+
+def alinear(posicion):
+    """Redondea una posición al siguiente múltiplo de ``ALINEACION``."""
+    return -(-posicion // ALINEACION) * ALINEACION
+
+
+def codificar_enteros(valores):
+    """Codifica una columna como enteros si su texto se conserva exacto.
+
+    Returns:
+        array: Enteros de 64 bits, o None si algún valor no es un entero canónico.
+    """
+    try:
+        enteros = array('q', map(int, valores))
+    except (ValueError, OverflowError):
+        return None
+    if not all(map(eq, map(str, enteros), valores)):
+        return None
+    return enteros
+
+
+def codificar_fechas(valores, distintos):
+    """Codifica una columna de fechas YYYY-MM-DD como ordinales.
+
+    Returns:
+        array: Ordinales de 32 bits (0 para el texto vacío), o None si algún
+        valor no es una fecha canónica.
+    """
+    ordinales = {"": 0}
+    for valor in distintos:
+        if valor == "":
+            continue
+        try:
+            fecha = date.fromisoformat(valor)
+        except ValueError:
+            return None
+        if fecha.isoformat() != valor:
+            return None
+        ordinales[valor] = fecha.toordinal()
+    return array('i', map(ordinales.__getitem__, valores))
+
+
+def codificar_columna(valores):
+    """Elige la codificación de una columna y la aplica.
+
+    Args:
+        valores (tuple): Texto de la columna en cada fila.
+
+    Returns:
+        tuple: (metadatos, bloques) con los metadatos de la columna y la
+        lista de bloques binarios que la forman.
+    """
+    distintos = set(valores)
+    if valores and "" not in distintos:
+        enteros = codificar_enteros(valores)
+        if enteros is not None:
+            return {'tipo': 'entero'}, [enteros]
+    if valores and len(distintos - {""}) > 0:
+        ordinales = codificar_fechas(valores, distintos)
+        if ordinales is not None:
+            return {'tipo': 'fecha'}, [ordinales]
+    if len(distintos) <= MAXIMO_DICCIONARIO and len(distintos) * 2 <= len(valores):
+        diccionario = sorted(distintos)
+        posiciones = {valor: codigo for codigo, valor in enumerate(diccionario)}
+        codigos = array('B' if len(diccionario) <= 256 else 'H', map(posiciones.__getitem__, valores))
+        return {'tipo': 'diccionario', 'diccionario': diccionario}, [codigos]
+    textos = list(map(str.encode, valores))
+    desplazamientos = array('Q', accumulate(map(len, textos), initial=0))
+    return {'tipo': 'texto'}, [desplazamientos, b"".join(textos)]
+
+
+def codificar(encabezados, filas, firma=None):
+    """Genera el contenido binario de una instantánea.
+
+    Args:
+        encabezados (list): Columnas de las filas, en orden.
+        filas (iterable): Filas con los valores en el orden de ``encabezados``.
+        firma (str): Firma del origen de los datos, para validarla al abrir.
+
+    Returns:
+        bytes: Contenido de la instantánea.
+
+    Raises:
+        ValueError: Si alguna fila no tiene tantos valores como encabezados.
+    """
+    encabezados = list(encabezados)
+    filas = list(filas)
+    if any(len(fila) != len(encabezados) for fila in filas):
+        raise ValueError("Todas las filas deben tener un valor por encabezado.")
+    columnas = list(zip(*filas)) or [()] * len(encabezados)
+    total = len(filas)
+
+    metadatos = []
+    bloques = []
+    posicion = 0
+    for valores in columnas:
+        datos, partes = codificar_columna(valores)
+        datos['bloques'] = []
+        for parte in partes:
+            contenido = parte.tobytes() if isinstance(parte, array) else parte
+            formato = parte.typecode if isinstance(parte, array) else 'B'
+            posicion = alinear(posicion)
+            datos['bloques'].append([formato, posicion, posicion + len(contenido)])
+            bloques.append((posicion, contenido))
+            posicion += len(contenido)
+        metadatos.append(datos)
+
+    cabecera = json.dumps({
+        'firma': firma,
+        'orden': sys.byteorder,
+        'total': total,
+        'encabezados': encabezados,
+        'columnas': metadatos,
+    }, ensure_ascii=False).encode('utf-8')
+    inicio = alinear(CABECERA.size + len(cabecera))
+    contenido = bytearray(inicio + posicion)
+    contenido[:CABECERA.size + len(cabecera)] = CABECERA.pack(MAGIA, len(cabecera)) + cabecera
+    for desplazamiento, bloque in bloques:
+        contenido[inicio + desplazamiento:inicio + desplazamiento + len(bloque)] = bloque
+    return bytes(contenido)
+
+
+class Columna:
+    """Columna de una instantánea, accesible como una secuencia de texto.
+
+    Attributes:
+        nombre (str): Nombre de la columna.
+        tipo (str): 'entero', 'fecha', 'diccionario' o 'texto'.
+        datos (memoryview): Valores codificados: enteros, ordinales o
+            códigos según el tipo, o los desplazamientos si es texto.
+        diccionario (list): Valores distintos ordenados, si el tipo es 'diccionario'.
+    """
+
+    nombre = ""
+    tipo = ""
+    datos = None
+    diccionario = None
+
+    def __init__(self, nombre, tipo, datos, diccionario=None, texto=None):
+        self.nombre = nombre
+        self.tipo = tipo
+        self.datos = datos
+        self.diccionario = diccionario
+        self.__texto = texto
+
+    def __len__(self):
+        return len(self.datos) - 1 if self.tipo == 'texto' else len(self.datos)
+
+    def __decodificar(self, valor, posicion=None):
+        if self.tipo == 'entero':
+            return str(valor)
+        if self.tipo == 'fecha':
+            return date.fromordinal(valor).isoformat() if valor else ""
+        if self.tipo == 'diccionario':
+            return self.diccionario[valor]
+        return str(self.__texto[valor:self.datos[posicion + 1]], 'utf-8')
+
+    def __getitem__(self, posicion):
+        if posicion < 0:
+            posicion += len(self)
+        if not 0 <= posicion < len(self):
+            raise IndexError(posicion)
+        return self.__decodificar(self.datos[posicion], posicion)
+
+    def valores(self):
+        """Decodifica toda la columna de una vez.
+
+        Las fechas y los códigos se traducen con una tabla por valor
+        distinto, por lo que el costo por fila es una búsqueda.
+
+        Returns:
+            list: Texto de la columna en cada fila.
+        """
+        if self.tipo == 'entero':
+            return list(map(str, self.datos))
+        if self.tipo == 'fecha':
+            fechas = {ordinal: date.fromordinal(ordinal).isoformat() if ordinal else "" for ordinal in set(self.datos)}
+            return list(map(fechas.__getitem__, self.datos))
+        if self.tipo == 'diccionario':
+            return list(map(self.diccionario.__getitem__, self.datos))
+        texto = self.__texto
+        desplazamientos = self.datos
+        return [str(texto[inicio:fin], 'utf-8') for inicio, fin in zip(desplazamientos, desplazamientos[1:])]
+
+    def __iter__(self):
+        return iter(self.valores())
+
+    def contar(self):
+        """Cuenta cuántas veces aparece cada valor de la columna.
+
+        En columnas con diccionario se cuentan los códigos sin decodificar
+        cada fila.
+
+        Returns:
+            dict: Número de apariciones por valor.
+        """
+        if self.tipo == 'diccionario':
+            conteo = [0] * len(self.diccionario)
+            for codigo in self.datos:
+                conteo[codigo] += 1
+            return {valor: veces for valor, veces in zip(self.diccionario, conteo) if veces}
+        conteo = {}
+        for valor in self.valores():
+            conteo[valor] = conteo.get(valor, 0) + 1
+        return conteo
+
+
+class InstantaneaColumnar:
+    """Vista de solo lectura sobre el contenido de una instantánea columnar.
+
+    Attributes:
+        encabezados (list): Columnas de la instantánea, en orden.
+        total (int): Número de filas.
+        firma (str): Firma del origen de los datos al generar la instantánea.
+    """
+
+    encabezados = []
+    total = 0
+    firma = None
+
+    def __init__(self, datos):
+        """Interpreta el contenido de una instantánea.
+
+        Args:
+            datos (bytes | mmap.mmap): Contenido generado por ``codificar``.
+
+        Raises:
+            ValueError: Si el contenido no es una instantánea válida para
+                esta plataforma.
+        """
+        vista = memoryview(datos)
+        if len(vista) < CABECERA.size:
+            raise ValueError("La instantánea está incompleta.")
+        magia, longitud = CABECERA.unpack_from(vista)
+        if magia != MAGIA:
+            raise ValueError("El archivo no es una instantánea columnar.")
+        try:
+            metadatos = json.loads(str(vista[CABECERA.size:CABECERA.size + longitud], 'utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ValueError("Los metadatos de la instantánea están dañados.")
+        if metadatos['orden'] != sys.byteorder:
+            raise ValueError("La instantánea se generó con otro orden de bytes.")
+        inicio = alinear(CABECERA.size + longitud)
+
+        self.firma = metadatos['firma']
+        self.total = metadatos['total']
+        self.encabezados = metadatos['encabezados']
+        self.__datos = datos
+        self.__columnas = {}
+        for nombre, columna in zip(self.encabezados, metadatos['columnas']):
+            partes = []
+            for formato, desde, hasta in columna['bloques']:
+                if inicio + hasta > len(vista):
+                    raise ValueError("La instantánea está incompleta.")
+                partes.append(vista[inicio + desde:inicio + hasta].cast(formato))
+            self.__columnas[nombre] = Columna(nombre, columna['tipo'], partes[0], columna.get('diccionario'),
+                                              partes[1] if len(partes) > 1 else None)
+
+    @classmethod
+    def abrir(cls, ruta, firma=None):
+        """Abre una instantánea mapeando el archivo en memoria.
+
+        Args:
+            ruta (str): Ruta de la instantánea.
+            firma (str): Si se indica, la instantánea solo se acepta si se
+                generó con esa firma.
+
+        Returns:
+            InstantaneaColumnar: La instantánea, o None si no existe, está
+            dañada o no corresponde a la firma.
+        """
+        try:
+            with open(ruta, mode='rb') as file:
+                datos = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            instantanea = cls(datos)
+        except (ValueError, KeyError, TypeError):
+            return None
+        if firma is not None and instantanea.firma != firma:
+            return None
+        return instantanea
+
+    @classmethod
+    def escribir(cls, ruta, encabezados, filas, firma=None):
+        """Genera una instantánea y reemplaza de forma atómica la anterior.
+
+        Args:
+            ruta (str): Ruta de la instantánea.
+            encabezados (list): Columnas de las filas, en orden.
+            filas (iterable): Filas a guardar.
+            firma (str): Firma del origen de los datos.
+
+        Returns:
+            InstantaneaColumnar: La instantánea escrita, ya mapeada en memoria.
+        """
+        contenido = codificar(encabezados, filas, firma)
+        temporal = crear_temporal(ruta)
+        try:
+            with open(temporal, mode='wb') as file:
+                file.write(contenido)
+            os.replace(temporal, ruta)
+        except Exception:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+        return cls.abrir(ruta)
+
+    def columna(self, campo):
+        """Obtiene una columna por nombre, sin distinguir mayúsculas y minúsculas.
+
+        Raises:
+            ValueError: Si la columna no existe.
+        """
+        if campo in self.__columnas:
+            return self.__columnas[campo]
+        for nombre, columna in self.__columnas.items():
+            if nombre.casefold() == str(campo).casefold():
+                return columna
+        raise ValueError(f"El campo {campo} no existe.")
+
+    def filas(self):
+        """Recorre las filas reconstruidas a partir de las columnas.
+
+        Yields:
+            list: Valores de cada fila en el orden de ``encabezados``.
+        """
+        columnas = [self.__columnas[nombre].valores() for nombre in self.encabezados]
+        if not columnas:
+            return
+        yield from map(list, zip(*columnas))
+
+    def __len__(self):
+        return self.total
+
+
+def main():
+    """Genera las instantáneas de atletas, entrenadores y disciplinas."""
+    from Atleta import Atleta
+    from Disciplina import Disciplina
+    from Entrenador import Entrenador
+
+    for entidad in (Atleta(almacenamiento='csv'), Entrenador(almacenamiento='csv'), Disciplina(almacenamiento='csv')):
+        instantanea = entidad.almacen.instantanea()
+        print(f"{entidad.archivo}: {instantanea.total} registros en {entidad.almacen.ruta_instantanea}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""Instrumentación opcional de las operaciones de las entidades.
+
+Con la variable de entorno ``INSTRUMENTACION=1`` (o llamando a ``activar``)
+cada operación pública de ``Atleta``, ``Entrenador``, ``Disciplina`` y
+``ValidadorDeDatos`` registra cuántas veces se llamó y un histograma de su
+latencia; las secciones internas (lectura del CSV, reescrituras, anexados,
+búsquedas) suman además las filas examinadas y los bytes leídos y escritos
+a la operación de entidad que las provocó. Desactivada, cada llamada solo
+paga la revisión de una bandera.
+
+Las métricas se obtienen con ``METRICAS.como_dict()`` o
+``METRICAS.como_prometheus()``; con ``METRICAS=ruta`` se escriben al
+terminar el proceso (en formato Prometheus si la ruta termina en ``.prom``
+y en JSON si no). Con ``PERFIL=ruta`` toda la sesión del hilo principal se
+ejecuta bajo cProfile y las estadísticas se guardan en esa ruta al terminar,
+para leerlas con ``python -m pstats ruta``.
+"""
+
+import atexit
+import cProfile
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Límites superiores, en segundos, de los intervalos del histograma de latencias.
+LIMITES = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+           0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+# Magnitudes que las secciones internas suman a la operación en curso.
+MAGNITUDES = ('filas_examinadas', 'bytes_leidos', 'bytes_escritos')
+
+activa = os.environ.get('INSTRUMENTACION', '') not in ('', '0')
+
+
+def activar(valor=True):
+    """Activa o desactiva el registro de métricas en todo el proceso."""
+    global activa
+    activa = valor
+
+
+class Histograma:
+    """Histograma acumulado de latencias con intervalos fijos.
+
+    Attributes:
+        cuentas (list): Observaciones en cada intervalo de ``LIMITES``.
+        total (int): Número de observaciones.
+        suma (float): Suma de las latencias, en segundos.
+        maximo (float): Latencia más alta observada, en segundos.
+    """
+
+    cuentas = None
+    total = 0
+    suma = 0.0
+    maximo = 0.0
+
+    def __init__(self):
+        self.cuentas = [0] * len(LIMITES)
+        self.total = 0
+        self.suma = 0.0
+        self.maximo = 0.0
+
+    def observar(self, segundos):
+        """Registra una latencia."""
+        posicion = 0
+        while segundos > LIMITES[posicion]:
+            posicion += 1
+        self.cuentas[posicion] += 1
+        self.total += 1
+        self.suma += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    def percentil(self, fraccion):
+        """Estima un percentil como el límite superior de su intervalo.
+
+        Returns:
+            float: Segundos; el máximo observado si cae en el último intervalo.
+        """
+        if not self.total:
+            return 0.0
+        objetivo = fraccion * self.total
+        acumuladas = 0
+        for limite, cuenta in zip(LIMITES, self.cuentas):
+            acumuladas += cuenta
+            if acumuladas >= objetivo:
+                return min(limite, self.maximo)
+        return self.maximo
+
+
+class Metricas:
+    """Registro de métricas por operación, seguro entre hilos.
+
+    Attributes:
+        latencias (dict): ``Histograma`` de cada operación.
+        magnitudes (dict): Por operación, las sumas de ``MAGNITUDES``.
+    """
+
+    latencias = None
+    magnitudes = None
+
+    def __init__(self):
+        self.latencias = {}
+        self.magnitudes = {}
+        self.__candado = threading.Lock()
+        self.__local = threading.local()
+
+    def __pila(self):
+        """Operaciones en curso en el hilo actual, de la más externa a la más interna."""
+        pila = getattr(self.__local, 'pila', None)
+        if pila is None:
+            pila = self.__local.pila = []
+        return pila
+
+    @contextmanager
+    def operacion(self, nombre, registrar=True):
+        """Mide la latencia de una operación.
+
+        Las operaciones anidadas registran su propia latencia; las magnitudes
+        se suman a la operación más externa del hilo.
+
+        Args:
+            nombre (str): Nombre de la operación, por ejemplo "Atleta.agregar_datos".
+            registrar (bool): Si es False solo se marca la operación en curso,
+                para quien acumula la latencia por su cuenta con ``observar``.
+        """
+        if not activa:
+            yield
+            return
+        pila = self.__pila()
+        pila.append(nombre)
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            segundos = time.perf_counter() - inicio
+            pila.pop()
+            if registrar:
+                self.observar(nombre, segundos)
+
+    def observar(self, nombre, segundos):
+        """Registra una llamada de ``nombre`` que tardó ``segundos``."""
+        with self.__candado:
+            histograma = self.latencias.get(nombre)
+            if histograma is None:
+                histograma = self.latencias[nombre] = Histograma()
+            histograma.observar(segundos)
+
+    def sumar(self, magnitud, cantidad):
+        """Suma una cantidad a una magnitud de la operación más externa en curso.
+
+        Args:
+            magnitud (str): Una de ``MAGNITUDES``.
+            cantidad (int): Cantidad a sumar.
+        """
+        if not activa or not cantidad:
+            return
+        pila = self.__pila()
+        nombre = pila[0] if pila else 'sin_operacion'
+        with self.__candado:
+            sumas = self.magnitudes.get(nombre)
+            if sumas is None:
+                sumas = self.magnitudes[nombre] = dict.fromkeys(MAGNITUDES, 0)
+            sumas[magnitud] += cantidad
+
+    def reiniciar(self):
+        """Descarta todas las métricas registradas."""
+        with self.__candado:
+            self.latencias = {}
+            self.magnitudes = {}
+
+    def como_dict(self):
+        """Resume las métricas en un diccionario serializable como JSON.
+
+        Returns:
+            dict: Por operación, llamadas, latencia promedio, p50, p95, p99 y
+            máxima en milisegundos, cuentas del histograma y magnitudes.
+        """
+        with self.__candado:
+            operaciones = {}
+            for nombre in sorted(set(self.latencias) | set(self.magnitudes)):
+                histograma = self.latencias.get(nombre, Histograma())
+                operaciones[nombre] = {
+                    'llamadas': histograma.total,
+                    'total_ms': round(histograma.suma * 1000, 4),
+                    'promedio_ms': round(histograma.suma * 1000 / histograma.total, 4) if histograma.total else 0.0,
+                    'p50_ms': round(histograma.percentil(0.5) * 1000, 4),
+                    'p95_ms': round(histograma.percentil(0.95) * 1000, 4),
+                    'p99_ms': round(histograma.percentil(0.99) * 1000, 4),
+                    'maximo_ms': round(histograma.maximo * 1000, 4),
+                    'histograma': {('+Inf' if limite == float('inf') else str(limite)): cuenta
+                                   for limite, cuenta in zip(LIMITES, histograma.cuentas) if cuenta},
+                    **self.magnitudes.get(nombre, dict.fromkeys(MAGNITUDES, 0)),
+                }
+            return {'operaciones': operaciones}
+
+    def como_json(self):
+        """Métricas en JSON (ver ``como_dict``)."""
+        return json.dumps(self.como_dict(), indent=2, ensure_ascii=False)
+
+    def como_prometheus(self):
+        """Métricas en el formato de texto de Prometheus.
+
+        Returns:
+            str: Un histograma ``entidad_operacion_segundos`` y un contador
+            ``entidad_<magnitud>_total`` por operación.
+        """
+        lineas = ["# HELP entidad_operacion_segundos Latencia de las operaciones de las entidades.",
+                  "# TYPE entidad_operacion_segundos histogram"]
+        with self.__candado:
+            for nombre, histograma in sorted(self.latencias.items()):
+                acumuladas = 0
+                for limite, cuenta in zip(LIMITES, histograma.cuentas):
+                    acumuladas += cuenta
+                    le = '+Inf' if limite == float('inf') else repr(limite)
+                    lineas.append(f'entidad_operacion_segundos_bucket{{operacion="{nombre}",le="{le}"}} {acumuladas}')
+                lineas.append(f'entidad_operacion_segundos_sum{{operacion="{nombre}"}} {histograma.suma!r}')
+                lineas.append(f'entidad_operacion_segundos_count{{operacion="{nombre}"}} {histograma.total}')
+            for magnitud in MAGNITUDES:
+                lineas.append(f"# TYPE entidad_{magnitud}_total counter")
+                for nombre, sumas in sorted(self.magnitudes.items()):
+                    lineas.append(f'entidad_{magnitud}_total{{operacion="{nombre}"}} {sumas[magnitud]}')
+        return "\n".join(lineas) + "\n"
+
+    def escribir(self, ruta):
+        """Escribe las métricas en Prometheus si ``ruta`` termina en .prom, o en JSON."""
+        texto = self.como_prometheus() if ruta.endswith('.prom') else self.como_json() + "\n"
+        with open(ruta, mode='w', encoding='utf-8') as file:
+            file.write(texto)
+
+
+METRICAS = Metricas()
+
+
+def iterar_medido(nombre, iterador, segundos=0.0):
+    """Recorre un iterador sumando a ``nombre`` solo el tiempo de cada paso.
+
+    La latencia se registra una vez, al agotarse o cerrarse el iterador, e
+    incluye los ``segundos`` que ya costó crearlo; el tiempo que el
+    consumidor tarda entre un elemento y otro no se cuenta.
+    """
+    try:
+        while True:
+            inicio = time.perf_counter()
+            with METRICAS.operacion(nombre, registrar=False):
+                try:
+                    elemento = next(iterador)
+                except StopIteration:
+                    return
+                finally:
+                    segundos += time.perf_counter() - inicio
+            yield elemento
+    finally:
+        cerrar = getattr(iterador, 'close', None)
+        if cerrar is not None:
+            cerrar()
+        METRICAS.observar(nombre, segundos)
+
+
+def instrumentar(nombre):
+    """Decorador que mide cada llamada de una función como la operación ``nombre``.
+
+    Si la función es un generador o devuelve un iterador (por ejemplo, las
+    búsquedas), la latencia abarca el recorrido completo del iterador.
+    """
+    def decorar(funcion):
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not activa:
+                return funcion(*args, **kwargs)
+            inicio = time.perf_counter()
+            with METRICAS.operacion(nombre, registrar=False):
+                resultado = funcion(*args, **kwargs)
+            segundos = time.perf_counter() - inicio
+            if isinstance(resultado, Iterator):
+                return iterar_medido(nombre, resultado, segundos)
+            METRICAS.observar(nombre, segundos)
+            return resultado
+        return envoltura
+    return decorar
+
+
+def instrumentar_clase(cls):
+    """Instrumenta los métodos públicos definidos en una clase.
+
+    Cada método se mide como la operación "Clase.metodo". Se puede usar como
+    decorador de clase o llamarse desde ``__init_subclass__``.
+
+    Returns:
+        type: La misma clase.
+    """
+    for nombre, atributo in list(vars(cls).items()):
+        if nombre.startswith('_') or not inspect.isfunction(atributo):
+            continue
+        setattr(cls, nombre, instrumentar(f"{cls.__name__}.{nombre}")(atributo))
+    return cls
+
+
+def escribir_al_terminar():
+    """Escribe las métricas en la ruta de ``METRICAS``, si se indicó."""
+    ruta = os.environ.get('METRICAS')
+    if ruta and activa:
+        METRICAS.escribir(ruta)
+
+
+def iniciar_perfil(ruta):
+    """Ejecuta el resto de la sesión bajo cProfile y guarda las estadísticas al terminar.
+
+    Args:
+        ruta (str): Archivo donde se escriben las estadísticas.
+
+    Returns:
+        cProfile.Profile: El perfilador activo.
+    """
+    perfil = cProfile.Profile()
+    perfil.enable()
+
+    def guardar():
+        perfil.disable()
+        perfil.dump_stats(ruta)
+
+    atexit.register(guardar)
+    return perfil
+
+
+atexit.register(escribir_al_terminar)
+if os.environ.get('PERFIL'):
+    iniciar_perfil(os.environ['PERFIL'])
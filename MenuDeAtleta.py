@@ -1,4 +1,5 @@
 from Atleta import Atleta
+from Presentacion import mostrar, mostrar_registro, mostrar_registros
 
 def mostrar_menu():
     """Muestra el menú de opciones para la gestión de los Atletas."""
@@ -7,7 +8,8 @@ def mostrar_menu():
     print("2. Consultar atleta")
     print("3. Editar atleta")
     print("4. Eliminar atleta")
-    print("5. Salir")
+    print("5. Buscar atleta por nombre")
+    print("6. Salir")
 
 def solicitar_datos_atleta():
     """Solicita al usuario los datos de un atleta.
@@ -37,6 +39,8 @@ def main():
     consultar, editar, o eliminar entrenadores).
     """
     atleta = Atleta()
+    for accion in atleta.recuperaciones:
+        print(accion)
 
     while True:
         mostrar_menu()
@@ -45,21 +49,24 @@ def main():
         if opcion == '1':
             datos = solicitar_datos_atleta()
             try:
-                atleta.agregar_datos(datos)
+                mostrar(atleta.agregar_datos(datos))
             except ValueError as e:
                 print(f"Error en los datos ingresados: {e}")
         elif opcion == '2':
             id = input("Ingresa el ID del atleta a consultar: ")
-            atleta.consultar_datos(id)
+            mostrar_registro(atleta.consultar_datos(id))
         elif opcion == '3':
             id = input("Ingresa el ID del atleta a editar: ")
             campo = input("Ingresa el nombre del campo a editar: ")
             valor = input("Ingresa el nuevo valor: ")
-            atleta.editar_datos(id, campo, valor)
+            mostrar(atleta.editar_datos(id, campo, valor))
         elif opcion == '4':
             id = input("Ingresa el ID del atleta a eliminar: ")
-            atleta.eliminar_datos(id)
+            mostrar(atleta.eliminar_datos(id))
         elif opcion == '5':
+            texto = input("Ingresa el nombre o apellido aproximado del atleta: ")
+            mostrar_registros(atleta.buscar_por_nombre(texto), "No se encontraron atletas con ese nombre.")
+        elif opcion == '6':
             print("Saliendo del programa.")
             break
         else:
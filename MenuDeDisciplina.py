@@ -1,4 +1,5 @@
 from Disciplina import Disciplina
+from Presentacion import mostrar, mostrar_registro
 
 def mostrar_menu_disciplina():
     """Muestra el menú de opciones para la gestión de las Disciplinas."""
@@ -30,6 +31,8 @@ def main():
     consultar, editar, o eliminar entrenadores).
     """
     disciplina = Disciplina()
+    for accion in disciplina.recuperaciones:
+        print(accion)
 
     while True:
         mostrar_menu_disciplina()
@@ -37,21 +40,21 @@ def main():
 
         if opcion == '1':
             datos = solicitar_datos_disciplina()
-            disciplina.agregar_datos(datos)
+            mostrar(disciplina.agregar_datos(datos))
         elif opcion == '2':
             nombre = input("Ingresa el nombre de la disciplina a consultar: ")
             categoria = input("Ingresa la categoria de la disciplina a consultar: ")
-            disciplina.consultar_datos(nombre, categoria)
+            mostrar_registro(disciplina.consultar_datos(nombre, categoria))
         elif opcion == '3':
             nombre = input("Ingresa el nombre de la disciplina a editar: ")
             categoria = input("Ingresa la categoria de la disciplina a editar: ")
             campo = input("Ingresa el nombre del campo a editar: ")
             valor = input("Ingresa el nuevo valor: ")
-            disciplina.editar_datos(nombre, categoria, campo, valor)
+            mostrar(disciplina.editar_datos(nombre, categoria, campo, valor))
         elif opcion == '4':
             nombre = input("Ingresa el nombre de la disciplina a eliminar: ")
             categoria = input("Ingresa la categoria de la disciplina a eliminar: ")
-            disciplina.eliminar_datos(nombre, categoria)
+            mostrar(disciplina.eliminar_datos(nombre, categoria))
         elif opcion == '5':
             print("Saliendo del programa.")
             break
@@ -1,4 +1,5 @@
 from Entrenador import Entrenador
+from Presentacion import mostrar, mostrar_registro, mostrar_registros
 
 
 def mostrar_menu_entrenador():
@@ -8,7 +9,8 @@ def mostrar_menu_entrenador():
     print("2. Consultar entrenador")
     print("3. Editar entrenador")
     print("4. Eliminar entrenador")
-    print("5. Salir")
+    print("5. Buscar entrenador por nombre")
+    print("6. Salir")
 
 def solicitar_datos_entrenador():
     """Solicita al usuario los datos de un entrenador.
@@ -40,6 +42,8 @@ def main():
     consultar, editar, o eliminar entrenadores).
     """
     entrenador = Entrenador()
+    for accion in entrenador.recuperaciones:
+        print(accion)
 
     while True:
         mostrar_menu_entrenador()
@@ -48,22 +52,25 @@ def main():
         if opcion == '1':
             datos = solicitar_datos_entrenador()
             try:
-                entrenador.agregar_datos(datos)
+                mostrar(entrenador.agregar_datos(datos))
             except ValueError as e:
                 print(f"Error en los datos ingresados: {e}")
                 
         elif opcion == '2':
             id = input("Ingresa el ID del entrenador a consultar: ")
-            entrenador.consultar_datos(id)
+            mostrar_registro(entrenador.consultar_datos(id))
         elif opcion == '3':
             id = input("Ingresa el ID del entrenador a editar: ")
             campo = input("Ingresa el nombre del campo a editar: ")
             valor = input("Ingresa el nuevo valor: ")
-            entrenador.editar_datos(id, campo, valor)
+            mostrar(entrenador.editar_datos(id, campo, valor))
         elif opcion == '4':
             id = input("Ingresa el ID del entrenador a eliminar: ")
-            entrenador.eliminar_datos(id)
+            mostrar(entrenador.eliminar_datos(id))
         elif opcion == '5':
+            texto = input("Ingresa el nombre o apellido aproximado del entrenador: ")
+            mostrar_registros(entrenador.buscar_por_nombre(texto), "No se encontraron entrenadores con ese nombre.")
+        elif opcion == '6':
             print("Saliendo del programa.")
             break
         else:
@@ -0,0 +1,81 @@
+from Agregacion import Conteo, Distintos, HistogramaDeEdades, Maximo, Minimo, Resumen
+from Atleta import Atleta
+from Disciplina import Disciplina
+from Entrenador import Entrenador
+from IndiceDeFechas import ordinal
+from Presentacion import mostrar_resumen
+
+def mostrar_menu_reportes():
+    """Muestra el menú de reportes."""
+    print("\n--- Menú de Reportes ---")
+    print("1. Reporte de atletas")
+    print("2. Reporte de entrenadores")
+    print("3. Reporte de disciplinas")
+    print("4. Salir")
+
+def reporte_de_atletas(atleta):
+    """Calcula en una sola pasada los reportes de atletas.
+
+    Returns:
+        list: Pares (título, grupos) de cada reporte.
+    """
+    resumenes = [
+        Resumen(['Disciplina'], atletas=Conteo(), nacionalidades=Distintos('Nacionalidad'),
+                nacimiento_mas_antiguo=Minimo('Fecha de Nacimiento', ordinal),
+                nacimiento_mas_reciente=Maximo('Fecha de Nacimiento', ordinal)),
+        Resumen(['Nacionalidad'], atletas=Conteo()),
+        Resumen(['Genero'], atletas=Conteo()),
+        Resumen(atletas=Conteo(), edades=HistogramaDeEdades(ancho=5)),
+    ]
+    titulos = ["Atletas por disciplina", "Atletas por nacionalidad", "Atletas por género",
+               "Edades de los atletas (intervalos de 5 años)"]
+    return list(zip(titulos, atleta.resumir(resumenes)))
+
+def reporte_de_entrenadores(entrenador):
+    """Calcula en una sola pasada los reportes de entrenadores.
+
+    Returns:
+        list: Pares (título, grupos) de cada reporte.
+    """
+    resumenes = [
+        Resumen(['Disciplina'], entrenadores=Conteo(), nacionalidades=Distintos('Nacionalidad')),
+        Resumen(['Nacionalidad'], entrenadores=Conteo()),
+        Resumen(entrenadores=Conteo(), edades=HistogramaDeEdades(ancho=10)),
+    ]
+    titulos = ["Entrenadores por disciplina", "Entrenadores por nacionalidad",
+               "Edades de los entrenadores (intervalos de 10 años)"]
+    return list(zip(titulos, entrenador.resumir(resumenes)))
+
+def reporte_de_disciplinas(disciplina):
+    """Calcula los reportes de disciplinas.
+
+    Returns:
+        list: Pares (título, grupos) de cada reporte.
+    """
+    resumenes = [Resumen(['Categoria'], disciplinas=Conteo(), patrocinadores=Distintos('Patrocinadores'))]
+    return list(zip(["Disciplinas por categoría"], disciplina.resumir(resumenes)))
+
+def main():
+    """Función principal que muestra los reportes que elige el usuario."""
+    while True:
+        mostrar_menu_reportes()
+        opcion = input("Selecciona una opción: ")
+
+        try:
+            if opcion == '1':
+                reportes = reporte_de_atletas(Atleta())
+            elif opcion == '2':
+                reportes = reporte_de_entrenadores(Entrenador())
+            elif opcion == '3':
+                reportes = reporte_de_disciplinas(Disciplina())
+            elif opcion == '4':
+                print("Saliendo del programa.")
+                break
+            else:
+                print("Opción no válida. Por favor, elige una opción del menú.")
+                continue
+        except ValueError as error:
+            print(error)
+            continue
+        for titulo, grupos in reportes:
+            mostrar_resumen(titulo, grupos)
@@ -2,6 +2,7 @@
 from MenuDeEntrenador import main as menu_entrenador
 from MenuDeAtleta import main as menu_atleta
 from MenuDeDisciplina import main as menu_disciplina    
+from MenuDeReportes import main as menu_reportes
 
 def mostrar_menu_principal():
     """Muestra el menú principal para seleccionar la entidad a gestionar."""
@@ -9,7 +10,8 @@ def mostrar_menu_principal():
     print("1. Menú de Entrenador")
     print("2. Menú de Atleta")
     print("3. Menú de Disciplina")
-    print("4. Salir")
+    print("4. Reportes")
+    print("5. Salir")
 
 def main():
     """Función principal que permite seleccionar la entidad a gestionar."""
@@ -27,6 +29,9 @@ def main():
             print("Accediendo al menú de Disciplina...")
             menu_disciplina()  # Accede al menú de Disciplina
         elif opcion == '4':
+            print("Accediendo a los reportes...")
+            menu_reportes()  # Accede al menú de Reportes
+        elif opcion == '5':
             print("Saliendo del programa.")
             break
         else:
@@ -0,0 +1,68 @@
+"""Migra los registros de los archivos CSV a la base de datos SQLite.
+
+Copia atletas, entrenadores y disciplinas, incluidos los cambios pendientes
+de sus bitácoras, a la base indicada en ``Configuracion.RUTA_SQLITE``. Los
+registros cuya clave ya existe en la base se omiten, de modo que la
+migración puede ejecutarse varias veces sin duplicar datos.
+
+Uso:
+    python MigracionSQLite.py [--destino archivos/datos.db]
+"""
+
+import argparse
+
+import Configuracion
+from AlmacenamientoSQLite import AlmacenamientoSQLite
+from Atleta import Atleta
+from Disciplina import Disciplina
+from Entrenador import Entrenador
+
+ENTIDADES = [
+    ('atleta', Atleta),
+    ('entrenador', Entrenador),
+    ('disciplina', Disciplina),
+]
+
+
+def migrar(destino):
+    """Copia cada entidad de su archivo CSV a su tabla de SQLite.
+
+    Args:
+        destino (str): Ruta de la base de datos SQLite.
+
+    Returns:
+        list: Tuplas (tabla, leidos, insertados) por cada entidad.
+    """
+    resultados = []
+    for tabla, clase in ENTIDADES:
+        origen = clase(almacenamiento='csv').almacen
+        base = AlmacenamientoSQLite(destino, tabla, origen.atributos, origen.campos_clave, origen.normalizar,
+                                    fechas=clase.ESQUEMA.fechas)
+        with origen.compartido():
+            filas = list(origen.filas())
+        insertados = base.migrar(filas)
+        base.compactar()
+        resultados.append((tabla, len(filas), insertados))
+    return resultados
+
+
+def main(argv=None):
+    """Ejecuta la migración e imprime un resumen por entidad."""
+    parser = argparse.ArgumentParser(description="Migra los archivos CSV a SQLite.")
+    parser.add_argument('--destino', default=Configuracion.RUTA_SQLITE,
+                        help="Ruta de la base de datos SQLite.")
+    argumentos = parser.parse_args(argv)
+
+    try:
+        resultados = migrar(argumentos.destino)
+    except Exception as e:
+        print(f"Error al migrar a {argumentos.destino}: {e}")
+        return 1
+
+    for tabla, leidos, insertados in resultados:
+        print(f"{tabla}: {leidos} registros leídos, {insertados} migrados, {leidos - insertados} ya existían.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
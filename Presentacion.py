@@ -0,0 +1,64 @@
+"""Adaptador de presentación de los resultados de las entidades.
+
+Las entidades devuelven un ``Resultado`` y no imprimen nada; los menús usan
+estas funciones para mostrarlo en la consola y la consola de comandos y el
+servidor las usan para convertirlo a JSON.
+"""
+
+
+def mostrar(resultado):
+    """Imprime el mensaje de un resultado."""
+    print(resultado.mensaje)
+
+
+def mostrar_registro(resultado):
+    """Imprime el registro consultado o, si no se encontró, el mensaje."""
+    if resultado.exito and resultado.registro is not None:
+        print(resultado.registro.como_dict())
+    else:
+        print(resultado.mensaje)
+
+
+def mostrar_registros(registros, mensaje_vacio):
+    """Imprime un registro por línea, o el mensaje indicado si no hay ninguno."""
+    for registro in registros:
+        print(registro)
+    if not registros:
+        print(mensaje_vacio)
+
+
+def mostrar_resumen(titulo, grupos):
+    """Imprime un título y un grupo de un resumen por línea."""
+    print(f"\n{titulo}:")
+    mostrar_registros(grupos, "Sin registros.")
+
+
+def mostrar_lote(resultados, accion="Se aplicaron", elementos="cambios"):
+    """Imprime los elementos de un lote que fallaron y el resumen del lote.
+
+    Args:
+        resultados (list): ``Resultado`` de cada elemento del lote.
+        accion (str): Inicio del resumen, por ejemplo "Se eliminaron".
+        elementos (str): Qué se cuenta, por ejemplo "registros".
+    """
+    for resultado in resultados:
+        if not resultado.exito:
+            print(resultado.mensaje)
+    exitosos = sum(1 for resultado in resultados if resultado.exito)
+    print(f"{accion} {exitosos} de {len(resultados)} {elementos}.")
+
+
+def a_json(resultado):
+    """Convierte un resultado en un diccionario serializable como JSON.
+
+    Returns:
+        dict: Llaves 'exito', 'mensajes', 'errores' (campo y mensaje de cada
+        error de validación) y 'resultado' (el registro como diccionario, o None).
+    """
+    registro = resultado.registro
+    return {
+        'exito': resultado.exito,
+        'mensajes': [resultado.mensaje] if resultado.mensaje else [],
+        'errores': [{'campo': error.campo, 'mensaje': error.mensaje} for error in resultado.errores],
+        'resultado': None if registro is None else registro.como_dict(),
+    }
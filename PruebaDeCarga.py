@@ -0,0 +1,212 @@
+"""Prueba de carga del servicio HTTP/JSON contra localhost.
+
+Varios clientes concurrentes, cada uno con una conexión persistente, agregan
+atletas con IDs propios, los consultan, los buscan, editan parte de ellos y
+eliminan otra parte. Se mide el rendimiento y la latencia por tipo de
+operación y al final se verifica que el servicio conserva exactamente los
+registros y las ediciones esperadas.
+
+Si no se indica ``--puerto``, la prueba inicia su propio servidor sobre una
+copia vacía de los archivos en un directorio temporal y lo detiene al final.
+
+Uso:
+    python PruebaDeCarga.py --clientes 32 --operaciones 50
+    python PruebaDeCarga.py --puerto 8080
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BLOQUE = 100000
+
+
+class Cliente:
+    """Cliente HTTP/1.1 mínimo sobre una conexión persistente.
+
+    Attributes:
+        latencias (dict): Segundos de cada petición, por tipo de operación.
+    """
+
+    latencias = None
+
+    def __init__(self, host, puerto):
+        self.latencias = {}
+        self.__host = host
+        self.__puerto = puerto
+        self.__lector = None
+        self.__escritor = None
+
+    async def abrir(self):
+        self.__lector, self.__escritor = await asyncio.open_connection(self.__host, self.__puerto)
+
+    async def cerrar(self):
+        self.__escritor.close()
+        await self.__escritor.wait_closed()
+
+    async def pedir(self, operacion, metodo, ruta, cuerpo=None):
+        """Envía una petición y devuelve (estado, cuerpo JSON)."""
+        datos = b'' if cuerpo is None else json.dumps(cuerpo).encode('utf-8')
+        inicio = time.perf_counter()
+        self.__escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: {self.__host}\r\n"
+                              f"Content-Type: application/json\r\nContent-Length: {len(datos)}\r\n\r\n"
+                              .encode('latin-1') + datos)
+        await self.__escritor.drain()
+        estado = int((await self.__lector.readline()).split()[1])
+        longitud = 0
+        while True:
+            linea = await self.__lector.readline()
+            if linea in (b'\r\n', b''):
+                break
+            nombre, _, valor = linea.decode('latin-1').partition(':')
+            if nombre.strip().lower() == 'content-length':
+                longitud = int(valor)
+        contenido = json.loads(await self.__lector.readexactly(longitud))
+        self.latencias.setdefault(operacion, []).append(time.perf_counter() - inicio)
+        return estado, contenido
+
+
+def datos_de_atleta(clave):
+    """Genera datos válidos de un atleta con el ID indicado."""
+    return [str(clave), f"N{clave}", "Paterno", "", "Mexico", "2000-01-01", "Futbol", "M",
+            "1234567890", f"a{clave}@correo.com"]
+
+
+async def trabajar(cliente, trabajador, operaciones, errores):
+    """Ejecuta la carga de un cliente con IDs propios."""
+    base = trabajador * BLOQUE
+
+    async def esperar(operacion, estados, metodo, ruta, cuerpo=None):
+        estado, contenido = await cliente.pedir(operacion, metodo, ruta, cuerpo)
+        if estado not in estados:
+            errores.append(f"{metodo} {ruta}: {estado} {contenido['mensajes']}")
+        return contenido
+
+    for i in range(operaciones):
+        await esperar('agregar', (201,), 'POST', "/atletas", datos_de_atleta(base + i))
+    for i in range(operaciones):
+        await esperar('consultar', (200,), 'GET', f"/atletas/{base + i}")
+    await esperar('buscar', (200,), 'POST', "/atletas/buscar",
+                  {'filtros': {'ID': ['en', [str(base + i) for i in range(operaciones)]]}, 'campos': ['ID']})
+    for i in range(0, operaciones, 2):
+        await esperar('editar', (200,), 'PATCH', f"/atletas/{base + i}", {'Nombre': f"E{base + i}"})
+    for i in range(0, operaciones, 3):
+        await esperar('eliminar', (200,), 'DELETE', f"/atletas/{base + i}")
+
+
+async def verificar(cliente, clientes, operaciones):
+    """Compara los registros del servicio contra los esperados.
+
+    Returns:
+        list: Descripción de cada problema encontrado.
+    """
+    problemas = []
+    for trabajador in range(1, clientes + 1):
+        base = trabajador * BLOQUE
+        ids = [str(base + i) for i in range(operaciones)]
+        _, contenido = await cliente.pedir('verificar', 'POST', "/atletas/buscar",
+                                           {'filtros': {'ID': ['en', ids]}, 'campos': ['ID', 'Nombre']})
+        vistos = {}
+        for registro in contenido['resultado']:
+            if registro['ID'] in vistos:
+                problemas.append(f"Atleta {registro['ID']} duplicado")
+            vistos[registro['ID']] = registro['Nombre']
+        for i in range(operaciones):
+            clave = str(base + i)
+            if i % 3 == 0:
+                if clave in vistos:
+                    problemas.append(f"Atleta {clave} debió eliminarse")
+            elif clave not in vistos:
+                problemas.append(f"Atleta {clave} se perdió")
+            elif i % 2 == 0 and vistos[clave] != f"E{clave}":
+                problemas.append(f"La edición del atleta {clave} se perdió")
+    return problemas
+
+
+def percentil(valores, fraccion):
+    """Percentil de una lista ya ordenada."""
+    return valores[min(len(valores) - 1, int(fraccion * len(valores)))]
+
+
+async def ejecutar(host, puerto, clientes, operaciones):
+    """Ejecuta los clientes, imprime el resumen y devuelve los problemas."""
+    conexiones = [Cliente(host, puerto) for _ in range(clientes + 1)]
+    for cliente in conexiones:
+        await cliente.abrir()
+    errores = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(trabajar(cliente, trabajador + 1, operaciones, errores)
+                           for trabajador, cliente in enumerate(conexiones[:-1])))
+    segundos = time.perf_counter() - inicio
+    problemas = errores[:10] + await verificar(conexiones[-1], clientes, operaciones)
+    for cliente in conexiones:
+        await cliente.cerrar()
+
+    latencias = {}
+    for cliente in conexiones[:-1]:
+        for operacion, valores in cliente.latencias.items():
+            latencias.setdefault(operacion, []).extend(valores)
+    total = sum(len(valores) for valores in latencias.values())
+    print(f"{clientes} clientes, {total} peticiones en {segundos:.2f} s ({total / segundos:.0f} peticiones/s).")
+    for operacion, valores in latencias.items():
+        valores.sort()
+        print(f"  {operacion:<10} {len(valores):>6}  p50 {percentil(valores, 0.5) * 1000:7.2f} ms  "
+              f"p95 {percentil(valores, 0.95) * 1000:7.2f} ms  p99 {percentil(valores, 0.99) * 1000:7.2f} ms")
+    if len(errores) > 10:
+        problemas.append(f"... y {len(errores) - 10} respuestas inesperadas más")
+    return problemas
+
+
+def iniciar_servidor(directorio, argumentos):
+    """Inicia el servidor en un subproceso y devuelve (proceso, puerto)."""
+    comando = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Servidor.py"),
+               '--host', argumentos.host, '--puerto', '0', '--modo', argumentos.modo]
+    if argumentos.almacenamiento:
+        comando += ['--almacenamiento', argumentos.almacenamiento]
+    entorno = dict(os.environ, RUTA_SQLITE=os.path.join(directorio, "archivos", "datos.db"))
+    proceso = subprocess.Popen(comando, cwd=directorio, stdout=subprocess.PIPE, text=True, env=entorno)
+    linea = proceso.stdout.readline()
+    if not linea:
+        raise RuntimeError("El servidor terminó antes de aceptar conexiones.")
+    return proceso, int(linea.rsplit(':', 1)[1])
+
+
+def main(argv=None):
+    """Ejecuta la prueba de carga y devuelve 0 si no hubo problemas."""
+    parser = argparse.ArgumentParser(description="Prueba de carga del servicio HTTP/JSON.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=None,
+                        help="Puerto de un servidor ya iniciado; por omisión se inicia uno temporal.")
+    parser.add_argument('--clientes', type=int, default=16)
+    parser.add_argument('--operaciones', type=int, default=30)
+    parser.add_argument('--almacenamiento', choices=['csv', 'sqlite'], default=None)
+    parser.add_argument('--modo', choices=['reescritura', 'bitacora'], default='reescritura')
+    argumentos = parser.parse_args(argv)
+
+    proceso, directorio, puerto = None, None, argumentos.puerto
+    if puerto is None:
+        directorio = tempfile.mkdtemp(prefix="carga-")
+        os.makedirs(os.path.join(directorio, "archivos"))
+        proceso, puerto = iniciar_servidor(directorio, argumentos)
+    try:
+        problemas = asyncio.run(ejecutar(argumentos.host, puerto, argumentos.clientes, argumentos.operaciones))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+            shutil.rmtree(directorio, ignore_errors=True)
+
+    for problema in problemas:
+        print(problema)
+    print("Sin registros perdidos ni duplicados." if not problemas else f"{len(problemas)} problemas encontrados.")
+    return 0 if not problemas else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,215 @@
+import csv
+import os
+import re
+import shutil
+import tempfile
+
+from Instrumentacion import METRICAS, instrumentar
+
+# Nombre del temporal que usaban las versiones anteriores para reescribir
+# cualquier CSV de la carpeta; se recupera o elimina al arrancar.
+TEMPORAL_ANTERIOR = "temp.csv"
+
+
+def crear_temporal(archivo):
+    """Crea un archivo temporal vacío con nombre único junto a ``archivo``.
+
+    Args:
+        archivo (str): Ruta del archivo que el temporal va a reemplazar.
+
+    Returns:
+        str: Ruta del archivo temporal creado, con los mismos permisos que
+        ``archivo`` si este ya existe.
+    """
+    directorio, nombre = os.path.split(archivo)
+    descriptor, temp_archivo = tempfile.mkstemp(prefix=nombre + ".", suffix=".tmp", dir=directorio or ".")
+    os.close(descriptor)
+    if os.path.exists(archivo):
+        shutil.copymode(archivo, temp_archivo)
+    return temp_archivo
+
+
+def temporales_de(archivo):
+    """Lista los temporales creados con ``crear_temporal`` para ``archivo``.
+
+    Args:
+        archivo (str): Ruta del archivo que los temporales iban a reemplazar.
+
+    Returns:
+        list: Rutas de los temporales, del más reciente al más antiguo.
+    """
+    directorio, nombre = os.path.split(archivo)
+    directorio = directorio or "."
+    patron = re.compile(re.escape(nombre) + r"\.[A-Za-z0-9_]+\.tmp$")
+    rutas = [os.path.join(directorio, entrada) for entrada in os.listdir(directorio) if patron.match(entrada)]
+    return sorted(rutas, key=os.path.getmtime, reverse=True)
+
+
+def sincronizar_directorio(archivo):
+    """Sincroniza con el disco el directorio de ``archivo``.
+
+    Hace durable la creación, el reemplazo o la eliminación de una entrada
+    del directorio. En sistemas que no permiten abrir directorios no hace nada.
+    """
+    try:
+        descriptor = os.open(os.path.dirname(archivo) or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+@instrumentar("ReescrituraCSV.reemplazar")
+def reemplazar(temp_archivo, archivo):
+    """Reemplaza ``archivo`` por ``temp_archivo`` de forma atómica y durable.
+
+    El temporal se sincroniza con el disco antes del reemplazo y el
+    directorio después, de modo que tras una caída el archivo es el
+    original completo o el nuevo completo, nunca una mezcla ni un hueco.
+
+    Args:
+        temp_archivo (str): Archivo ya escrito y cerrado.
+        archivo (str): Archivo a reemplazar.
+    """
+    descriptor = os.open(temp_archivo, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+    os.replace(temp_archivo, archivo)
+    sincronizar_directorio(archivo)
+
+
+def truncar_linea_incompleta(archivo):
+    """Elimina la última línea de un archivo si no termina en salto de línea.
+
+    Una escritura anexada que se interrumpe deja una línea a medias; si no
+    se quita, la siguiente escritura se pegaría a ella. Aunque la línea
+    parezca completa se elimina: sin el salto de línea no hay forma de saber
+    si el último campo quedó cortado.
+
+    Args:
+        archivo (str): Ruta del archivo.
+
+    Returns:
+        int: Bytes eliminados; 0 si el archivo estaba completo o no existe.
+    """
+    try:
+        file = open(archivo, mode='r+b')
+    except FileNotFoundError:
+        return 0
+    with file:
+        tamano = file.seek(0, os.SEEK_END)
+        fin = tamano
+        while fin > 0:
+            inicio = max(0, fin - 4096)
+            file.seek(inicio)
+            bloque = file.read(fin - inicio)
+            if fin == tamano and bloque.endswith(b"\n"):
+                return 0
+            posicion = bloque.rfind(b"\n")
+            if posicion >= 0:
+                fin = inicio + posicion + 1
+                break
+            fin = inicio
+        if tamano == fin:
+            return 0
+        file.truncate(fin)
+        file.flush()
+        os.fsync(file.fileno())
+        return tamano - fin
+
+
+def leer_encabezados(archivo):
+    """Lee la primera fila de un CSV, o devuelve None si no se puede leer."""
+    try:
+        with open(archivo, mode='r', newline='') as file:
+            return next(csv.reader(file), None)
+    except (OSError, csv.Error, UnicodeDecodeError):
+        return None
+
+
+def recuperar_csv(archivo, encabezados):
+    """Recupera un CSV tras una reescritura o un anexado interrumpidos.
+
+    Debe llamarse al arrancar, con el bloqueo exclusivo del archivo tomado.
+    Si el archivo no existe pero quedó un temporal completo de una
+    reescritura (de esta versión o el ``temp.csv`` de las anteriores, que
+    borraban el original antes de renombrar), se restaura el más reciente.
+    Los demás temporales se eliminan y, si la última fila no termina en
+    salto de línea, se descarta.
+
+    Args:
+        archivo (str): Ruta del archivo CSV.
+        encabezados (list): Columnas esperadas; un ``temp.csv`` se considera
+            de este archivo solo si tiene estos encabezados.
+
+    Returns:
+        list: Descripción de cada acción de recuperación realizada.
+    """
+    acciones = []
+    temporales = temporales_de(archivo)
+    anterior = os.path.join(os.path.dirname(archivo) or ".", TEMPORAL_ANTERIOR)
+    if os.path.exists(anterior) and leer_encabezados(anterior) == list(encabezados):
+        temporales.append(anterior)
+    if not os.path.exists(archivo):
+        for temp_archivo in temporales:
+            if leer_encabezados(temp_archivo) == list(encabezados):
+                truncar_linea_incompleta(temp_archivo)
+                reemplazar(temp_archivo, archivo)
+                temporales.remove(temp_archivo)
+                acciones.append(f"Se restauró {archivo} desde {temp_archivo}.")
+                break
+    for temp_archivo in temporales:
+        os.remove(temp_archivo)
+        acciones.append(f"Se eliminó el temporal {temp_archivo} de una reescritura interrumpida.")
+    eliminados = truncar_linea_incompleta(archivo)
+    if eliminados:
+        acciones.append(f"Se descartaron {eliminados} bytes de una fila incompleta al final de {archivo}.")
+    return acciones
+
+
+@instrumentar("ReescrituraCSV.reescribir_csv")
+def reescribir_csv(archivo, transformar):
+    """Reescribe un archivo CSV en una sola pasada.
+
+    Cada fila se lee como diccionario y se entrega a ``transformar``; la fila
+    que devuelva se escribe en un archivo temporal que al final reemplaza al
+    original con ``reemplazar``, así que una caída a mitad de la reescritura
+    deja el original intacto. Si ``transformar`` devuelve None la fila se
+    omite. El archivo temporal tiene un nombre único junto al original, para
+    que dos reescrituras simultáneas nunca compartan el mismo temporal.
+
+    Args:
+        archivo (str): Ruta al archivo CSV a reescribir.
+        transformar (callable): Función que recibe una fila (dict) y devuelve
+            la fila a escribir o None para eliminarla.
+
+    Raises:
+        Exception: Si ocurre un error al leer o escribir; en ese caso el
+            archivo original queda intacto y se elimina el temporal.
+    """
+    temp_archivo = crear_temporal(archivo)
+    try:
+        with open(archivo, mode='r', newline='') as file, open(temp_archivo, mode='w', newline='') as temp_file:
+            reader = csv.DictReader(file)
+            writer = csv.DictWriter(temp_file, fieldnames=reader.fieldnames)
+            writer.writeheader()
+
+            for row in reader:
+                row = transformar(row)
+                if row is not None:
+                    writer.writerow(row)
+            METRICAS.sumar('filas_examinadas', reader.line_num)
+            METRICAS.sumar('bytes_leidos', os.fstat(file.fileno()).st_size)
+            METRICAS.sumar('bytes_escritos', temp_file.tell())
+
+        reemplazar(temp_archivo, archivo)
+    except Exception:
+        if os.path.exists(temp_archivo):
+            os.remove(temp_archivo)
+        raise
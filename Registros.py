@@ -0,0 +1,176 @@
+from datetime import date
+from functools import lru_cache
+from operator import itemgetter
+from typing import NamedTuple
+
+
+def leer_entero(texto):
+    """Convierte a entero un texto cuyo valor se conserva exacto.
+
+    Los valores que no son enteros canónicos (vacíos, con ceros a la
+    izquierda o con otros caracteres) se conservan como texto.
+    """
+    try:
+        valor = int(texto)
+    except (TypeError, ValueError):
+        return texto
+    return valor if str(valor) == texto else texto
+
+
+@lru_cache(maxsize=65536)
+def leer_fecha(texto):
+    """Convierte a ``date`` un texto con formato YYYY-MM-DD.
+
+    Los registros comparten el mismo objeto para la misma fecha. Los valores
+    que no son fechas canónicas se conservan como texto.
+    """
+    try:
+        valor = date.fromisoformat(texto)
+    except (TypeError, ValueError):
+        return texto
+    return valor if valor.isoformat() == texto else texto
+
+
+def a_texto(valor):
+    """Convierte el valor de un campo al texto con el que se guarda."""
+    if isinstance(valor, date):
+        return valor.isoformat()
+    return "" if valor is None else str(valor)
+
+
+LECTORES = {int: leer_entero, date: leer_fecha}
+
+
+@lru_cache(maxsize=None)
+def posiciones(clase, encabezados):
+    """Posición en ``encabezados`` de cada atributo de un registro."""
+    plegados = [encabezado.casefold() for encabezado in encabezados]
+    return tuple(plegados.index(atributo.casefold()) for atributo in clase.ATRIBUTOS)
+
+
+@lru_cache(maxsize=None)
+def conversiones(clase):
+    """Posición y conversión de cada campo de un registro que no es texto."""
+    return tuple((posicion, LECTORES[tipo]) for posicion, tipo in enumerate(clase.__annotations__.values())
+                 if tipo in LECTORES)
+
+
+def lector(clase, encabezados=None):
+    """Crea la función que convierte filas de texto en registros.
+
+    El orden de las columnas y las conversiones se resuelven una sola vez,
+    para recorrer muchas filas con el menor costo por registro.
+
+    Args:
+        encabezados (list): Columnas de las filas, si su orden no es el de
+            ``ATRIBUTOS``; se comparan sin distinguir mayúsculas y minúsculas.
+
+    Returns:
+        callable: Función que recibe una fila y devuelve el registro con los
+        campos enteros y de fecha ya convertidos.
+
+    Raises:
+        ValueError: Si a los encabezados les falta algún atributo.
+    """
+    ordenar = None
+    if encabezados is not None and tuple(encabezados) != clase.ATRIBUTOS:
+        ordenar = itemgetter(*posiciones(clase, tuple(encabezados)))
+    convertir = conversiones(clase)
+    crear = clase._make
+
+    def leer(fila):
+        valores = list(fila if ordenar is None else ordenar(fila))
+        for posicion, leer_valor in convertir:
+            valores[posicion] = leer_valor(valores[posicion])
+        return crear(valores)
+
+    return leer
+
+
+def desde_fila(clase, fila, encabezados=None):
+    """Crea un registro a partir de una fila de texto.
+
+    Args:
+        fila (list): Valores de la fila.
+        encabezados (list): Columnas de la fila, como en ``lector``.
+
+    Returns:
+        Registro con los campos enteros y de fecha ya convertidos.
+    """
+    return lector(clase, encabezados)(fila)
+
+
+def fila(registro):
+    """Valores del registro como texto, en el orden de ``ATRIBUTOS``."""
+    return [a_texto(valor) for valor in registro]
+
+
+def como_dict(registro):
+    """Registro como diccionario con los nombres de columna y valores de texto."""
+    return dict(zip(registro.ATRIBUTOS, fila(registro)))
+
+
+class RegistroAtleta(NamedTuple):
+    """Registro de un atleta con el ID como entero y la fecha como ``date``.
+
+    Es una tupla con nombre: no guarda un diccionario por registro y sus
+    campos se leen por atributo, por ejemplo ``registro.fecha_de_nacimiento``.
+    """
+
+    id: int
+    nombre: str
+    apellido_paterno: str
+    apellido_materno: str
+    nacionalidad: str
+    fecha_de_nacimiento: date
+    disciplina: str
+    genero: str
+    telefono: str
+    correo: str
+
+    ATRIBUTOS = ('ID', 'Nombre', 'Apellido Paterno', 'Apellido Materno', 'Nacionalidad',
+                 'Fecha de Nacimiento', 'Disciplina', 'Genero', 'Telefono', 'Correo')
+
+    lector = classmethod(lector)
+    desde_fila = classmethod(desde_fila)
+    fila = fila
+    como_dict = como_dict
+
+
+class RegistroEntrenador(NamedTuple):
+    """Registro de un entrenador con el ID como entero y la fecha como ``date``."""
+
+    id: int
+    nombre: str
+    apellido_paterno: str
+    apellido_materno: str
+    nacionalidad: str
+    fecha_de_nacimiento: date
+    atleta: str
+    disciplina: str
+    telefono: str
+    correo: str
+
+    ATRIBUTOS = ('ID', 'Nombre', 'Apellido Paterno', 'Apellido Materno', 'Nacionalidad',
+                 'Fecha de Nacimiento', 'Atleta', 'Disciplina', 'Telefono', 'Correo')
+
+    lector = classmethod(lector)
+    desde_fila = classmethod(desde_fila)
+    fila = fila
+    como_dict = como_dict
+
+
+class RegistroDisciplina(NamedTuple):
+    """Registro de una disciplina, identificada por nombre y categoría."""
+
+    nombre: str
+    categoria: str
+    participantes: str
+    patrocinadores: str
+
+    ATRIBUTOS = ('Nombre', 'Categoria', 'Participantes', 'Patrocinadores')
+
+    lector = classmethod(lector)
+    desde_fila = classmethod(desde_fila)
+    fila = fila
+    como_dict = como_dict
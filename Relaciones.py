@@ -0,0 +1,476 @@
+import threading
+from contextlib import ExitStack, contextmanager
+
+from Resultado import ErrorDeValidacion
+
+POLITICAS = ('restringir', 'cascada')
+
+
+def normalizar_nombre(texto):
+    """Normaliza un nombre para compararlo: sin mayúsculas ni espacios extra."""
+    return " ".join(str(texto).split()).casefold()
+
+
+def separar_nombres(texto):
+    """Separa una lista de nombres escrita como texto libre separado por comas."""
+    return [nombre for nombre in (normalizar_nombre(parte) for parte in str(texto).split(",")) if nombre]
+
+
+def agrupar(indice, clave, valor):
+    """Agrega un valor al grupo de una clave en un índice de grupos.
+
+    Cada grupo es un diccionario con los valores como llaves, que conserva
+    el orden de llegada y permite quitar un valor sin recorrer el grupo.
+    """
+    indice.setdefault(clave, {})[valor] = None
+
+
+def desagrupar(indice, clave, valor):
+    """Quita un valor del grupo de una clave y descarta el grupo si queda vacío."""
+    grupo = indice.get(clave)
+    if grupo is not None:
+        grupo.pop(valor, None)
+        if not grupo:
+            del indice[clave]
+
+
+def formas_de_nombre(nombre, paterno, materno):
+    """Formas con las que se puede referenciar a un atleta: nombre, nombre y
+    apellido paterno, o nombre completo."""
+    nombre, paterno, materno = (normalizar_nombre(parte) for parte in (nombre, paterno, materno))
+    formas = {nombre, f"{nombre} {paterno}".strip(), f"{nombre} {paterno} {materno}".strip()}
+    formas.discard("")
+    return formas
+
+
+class _Mapas:
+    """Agrupaciones calculadas por ``Relaciones`` en una misma lectura."""
+
+    def __init__(self):
+        self.atletas_por_disciplina = {}
+        self.atletas_por_nombre = {}
+        self.nombres_por_atleta = {}
+        self.entrenadores_por_disciplina = {}
+        self.entrenadores_por_atleta = {}
+        self.atleta_de_entrenador = {}
+        self.disciplinas = {}
+        self.disciplinas_por_participante = {}
+
+
+class Relaciones:
+    """Índice de las relaciones entre atletas, entrenadores y disciplinas.
+
+    Las relaciones se guardan como texto en los registros: ``Atleta.Disciplina``
+    y ``Entrenador.Disciplina`` contienen el nombre de una disciplina,
+    ``Entrenador.Atleta`` el nombre de un atleta (solo el nombre, el nombre con
+    el apellido paterno o el nombre completo) y ``Disciplina.Participantes``
+    una lista de nombres separados por comas. El índice agrupa los registros
+    por esos valores, sin distinguir mayúsculas y minúsculas, para resolver
+    las uniones sin recorrer los archivos de forma anidada. Las escrituras
+    de las entidades lo actualizan registro por registro dentro de
+    ``escritura``; se reconstruye por completo solo cuando la firma de algún
+    almacenamiento cambia por fuera de las entidades.
+
+    Al crearse, el índice se asocia a las tres entidades. Si ``validar`` es
+    True, las altas y ediciones de atletas y entrenadores rechazan las
+    referencias a disciplinas o atletas que no existen. Al eliminar un
+    registro referenciado, la política 'restringir' impide la baja y la
+    política 'cascada' elimina también los registros que lo referencian,
+    después de que la baja del registro referenciado se hizo.
+
+    Attributes:
+        atletas (Atleta): Entidad de atletas.
+        entrenadores (Entrenador): Entidad de entrenadores.
+        disciplinas (Disciplina): Entidad de disciplinas.
+        validar (bool): Si se validan las referencias en altas y ediciones.
+        al_eliminar (str): Política de bajas, 'restringir' o 'cascada'.
+    """
+
+    atletas = None
+    entrenadores = None
+    disciplinas = None
+    validar = True
+    al_eliminar = 'restringir'
+
+    def __init__(self, atletas, entrenadores, disciplinas, validar=True, al_eliminar='restringir'):
+        """Crea el índice y lo asocia a las tres entidades.
+
+        Args:
+            atletas (Atleta): Entidad de atletas.
+            entrenadores (Entrenador): Entidad de entrenadores.
+            disciplinas (Disciplina): Entidad de disciplinas.
+            validar (bool): Si se validan las referencias en altas y ediciones.
+            al_eliminar (str): 'restringir' o 'cascada'.
+
+        Raises:
+            ValueError: Si la política de bajas no existe.
+        """
+        if al_eliminar not in POLITICAS:
+            raise ValueError(f"La política {al_eliminar} no existe; usa una de {list(POLITICAS)}.")
+        self.atletas = atletas
+        self.entrenadores = entrenadores
+        self.disciplinas = disciplinas
+        self.validar = validar
+        self.al_eliminar = al_eliminar
+        self.__candado = threading.Lock()
+        self.__firmas = None
+        self.__mapas = None
+        for entidad in (atletas, entrenadores, disciplinas):
+            entidad.relaciones = self
+
+    @staticmethod
+    def __posicion(encabezados, campo):
+        """Posición de una columna, sin distinguir mayúsculas y minúsculas."""
+        for posicion, encabezado in enumerate(encabezados):
+            if encabezado.casefold() == campo.casefold():
+                return posicion
+        raise ValueError(f"El campo {campo} no existe.")
+
+    def __columnas(self, entidad):
+        """Posiciones de las columnas que usa el índice en las filas de una entidad."""
+        if entidad is self.atletas:
+            campos = ('ID', 'Disciplina', 'Nombre', 'Apellido Paterno', 'Apellido Materno')
+        elif entidad is self.entrenadores:
+            campos = ('ID', 'Disciplina', 'Atleta')
+        else:
+            campos = ('Nombre', 'Categoria', 'Participantes')
+        encabezados = entidad.almacen.encabezados
+        return [self.__posicion(encabezados, campo) for campo in campos]
+
+    def __aplicar(self, mapas, entidad, columnas, fila, cambiar):
+        """Agrega o quita las relaciones de una fila.
+
+        Args:
+            mapas (_Mapas): Agrupaciones a modificar.
+            entidad (Entidad): Entidad de la fila.
+            columnas (list): Posiciones obtenidas con ``__columnas``.
+            fila (list): Valores de la fila.
+            cambiar (callable): ``agrupar`` o ``desagrupar``.
+        """
+        if entidad is self.atletas:
+            id, disciplina, nombre, paterno, materno = (fila[posicion] for posicion in columnas)
+            cambiar(mapas.atletas_por_disciplina, normalizar_nombre(disciplina), id)
+            formas = formas_de_nombre(nombre, paterno, materno)
+            for forma in formas:
+                cambiar(mapas.atletas_por_nombre, forma, id)
+            if cambiar is agrupar:
+                mapas.nombres_por_atleta[id] = formas
+            else:
+                mapas.nombres_por_atleta.pop(id, None)
+        elif entidad is self.entrenadores:
+            id, disciplina, atleta = (fila[posicion] for posicion in columnas)
+            atleta = normalizar_nombre(atleta)
+            cambiar(mapas.entrenadores_por_disciplina, normalizar_nombre(disciplina), id)
+            cambiar(mapas.entrenadores_por_atleta, atleta, id)
+            if cambiar is agrupar:
+                mapas.atleta_de_entrenador[id] = atleta
+            else:
+                mapas.atleta_de_entrenador.pop(id, None)
+        else:
+            nombre, categoria, participantes = (fila[posicion] for posicion in columnas)
+            clave = (nombre, categoria)
+            cambiar(mapas.disciplinas, normalizar_nombre(nombre), clave)
+            for participante in separar_nombres(participantes):
+                cambiar(mapas.disciplinas_por_participante, participante, clave)
+
+    def __leer(self):
+        """Lee los tres almacenamientos y agrupa sus relaciones.
+
+        Returns:
+            _Mapas: Agrupaciones calculadas.
+        """
+        mapas = _Mapas()
+        for entidad in (self.atletas, self.entrenadores, self.disciplinas):
+            columnas = self.__columnas(entidad)
+            for fila in entidad.almacen.filas():
+                self.__aplicar(mapas, entidad, columnas, fila, agrupar)
+        return mapas
+
+    def __vigentes(self):
+        """Agrupaciones que corresponden al contenido actual de las entidades.
+
+        Los almacenamientos se leen sin tener el candado del índice, porque
+        las entidades consultan el índice mientras tienen su propio bloqueo.
+        Quien recorra los grupos debe hacerlo con el candado tomado, porque
+        ``escritura`` los modifica.
+
+        Returns:
+            _Mapas: Agrupaciones vigentes.
+        """
+        firmas = (self.atletas.almacen.firma(), self.entrenadores.almacen.firma(),
+                  self.disciplinas.almacen.firma())
+        with self.__candado:
+            if firmas == self.__firmas:
+                return self.__mapas
+        mapas = self.__leer()
+        with self.__candado:
+            self.__firmas = firmas
+            self.__mapas = mapas
+        return mapas
+
+    @contextmanager
+    def escritura(self, entidad, claves=()):
+        """Rodea una escritura de una entidad para actualizar el índice sin releerlo.
+
+        Antes de escribir se leen las filas de los registros indicados y al
+        terminar se vuelven a leer; sus relaciones anteriores se quitan y las
+        nuevas se agregan, y se registra la firma nueva del almacenamiento.
+        Si el índice no estaba vigente para la entidad, o si la escritura
+        falla, no se modifica y se reconstruye en el siguiente uso.
+
+        Debe usarse con el bloqueo exclusivo del almacenamiento de la entidad.
+
+        Args:
+            entidad (Entidad): Entidad que escribe.
+            claves (list): Valores de la clave de cada registro que se agrega,
+                edita o elimina.
+        """
+        almacen = entidad.almacen
+        numero = (self.atletas, self.entrenadores, self.disciplinas).index(entidad)
+        antes = almacen.firma()
+        anteriores = [almacen.obtener_fila(*valores) for valores in claves]
+        yield
+        nuevas = [almacen.obtener_fila(*valores) for valores in claves]
+        despues = almacen.firma()
+        with self.__candado:
+            if self.__firmas is None or self.__firmas[numero] != antes:
+                return
+            columnas = self.__columnas(entidad)
+            for fila in anteriores:
+                if fila is not None:
+                    self.__aplicar(self.__mapas, entidad, columnas, fila, desagrupar)
+            for fila in nuevas:
+                if fila is not None:
+                    self.__aplicar(self.__mapas, entidad, columnas, fila, agrupar)
+            self.__firmas = self.__firmas[:numero] + (despues,) + self.__firmas[numero + 1:]
+
+    @contextmanager
+    def bloqueo(self, entidad):
+        """Bloqueo para escribir en una entidad verificando sus referencias.
+
+        Toma el bloqueo ``referenciado`` de las entidades que la entidad
+        referencia y después su bloqueo exclusivo, siguiendo el orden de
+        bloqueo entre entidades: disciplinas, atletas y entrenadores. Así
+        nadie elimina una disciplina o un atleta entre la verificación de
+        una referencia y la escritura, y nadie agrega una referencia a un
+        registro mientras su baja revisa quién lo referencia.
+
+        Args:
+            entidad (Entidad): Entidad en la que se escribe.
+        """
+        if entidad is self.atletas:
+            referenciadas = [self.disciplinas]
+        elif entidad is self.entrenadores:
+            referenciadas = [self.disciplinas, self.atletas]
+        else:
+            referenciadas = []
+        with ExitStack() as bloqueos:
+            for referenciada in referenciadas:
+                bloqueos.enter_context(referenciada.almacen.referenciado())
+            bloqueos.enter_context(entidad.almacen.exclusivo())
+            yield
+
+    def __registros(self, entidad, claves):
+        """Obtiene los registros de una entidad a partir de sus claves."""
+        registros = []
+        for clave in dict.fromkeys(claves):
+            registro = entidad.almacen.obtener(*clave) if isinstance(clave, tuple) else entidad.almacen.obtener(clave)
+            if registro is not None:
+                registros.append(registro)
+        return registros
+
+    # Uniones
+
+    def atletas_por_disciplina(self, disciplina):
+        """Atletas cuya disciplina es la indicada.
+
+        Returns:
+            list: Registros de los atletas como diccionarios.
+        """
+        mapas = self.__vigentes()
+        with self.__candado:
+            ids = list(mapas.atletas_por_disciplina.get(normalizar_nombre(disciplina), ()))
+        return self.__registros(self.atletas, ids)
+
+    def entrenadores_por_disciplina(self, disciplina):
+        """Entrenadores cuya disciplina es la indicada."""
+        mapas = self.__vigentes()
+        with self.__candado:
+            ids = list(mapas.entrenadores_por_disciplina.get(normalizar_nombre(disciplina), ()))
+        return self.__registros(self.entrenadores, ids)
+
+    def entrenadores_de_atletas_en(self, disciplina):
+        """Entrenadores que entrenan a algún atleta de la disciplina indicada."""
+        mapas = self.__vigentes()
+        ids = []
+        with self.__candado:
+            for atleta in mapas.atletas_por_disciplina.get(normalizar_nombre(disciplina), ()):
+                for forma in mapas.nombres_por_atleta.get(atleta, ()):
+                    ids.extend(mapas.entrenadores_por_atleta.get(forma, ()))
+        return self.__registros(self.entrenadores, ids)
+
+    def entrenadores_de_atleta(self, id):
+        """Entrenadores que tienen registrado al atleta con el ID indicado."""
+        mapas = self.__vigentes()
+        ids = []
+        with self.__candado:
+            for forma in mapas.nombres_por_atleta.get(str(id), ()):
+                ids.extend(mapas.entrenadores_por_atleta.get(forma, ()))
+        return self.__registros(self.entrenadores, ids)
+
+    def atletas_de_entrenador(self, id):
+        """Atletas que corresponden al nombre registrado en un entrenador."""
+        mapas = self.__vigentes()
+        with self.__candado:
+            atleta = mapas.atleta_de_entrenador.get(str(id))
+            ids = list(mapas.atletas_por_nombre.get(atleta, ())) if atleta else []
+        return self.__registros(self.atletas, ids)
+
+    def disciplinas_de_participante(self, nombre):
+        """Disciplinas que mencionan el nombre indicado entre sus participantes."""
+        mapas = self.__vigentes()
+        with self.__candado:
+            claves = list(mapas.disciplinas_por_participante.get(normalizar_nombre(nombre), ()))
+        return self.__registros(self.disciplinas, claves)
+
+    # Integridad referencial
+
+    def __existe_disciplina(self, nombre):
+        return normalizar_nombre(nombre) in self.__vigentes().disciplinas
+
+    def __existe_atleta(self, nombre):
+        return normalizar_nombre(nombre) in self.__vigentes().atletas_por_nombre
+
+    def error_de_campo(self, entidad, campo, valor):
+        """Verifica que un valor no apunte a un registro inexistente.
+
+        Debe llamarse dentro de ``bloqueo`` de la entidad, para que la
+        referencia siga siendo válida al escribir.
+
+        Args:
+            entidad (Entidad): Entidad que se quiere modificar.
+            campo (str): Campo que se asigna.
+            valor (str): Valor nuevo del campo.
+
+        Returns:
+            str: Mensaje que describe el problema, o None si la referencia es válida.
+        """
+        if not self.validar:
+            return None
+        campo = campo.casefold()
+        if entidad in (self.atletas, self.entrenadores) and campo == 'disciplina':
+            if not self.__existe_disciplina(valor):
+                return f"La disciplina {valor} no está registrada."
+        if entidad is self.entrenadores and campo == 'atleta':
+            if not self.__existe_atleta(valor):
+                return f"El atleta {valor} no está registrado."
+        return None
+
+    def error_de_referencias(self, entidad, datos):
+        """Verifica las referencias de un registro nuevo.
+
+        Args:
+            entidad (Entidad): Entidad a la que se agrega el registro.
+            datos (list): Datos del registro en el orden de ``atributos``.
+
+        Returns:
+            ErrorDeValidacion: El primer problema, o None si todas las
+            referencias son válidas.
+        """
+        if not self.validar or len(datos) != len(entidad.atributos):
+            return None
+        for campo, valor in zip(entidad.atributos, datos):
+            error = self.error_de_campo(entidad, campo, valor)
+            if error is not None:
+                return ErrorDeValidacion(campo, error)
+        return None
+
+    def __dependientes(self, mapas, entidad, clave, eliminadas):
+        """Registros de otras entidades que referencian al indicado.
+
+        Args:
+            mapas (_Mapas): Agrupaciones vigentes.
+            entidad (Entidad): Entidad del registro.
+            clave: ID, o tupla (nombre, categoria) para disciplinas.
+            eliminadas (set): Claves normalizadas de toda la baja.
+
+        Returns:
+            list: Tuplas (entidad, ids) con los registros dependientes.
+        """
+        if entidad is self.disciplinas:
+            # Una disciplina solo deja de existir si se eliminan todas sus categorías.
+            nombre = normalizar_nombre(clave[0])
+            categorias = [categoria for _, categoria in mapas.disciplinas.get(nombre, ())]
+            if not all((nombre, categoria.casefold()) in eliminadas for categoria in categorias):
+                return []
+            return [(self.atletas, list(mapas.atletas_por_disciplina.get(nombre, ()))),
+                    (self.entrenadores, list(mapas.entrenadores_por_disciplina.get(nombre, ())))]
+        if entidad is self.atletas:
+            entrenadores = []
+            for forma in mapas.nombres_por_atleta.get(str(clave), ()):
+                # Otro atleta con el mismo nombre mantiene válida la referencia.
+                if eliminadas.issuperset(mapas.atletas_por_nombre.get(forma, ())):
+                    entrenadores.extend(mapas.entrenadores_por_atleta.get(forma, ()))
+            return [(self.entrenadores, entrenadores)]
+        return []
+
+    def antes_de_eliminar(self, entidad, claves):
+        """Aplica la política de bajas antes de eliminar registros.
+
+        Con 'restringir' reporta los registros que están referenciados. Con
+        'cascada' reúne los registros que dependen de cada uno de los
+        indicados, que ``eliminar_dependientes`` elimina una vez hecha la
+        baja. Debe llamarse dentro de ``bloqueo`` de la entidad, para que
+        nadie agregue una referencia a los registros entre esta revisión y
+        la baja.
+
+        Args:
+            entidad (Entidad): Entidad de la que se eliminan registros.
+            claves (list): IDs, o tuplas (nombre, categoria) para disciplinas.
+
+        Returns:
+            tuple: Mensaje por cada clave cuya baja no está permitida, y
+            los registros dependientes de cada clave, como tuplas
+            (entidad, ids), que hay que eliminar en cascada.
+        """
+        if entidad is self.entrenadores:
+            return {}, {}
+        mapas = self.__vigentes()
+        if entidad is self.disciplinas:
+            eliminadas = {(normalizar_nombre(nombre), str(categoria).casefold()) for nombre, categoria in claves}
+        else:
+            eliminadas = {str(clave) for clave in claves}
+        bloqueadas = {}
+        cascada = {}
+        for clave in claves:
+            with self.__candado:
+                dependientes = [(dependiente, ids) for dependiente, ids
+                                in self.__dependientes(mapas, entidad, clave, eliminadas) if ids]
+            if not dependientes:
+                continue
+            if self.al_eliminar == 'restringir':
+                descripcion = ", ".join(
+                    f"{len(ids)} {'atleta(s)' if dependiente is self.atletas else 'entrenador(es)'}"
+                    for dependiente, ids in dependientes)
+                bloqueadas[clave] = f"No es posible eliminar: lo referencian {descripcion}."
+            else:
+                cascada[clave] = dependientes
+        return bloqueadas, cascada
+
+    def eliminar_dependientes(self, cascada, claves):
+        """Elimina en cascada los registros que dependían de los ya eliminados.
+
+        Debe llamarse después de la baja y con el bloqueo exclusivo de la
+        entidad todavía tomado, para que nadie vuelva a referenciar los
+        registros eliminados entre la baja y la cascada.
+
+        Args:
+            cascada (dict): Dependientes de cada clave, de ``antes_de_eliminar``.
+            claves (list): Claves que efectivamente se eliminaron.
+        """
+        pendientes = {}
+        for clave in claves:
+            for dependiente, ids in cascada.get(clave, ()):
+                pendientes.setdefault(dependiente, {}).update(dict.fromkeys(ids))
+        for dependiente, ids in pendientes.items():
+            dependiente.eliminar_lote(list(ids))
@@ -0,0 +1,43 @@
+from typing import NamedTuple
+
+
+class ErrorDeValidacion(NamedTuple):
+    """Problema encontrado al validar un dato.
+
+    Attributes:
+        campo (str): Atributo con el valor inválido, o None si el problema
+            es del registro completo (por ejemplo, un número incorrecto de datos).
+        mensaje (str): Descripción del problema para el usuario.
+    """
+
+    campo: str
+    mensaje: str
+
+    def __str__(self):
+        return self.mensaje
+
+
+class Resultado(NamedTuple):
+    """Resultado de una operación de una entidad.
+
+    Las entidades no imprimen: devuelven un resultado y quien las llama
+    decide si lo muestra (ver ``Presentacion``), lo convierte a JSON o solo
+    revisa si tuvo éxito. Un resultado se evalúa como verdadero si la
+    operación tuvo éxito.
+
+    Attributes:
+        exito (bool): True si la operación se realizó.
+        mensaje (str): Descripción del resultado para el usuario.
+        clave: ID, o tupla (nombre, categoria), del registro afectado.
+        registro: Registro tipado agregado o consultado, si lo hay.
+        errores (tuple): ``ErrorDeValidacion`` que impidieron la operación.
+    """
+
+    exito: bool
+    mensaje: str
+    clave: object = None
+    registro: object = None
+    errores: tuple = ()
+
+    def __bool__(self):
+        return self.exito
@@ -0,0 +1,338 @@
+"""Servicio HTTP/JSON sobre las entidades, construido con asyncio.
+
+El proceso mantiene una sola instancia (y por lo tanto un solo índice en
+memoria) de cada entidad. Las lecturas se resuelven en un grupo de hilos,
+de modo que el bucle de eventos nunca espera a una consulta; las
+escrituras pasan por una cola que las aplica de una en una en un hilo
+propio, en el orden en que llegaron.
+
+Rutas (``<entidad>`` es atletas, entrenadores o disciplinas y ``<clave>`` es
+el ID, o nombre y categoría para las disciplinas)::
+
+    GET    /salud
+    GET    /metricas?formato=json|prometheus              ver ``Instrumentacion``
+    GET    /<entidad>?Campo=valor&campos=A,B&limite=N    búsqueda por igualdad
+    POST   /<entidad>/buscar   {"filtros": {...} o [{...}, ...], "campos": [...], "limite": N,
+                                "por_edad": "jovenes"|"mayores"}
+    GET    /<entidad>/<clave>                             consulta
+    POST   /<entidad>          [valores] o {atributo: valor}
+    PATCH  /<entidad>/<clave>  {campo: valor, ...}
+    DELETE /<entidad>/<clave>
+
+Cada respuesta es un objeto JSON con las llaves 'exito', 'mensajes',
+'errores' y 'resultado', como las del modo guion de ``Consola``; solo
+``/metricas?formato=prometheus`` responde en texto plano.
+
+Uso:
+    python Servidor.py --puerto 8080
+    python Servidor.py --almacenamiento sqlite
+"""
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from Consola import ENTIDADES, Consola
+from Instrumentacion import METRICAS
+from Presentacion import a_json
+
+TAMANO_MAXIMO_CUERPO = 1024 * 1024
+
+
+class ErrorHTTP(Exception):
+    """Error que se responde al cliente con un código HTTP.
+
+    Attributes:
+        estado (HTTPStatus): Código de la respuesta.
+    """
+
+    estado = HTTPStatus.BAD_REQUEST
+
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+def respuesta(exito, mensajes=(), resultado=None, errores=()):
+    """Cuerpo JSON de una respuesta."""
+    return {'exito': exito, 'mensajes': list(mensajes), 'errores': list(errores), 'resultado': resultado}
+
+
+def combinar(resultados):
+    """Cuerpo JSON de una operación por lotes: éxito si todos los elementos lo tuvieron."""
+    respuestas = [a_json(resultado) for resultado in resultados]
+    return respuesta(all(r['exito'] for r in respuestas),
+                     [mensaje for r in respuestas for mensaje in r['mensajes']],
+                     errores=[error for r in respuestas for error in r['errores']])
+
+
+class Servidor:
+    """Servidor HTTP/JSON con lecturas concurrentes y escrituras en cola.
+
+    Attributes:
+        consola (Consola): Dueña de la única instancia de cada entidad.
+        lectores (int): Hilos que atienden las lecturas.
+        tamano_cola (int): Escrituras que pueden esperar en la cola; cuando
+            se llena, quien escribe espera a que haya lugar.
+    """
+
+    consola = None
+    lectores = 8
+    tamano_cola = 1024
+
+    def __init__(self, almacenamiento=None, modo='reescritura', lectores=8, tamano_cola=1024):
+        """Inicializa el servidor y carga las entidades.
+
+        Args:
+            almacenamiento (str): 'csv', 'sqlite' o None para el configurado.
+            modo (str): 'reescritura' o 'bitacora'.
+            lectores (int): Hilos que atienden las lecturas.
+            tamano_cola (int): Escrituras que pueden esperar en la cola.
+        """
+        self.consola = Consola(almacenamiento, modo)
+        self.lectores = lectores
+        self.tamano_cola = tamano_cola
+        for nombre in ENTIDADES:
+            self.consola.entidad(nombre)
+        self.__hilos_lectura = ThreadPoolExecutor(lectores, thread_name_prefix="lector")
+        self.__hilo_escritura = ThreadPoolExecutor(1, thread_name_prefix="escritor")
+        self.__cola = None
+
+    async def __escritor(self):
+        """Aplica las escrituras de la cola, una a la vez y en orden."""
+        bucle = asyncio.get_running_loop()
+        while True:
+            escritura, futuro = await self.__cola.get()
+            try:
+                resultado = await bucle.run_in_executor(self.__hilo_escritura, escritura)
+            except Exception as e:
+                if not futuro.cancelled():
+                    futuro.set_exception(e)
+            else:
+                if not futuro.cancelled():
+                    futuro.set_result(resultado)
+            finally:
+                self.__cola.task_done()
+
+    async def leer(self, funcion, *argumentos):
+        """Ejecuta una lectura en el grupo de hilos de lectura."""
+        return await asyncio.get_running_loop().run_in_executor(self.__hilos_lectura, funcion, *argumentos)
+
+    async def escribir(self, funcion):
+        """Encola una escritura y espera su resultado.
+
+        Args:
+            funcion (callable): Función sin argumentos que hace la escritura
+                y devuelve el cuerpo de la respuesta.
+
+        Returns:
+            dict: Cuerpo de la respuesta.
+        """
+        def escritura():
+            try:
+                return funcion()
+            except Exception as e:
+                return respuesta(False, [f"Error al escribir: {e}"])
+
+        futuro = asyncio.get_running_loop().create_future()
+        await self.__cola.put((escritura, futuro))
+        return await futuro
+
+    def __clave(self, nombre, segmentos):
+        """Valida que los segmentos de la ruta formen la clave de la entidad."""
+        if len(segmentos) != len(ENTIDADES[nombre][1]):
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"La clave de {nombre} tiene {len(ENTIDADES[nombre][1])} partes.")
+        return segmentos
+
+    async def atender(self, metodo, ruta, cuerpo):
+        """Resuelve una petición ya leída.
+
+        Args:
+            metodo (str): Método HTTP.
+            ruta (str): Ruta con la cadena de consulta.
+            cuerpo (object): Cuerpo JSON ya decodificado, o None.
+
+        Returns:
+            tuple: (HTTPStatus, dict) con el código y el cuerpo de la respuesta;
+            el cuerpo es texto (str) solo en las métricas en formato Prometheus.
+        """
+        partes = urlsplit(ruta)
+        segmentos = [unquote(segmento) for segmento in partes.path.split('/') if segmento]
+        if segmentos == ['salud'] and metodo == 'GET':
+            return HTTPStatus.OK, respuesta(True, ["Servicio disponible."])
+        if segmentos == ['metricas'] and metodo == 'GET':
+            if dict(parse_qsl(partes.query)).get('formato') == 'prometheus':
+                return HTTPStatus.OK, METRICAS.como_prometheus()
+            return HTTPStatus.OK, respuesta(True, [], METRICAS.como_dict())
+        if not segmentos or segmentos[0] not in ENTIDADES:
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"No existe la ruta {partes.path}.")
+        nombre, resto = segmentos[0], segmentos[1:]
+        entidad = self.consola.entidad(nombre)
+
+        if not resto and metodo == 'GET':
+            parametros = dict(parse_qsl(partes.query))
+            limite = parametros.pop('limite', None)
+            campos = parametros.pop('campos', None)
+            return await self.__buscar(entidad, parametros, campos.split(',') if campos else None,
+                                       int(limite) if limite is not None else None)
+        if resto == ['buscar'] and metodo == 'POST':
+            cuerpo = cuerpo or {}
+            filtros = cuerpo.get('filtros') or {}
+            alternativas = filtros if isinstance(filtros, list) else [filtros]
+            if not all(isinstance(alternativa, dict) for alternativa in alternativas):
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Los filtros deben ser un objeto o una lista de objetos.")
+            filtros = [{campo: tuple(valor) if isinstance(valor, list) else valor
+                        for campo, valor in alternativa.items()} for alternativa in alternativas]
+            por_edad = cuerpo.get('por_edad')
+            if por_edad is not None and (por_edad not in ('jovenes', 'mayores')
+                                         or entidad.ESQUEMA.nacimiento is None):
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST,
+                                "por_edad debe ser 'jovenes' o 'mayores' y solo aplica a atletas y entrenadores.")
+            return await self.__buscar(entidad, filtros, cuerpo.get('campos'), cuerpo.get('limite'), por_edad)
+        if not resto and metodo == 'POST':
+            if isinstance(cuerpo, dict):
+                cuerpo = [cuerpo.get(atributo, "") for atributo in entidad.atributos]
+            if not isinstance(cuerpo, list):
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "El cuerpo debe ser una lista o un objeto con los atributos.")
+            resultado = await self.escribir(lambda: a_json(entidad.agregar_datos(cuerpo)))
+            return HTTPStatus.CREATED if resultado['exito'] else HTTPStatus.CONFLICT, resultado
+        if not resto:
+            raise ErrorHTTP(HTTPStatus.METHOD_NOT_ALLOWED, f"Método {metodo} no permitido en /{nombre}.")
+
+        clave = self.__clave(nombre, resto)
+        if metodo == 'GET':
+            resultado = a_json(await self.leer(entidad.consultar_datos, *clave))
+            return HTTPStatus.OK if resultado['exito'] else HTTPStatus.NOT_FOUND, resultado
+        if metodo == 'PATCH':
+            if not isinstance(cuerpo, dict) or not cuerpo:
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "El cuerpo debe ser un objeto {campo: valor}.")
+            cambios = [(*clave, campo, valor) for campo, valor in cuerpo.items()]
+            resultado = await self.escribir(lambda: combinar(entidad.editar_lote(cambios)))
+            return HTTPStatus.OK if resultado['exito'] else HTTPStatus.UNPROCESSABLE_ENTITY, resultado
+        if metodo == 'DELETE':
+            objetivo = tuple(clave) if len(clave) > 1 else clave[0]
+            resultado = await self.escribir(lambda: combinar(entidad.eliminar_lote([objetivo])))
+            return HTTPStatus.OK if resultado['exito'] else HTTPStatus.CONFLICT, resultado
+        raise ErrorHTTP(HTTPStatus.METHOD_NOT_ALLOWED, f"Método {metodo} no permitido.")
+
+    async def __buscar(self, entidad, filtros, campos, limite, por_edad=None):
+        """Ejecuta una búsqueda en el grupo de hilos de lectura, ordenada por edad si se pide."""
+        def buscar():
+            if por_edad is None:
+                return list(entidad.buscar(filtros, campos, limite))
+            return list(entidad.ordenar_por_edad(filtros, campos, limite, mayores_primero=por_edad == 'mayores'))
+
+        try:
+            registros = await self.leer(buscar)
+        except ValueError as e:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, str(e))
+        return HTTPStatus.OK, respuesta(True, [f"Se encontraron {len(registros)} registros."], registros)
+
+    async def __leer_peticion(self, lector):
+        """Lee una petición HTTP/1.1; devuelve None si el cliente cerró la conexión."""
+        linea = await lector.readline()
+        if not linea:
+            return None
+        try:
+            metodo, ruta, version = linea.decode('latin-1').split()
+        except ValueError:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Línea de petición inválida.")
+        encabezados = {}
+        while True:
+            linea = await lector.readline()
+            if linea in (b'\r\n', b'\n', b''):
+                break
+            nombre, _, valor = linea.decode('latin-1').partition(':')
+            encabezados[nombre.strip().lower()] = valor.strip()
+        longitud = int(encabezados.get('content-length', '0') or '0')
+        if longitud > TAMANO_MAXIMO_CUERPO:
+            raise ErrorHTTP(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "El cuerpo es demasiado grande.")
+        cuerpo = None
+        if longitud:
+            try:
+                cuerpo = json.loads(await lector.readexactly(longitud))
+            except ValueError:
+                raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "El cuerpo no es JSON válido.")
+        mantener = encabezados.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+        return metodo.upper(), ruta, cuerpo, mantener
+
+    async def conexion(self, lector, escritor):
+        """Atiende las peticiones de una conexión hasta que el cliente la cierra."""
+        try:
+            while True:
+                mantener = False
+                try:
+                    peticion = await self.__leer_peticion(lector)
+                    if peticion is None:
+                        break
+                    metodo, ruta, cuerpo, mantener = peticion
+                    estado, contenido = await self.atender(metodo, ruta, cuerpo)
+                except ErrorHTTP as e:
+                    estado, contenido = e.estado, respuesta(False, [str(e)])
+                except ValueError as e:
+                    estado, contenido = HTTPStatus.BAD_REQUEST, respuesta(False, [str(e)])
+                except Exception as e:
+                    estado, contenido = HTTPStatus.INTERNAL_SERVER_ERROR, respuesta(False, [f"Error interno: {e}"])
+                if isinstance(contenido, str):
+                    datos, tipo = contenido.encode('utf-8'), "text/plain; version=0.0.4"
+                else:
+                    datos, tipo = json.dumps(contenido, ensure_ascii=False).encode('utf-8'), "application/json"
+                escritor.write(f"HTTP/1.1 {estado.value} {estado.phrase}\r\n"
+                               f"Content-Type: {tipo}; charset=utf-8\r\n"
+                               f"Content-Length: {len(datos)}\r\n"
+                               f"Connection: {'keep-alive' if mantener else 'close'}\r\n\r\n".encode('latin-1') + datos)
+                await escritor.drain()
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    async def servir(self, host='127.0.0.1', puerto=8080, listo=None):
+        """Atiende conexiones hasta que se cancela la tarea.
+
+        Args:
+            host (str): Dirección en la que se escucha.
+            puerto (int): Puerto; 0 para que el sistema elija uno libre.
+            listo (callable): Función que recibe el puerto en cuanto el
+                servidor acepta conexiones.
+        """
+        self.__cola = asyncio.Queue(self.tamano_cola)
+        escritor = asyncio.create_task(self.__escritor())
+        servidor = await asyncio.start_server(self.conexion, host, puerto)
+        try:
+            if listo is not None:
+                listo(servidor.sockets[0].getsockname()[1])
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            escritor.cancel()
+            self.__hilos_lectura.shutdown(wait=False)
+            self.__hilo_escritura.shutdown(wait=True)
+
+
+def main(argv=None):
+    """Punto de entrada para ``python Servidor.py``."""
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON de atletas, entrenadores y disciplinas.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8080, help="Puerto; 0 para elegir uno libre.")
+    parser.add_argument('--almacenamiento', choices=['csv', 'sqlite'], default=None)
+    parser.add_argument('--modo', choices=['reescritura', 'bitacora'], default='reescritura')
+    parser.add_argument('--lectores', type=int, default=8, help="Hilos que atienden las lecturas.")
+    argumentos = parser.parse_args(argv)
+
+    servidor = Servidor(argumentos.almacenamiento, argumentos.modo, argumentos.lectores)
+    listo = lambda puerto: print(f"Servidor escuchando en http://{argumentos.host}:{puerto}", flush=True)
+    try:
+        asyncio.run(servidor.servir(argumentos.host, argumentos.puerto, listo))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,583 @@
+import inspect
+from contextlib import nullcontext
+
+from Agregacion import resumir
+from CacheLRU import CacheLRU
+from Configuracion import TAMANO_CACHE, crear_almacenamiento
+from Consulta import Consulta, fecha
+from Entidad import Entidad
+from Registros import a_texto
+from Resultado import ErrorDeValidacion, Resultado
+from ValidadorDeDatos import VALIDADOR
+
+
+class Tabla(Entidad, instrumentar=False):
+    """Motor genérico de las entidades, definido por un ``Esquema``.
+
+    Cada entidad es una subclase que solo declara su ``ESQUEMA``: columnas,
+    clave, columnas opcionales, validadores, separadores e índices. Todas
+    comparten las mismas operaciones de alta, consulta, búsqueda, edición y
+    baja, con las reglas de validación y las posiciones de columna que el
+    esquema compiló una sola vez, y un único camino de lectura y reescritura
+    en el almacenamiento.
+
+    Las operaciones sobre un registro reciben los valores de su clave como
+    argumentos sueltos, por ejemplo ``consultar_datos(id)`` o
+    ``consultar_datos(nombre, categoria)``. Al definir una subclase, sus
+    métodos públicos se instrumentan con el nombre de la entidad, por
+    ejemplo "Atleta.agregar_datos".
+
+    Attributes:
+        ESQUEMA (Esquema): Definición de la tabla; la declara cada subclase.
+        INDICES (list): Columnas con índice secundario, tomadas del esquema.
+        FECHAS (list): Columnas de fecha con índice ordenado, tomadas del esquema.
+        TEXTO (list): Columnas con índice de trigramas, tomadas del esquema.
+        archivo (str): Ruta al archivo CSV donde se almacenan los datos.
+        atributos (list): Columnas de la entidad, en orden.
+        almacen (Almacenamiento): Almacenamiento (CSV o SQLite) donde se
+            guardan los registros.
+        relaciones (Relaciones): Índice de relaciones que valida las
+            referencias y aplica la política de bajas, o None si no se usa.
+        cache (CacheLRU): Caché de los registros consultados por clave.
+        recuperaciones (list): Operaciones interrumpidas que se recuperaron
+            al crear la entidad.
+    """
+
+    ESQUEMA = None
+    INDICES = []
+    FECHAS = []
+    TEXTO = []
+
+    archivo = ""
+    atributos = []
+    almacen = None
+    relaciones = None
+    cache = None
+    recuperaciones = []
+
+    def __init_subclass__(cls, **kwargs):
+        # Los métodos públicos se copian en la subclase para que Entidad los
+        # instrumente con el nombre de la entidad y no con el de Tabla.
+        for nombre, atributo in vars(Tabla).items():
+            if not nombre.startswith('_') and inspect.isfunction(atributo) and nombre not in vars(cls):
+                setattr(cls, nombre, atributo)
+        if cls.ESQUEMA is not None:
+            cls.INDICES = list(cls.ESQUEMA.indices)
+            cls.FECHAS = list(cls.ESQUEMA.fechas)
+            cls.TEXTO = list(cls.ESQUEMA.texto)
+        super().__init_subclass__(**kwargs)
+
+    def __init__(self, modo='reescritura', umbral_bitacora=1024 * 1024, almacenamiento=None, tamano_cache=None):
+        """Crea el almacenamiento configurado para el esquema de la entidad.
+
+        Args:
+            modo (str): Con almacenamiento CSV, 'reescritura' para que cada
+                edición o baja reescriba el archivo, o 'bitacora' para anexar
+                los cambios a una bitácora que se compacta al superar
+                ``umbral_bitacora``.
+            umbral_bitacora (int): Tamaño en bytes de la bitácora a partir del
+                cual se compacta.
+            almacenamiento (str): 'csv' o 'sqlite'. Por omisión se usa
+                ``Configuracion.ALMACENAMIENTO``.
+            tamano_cache (int): Registros que guarda la caché de consultas; 0
+                la desactiva. Por omisión se usa ``Configuracion.TAMANO_CACHE``.
+        """
+        esquema = self.ESQUEMA
+        self.cache = CacheLRU(TAMANO_CACHE if tamano_cache is None else tamano_cache)
+        self.atributos = list(esquema.atributos)
+        self.archivo = esquema.archivo
+        self.almacen = crear_almacenamiento(esquema.tabla, self.archivo, self.atributos, esquema.campos_clave,
+                                            normalizar=esquema.normalizar, tipo=almacenamiento, modo=modo,
+                                            umbral_bitacora=umbral_bitacora, indices=esquema.indices,
+                                            fechas=esquema.fechas, texto=esquema.texto)
+        self.recuperaciones = list(self.almacen.recuperaciones)
+
+    def __exist(self, valores):
+        """Verifica si existe el registro con los valores de clave indicados."""
+        try:
+            return self.almacen.existe(*valores)
+        except Exception:
+            return False
+
+    def __valores(self, argumentos, extra=0):
+        """Separa los valores de la clave de los argumentos de una operación.
+
+        Raises:
+            TypeError: Si no se recibió un valor por cada columna de la clave.
+        """
+        campos_clave = self.ESQUEMA.campos_clave
+        if len(argumentos) != len(campos_clave) + extra:
+            raise TypeError(f"Se esperaban los valores de {', '.join(campos_clave)}.")
+        return list(argumentos[:len(campos_clave)])
+
+    def __no_registrado(self, valores):
+        """Mensaje de un registro que no existe."""
+        esquema = self.ESQUEMA
+        return (f"{esquema.articulo.capitalize()} {esquema.singular} con {esquema.describir(valores)} "
+                f"no está {esquema.concordar('registrado')}.")
+
+    def __bloqueo(self):
+        """Bloqueo de una escritura: el exclusivo del almacenamiento y, si
+        hay índice de relaciones, también el de las entidades referenciadas."""
+        return self.relaciones.bloqueo(self) if self.relaciones is not None else self.almacen.exclusivo()
+
+    def __escritura(self, claves):
+        """Rodea una escritura para que el índice de relaciones, si lo hay,
+        se actualice con los registros de ``claves``."""
+        return self.relaciones.escritura(self, claves) if self.relaciones is not None else nullcontext()
+
+    def __exito(self, valores, accion):
+        """Mensaje de una operación exitosa sobre un registro, por ejemplo
+        'Atleta con ID 5 eliminado exitosamente.'"""
+        esquema = self.ESQUEMA
+        return f"{esquema.singular.capitalize()} con {esquema.describir(valores)} {esquema.concordar(accion)} exitosamente."
+
+    def __fallo(self, accion, valores, error):
+        """Mensaje de un error inesperado al operar sobre un registro."""
+        esquema = self.ESQUEMA
+        return f"Error al {accion} {esquema.articulo} {esquema.singular} con {esquema.describir(valores)}: {error}"
+
+    def validar_datos(self, datos, validador=None):
+        """Valida los datos de un registro nuevo sin consultar el almacenamiento.
+
+        No verifica si la clave ya está registrada; eso corresponde a quien
+        agrega el registro.
+
+        Args:
+            datos (list): Datos del registro en el orden de ``atributos``.
+            validador (ValidadorDeDatos): Validador que reporta el primer
+                error. Por omisión se usa el validador compartido, que no
+                reporta nada.
+
+        Returns:
+            bool: True si los datos son válidos, False en caso contrario.
+        """
+        if validador is None:
+            validador = VALIDADOR
+        errores = self.validar_lote([datos], validador)[0]
+        if errores:
+            validador.reportar(errores[0].mensaje)
+            return False
+        return True
+
+    def validar_lote(self, filas, validador=None):
+        """Valida muchos registros nuevos a la vez, columna por columna, con
+        las reglas compiladas del esquema.
+
+        Args:
+            filas (list): Listas con los datos de cada registro.
+            validador (ValidadorDeDatos): Validador a utilizar. Por omisión se
+                usa el validador compartido.
+
+        Returns:
+            list: Por cada fila, una tupla de ``ErrorDeValidacion``; vacía si
+            la fila es válida.
+        """
+        if validador is None:
+            validador = VALIDADOR
+        return validador.validar_filas(filas, self.ESQUEMA.reglas)
+
+    def __error_de_referencia(self, campo, valor):
+        """Verifica que un valor no apunte a un registro inexistente.
+
+        Returns:
+            ErrorDeValidacion: El problema encontrado, o None si no hay índice
+            de relaciones o la referencia es válida.
+        """
+        if self.relaciones is None:
+            return None
+        error = self.relaciones.error_de_campo(self, campo, valor)
+        return None if error is None else ErrorDeValidacion(campo, error)
+
+    def agregar_datos(self, datos):
+        """Agrega un registro nuevo.
+
+        Verifica que la clave no esté registrada antes de agregarlo.
+
+        Args:
+            datos (list | NamedTuple): Lista o registro con los datos en el
+                orden de ``atributos``.
+
+        Returns:
+            Resultado: Con el registro agregado si tuvo éxito, o con los
+            errores de validación que lo impidieron.
+        """
+        esquema = self.ESQUEMA
+        datos = [a_texto(dato) for dato in datos]
+        clave = esquema.clave_de_datos(datos)
+        with self.__bloqueo():
+            # Las referencias se verifican con el bloqueo de las entidades
+            # referenciadas tomado, para que sigan existiendo al escribir.
+            if self.relaciones is not None:
+                error = self.relaciones.error_de_referencias(self, datos)
+                if error is not None:
+                    return Resultado(False, error.mensaje, clave, errores=(error,))
+
+            errores = self.validar_lote([datos])[0]
+            if errores:
+                return Resultado(False, errores[0].mensaje, clave, errores=errores)
+
+            valores = [datos[posicion] for posicion in esquema.posiciones_clave]
+            if self.__exist(valores):
+                return Resultado(False, f"{esquema.articulo.capitalize()} {esquema.singular} con "
+                                        f"{esquema.describir(valores)} ya está {esquema.concordar('registrado')}.",
+                                 clave)
+
+            try:
+                registro = esquema.registro.desde_fila(datos)
+                with self.cache.escritura(self.almacen.firma), self.__escritura([valores]):
+                    self.almacen.agregar(datos)
+                    self.cache.guardar(self.almacen.clave_de(valores), registro)
+            except Exception as e:
+                return Resultado(False, f"Error al registrar {esquema.articulo} {esquema.singular}: {e}", clave)
+            return Resultado(True, f"{esquema.singular.capitalize()} {esquema.concordar('registrado')} exitosamente.",
+                             clave, registro)
+
+    def consultar_datos(self, *clave):
+        """Consulta un registro por su clave.
+
+        Args:
+            *clave: Valor de cada columna de la clave, por ejemplo el ID.
+
+        Returns:
+            Resultado: Con el registro tipado encontrado si existe.
+        """
+        valores = self.__valores(clave)
+        clave = self.ESQUEMA.clave(valores)
+        with self.almacen.compartido():
+            try:
+                registro = self.cache.obtener(self.almacen.firma(), self.almacen.clave_de(valores),
+                                              lambda: self.__leer(valores))
+            except Exception as e:
+                return Resultado(False, self.__fallo("consultar", valores, e), clave)
+            if registro is None:
+                return Resultado(False, self.__no_registrado(valores), clave)
+            esquema = self.ESQUEMA
+            return Resultado(True, f"{esquema.singular.capitalize()} con {esquema.describir(valores)} "
+                                   f"{esquema.concordar('encontrado')}.", clave, registro)
+
+    def __leer(self, valores):
+        """Lee del almacenamiento el registro con una clave, o None si no existe."""
+        fila = self.almacen.obtener_fila(*valores)
+        return None if fila is None else self.ESQUEMA.registro.desde_fila(fila, self.almacen.encabezados)
+
+    def consultar_por_prefijo(self, prefijo):
+        """Consulta los registros cuya primera columna clave comienza con un prefijo.
+
+        Con una clave de varias columnas se resuelve con el índice del
+        almacenamiento, sin recorrer todos los registros.
+
+        Args:
+            prefijo (str): Prefijo, por ejemplo 'Atl'.
+
+        Returns:
+            list: Diccionarios con los registros encontrados, ordenados por clave.
+        """
+        with self.almacen.compartido():
+            nombres = self.ESQUEMA.nombres(self.almacen.encabezados)
+            return [dict(zip(nombres, registro.values())) for registro in self.almacen.buscar_prefijo(prefijo)]
+
+    def buscar(self, filtros, campos=None, limite=None):
+        """Busca los registros que cumplan todos los filtros indicados.
+
+        Los filtros son un diccionario ``{campo: valor}`` para igualdad o
+        ``{campo: (operador, valor)}`` con los operadores '=', '!=', '<',
+        '<=', '>', '>=', 'entre', 'en', 'comienza' y 'contiene'. Las columnas
+        de ``FECHAS`` se comparan como fechas y un filtro de igualdad por la
+        clave usa el índice. Los filtros '=' y 'en' sobre las columnas de
+        ``INDICES`` usan los índices secundarios, los rangos sobre ``FECHAS``
+        usan el índice de fechas, y una lista de diccionarios busca los
+        registros que cumplen alguno de ellos. Por ejemplo::
+
+            buscar({'Nacionalidad': 'Mexico', 'Disciplina': 'Futbol',
+                    'Fecha de Nacimiento': ('>=', '2001-01-01')})
+            buscar({'Fecha de Nacimiento': ('entre', ('2000-01-01', '2005-12-31'))})
+            buscar({'Fecha de Nacimiento': ('<=', fecha_para_edad(50))})
+            buscar([{'Disciplina': 'Futbol'}, {'Nacionalidad': ('en', ['Peru', 'Chile'])}])
+
+        Args:
+            filtros (dict | list): Filtros de la búsqueda, o lista de filtros
+                alternativos; None o vacío para todos.
+            campos (list): Campos que se devuelven; por omisión, todos.
+            limite (int): Número máximo de resultados.
+
+        Returns:
+            generator: Diccionarios con los registros encontrados.
+
+        Raises:
+            ValueError: Si un campo, un operador o un valor no son válidos.
+        """
+        return self.almacen.buscar(self.__consulta(filtros, campos), limite)
+
+    def ordenar_por_edad(self, filtros=None, campos=None, limite=None, mayores_primero=False):
+        """Busca registros y los entrega ordenados por edad.
+
+        Recorre el índice de fechas de la columna ``nacimiento`` del esquema,
+        así que los ``limite`` más jóvenes o mayores se obtienen sin ordenar
+        todos los registros. Los registros con una fecha de nacimiento
+        inválida no aparecen.
+
+        Args:
+            filtros (dict | list): Filtros como en ``buscar``; None o vacío para todos.
+            campos (list): Campos que se devuelven; por omisión, todos.
+            limite (int): Número máximo de resultados.
+            mayores_primero (bool): Si es True, del mayor al más joven; por
+                omisión, del más joven al mayor.
+
+        Returns:
+            generator: Diccionarios con los registros encontrados.
+
+        Raises:
+            ValueError: Si un campo, un operador o un valor no son válidos, o
+                si el esquema no tiene fecha de nacimiento.
+        """
+        if self.ESQUEMA.nacimiento is None:
+            raise ValueError(f"Los registros de {self.ESQUEMA.plural} no tienen fecha de nacimiento.")
+        return self.almacen.ordenar(self.__consulta(filtros, campos), self.__encabezado(self.ESQUEMA.nacimiento),
+                                    descendente=not mayores_primero, limite=limite)
+
+    def buscar_por_nombre(self, texto, limite=10, campos=None):
+        """Busca registros por nombre aproximado.
+
+        No distingue acentos ni mayúsculas y tolera errores de escritura: las
+        palabras del texto se comparan por trigramas con las de ``TEXTO``,
+        por ejemplo ``buscar_por_nombre("José Pérez")``.
+
+        Args:
+            texto (str): Texto a buscar; puede tener varias palabras.
+            limite (int): Número máximo de resultados.
+            campos (list): Campos que se devuelven; por omisión, todos.
+
+        Returns:
+            list: Diccionarios con los registros encontrados, del más parecido
+            al menos parecido; cada uno incluye su 'Similitud', entre 0 y 1.
+
+        Raises:
+            ValueError: Si un campo no existe.
+        """
+        consulta = self.__consulta(None, campos)
+        return [{**consulta.proyectar(fila), 'Similitud': round(puntaje, 3)}
+                for fila, puntaje in self.almacen.buscar_texto(texto, limite)]
+
+    def resumir(self, resumenes, filtros=None):
+        """Calcula varios resúmenes de los registros con una sola pasada.
+
+        Args:
+            resumenes (list): ``Agregacion.Resumen`` a calcular.
+            filtros (dict | list): Filtros como en ``buscar``; None o vacío
+                para todos.
+
+        Returns:
+            list: Los grupos de cada resumen, en el mismo orden.
+
+        Raises:
+            ValueError: Si un campo, un operador o un valor no son válidos.
+        """
+        return resumir(self.almacen, self.__consulta(filtros), resumenes)
+
+    def registros(self, filtros=None, limite=None):
+        """Como ``buscar``, pero entrega registros tipados en lugar de diccionarios.
+
+        Args:
+            filtros (dict): Filtros de la búsqueda; None o vacío para todos.
+            limite (int): Número máximo de resultados.
+
+        Returns:
+            generator: Un registro tipado del esquema por cada registro encontrado.
+        """
+        filas = self.almacen.buscar_filas(self.__consulta(filtros), limite)
+        return map(self.ESQUEMA.registro.lector(self.almacen.encabezados), filas)
+
+    def __encabezado(self, campo):
+        """Encabezado del almacenamiento que corresponde a una columna del esquema."""
+        encabezados = self.almacen.encabezados
+        return dict(zip(self.ESQUEMA.nombres(encabezados), encabezados)).get(campo, campo)
+
+    def __consulta(self, filtros, campos=None):
+        """Compila los filtros de una búsqueda sobre los registros.
+
+        Las fechas y los ID se comparan por valor, para que ``('<', '5')``
+        sobre un ID no acepte '1234' por venir antes como texto.
+        """
+        tipos = {campo: int for campo, validador in self.ESQUEMA.validadores.items() if validador == 'id'}
+        tipos.update((campo, fecha) for campo in self.ESQUEMA.fechas)
+        return Consulta(filtros, self.almacen.encabezados, campos, tipos=tipos,
+                        normalizar=self.almacen.normalizar, campos_clave=self.almacen.campos_clave,
+                        nombres=self.ESQUEMA.nombres(self.almacen.encabezados))
+
+    def __error_de_edicion(self, valores, campo, valor):
+        """Valida que un cambio pueda aplicarse a un registro.
+
+        Args:
+            valores (list): Valores de la clave del registro a editar.
+            campo (str): Campo que se desea editar, con el nombre del esquema.
+            valor (str): Nuevo valor para el campo.
+
+        Returns:
+            ErrorDeValidacion: El problema encontrado, o None si el cambio es válido.
+        """
+        esquema = self.ESQUEMA
+        if not self.__exist(valores):
+            return ErrorDeValidacion(esquema.campos_clave[0], self.__no_registrado(valores))
+        if campo not in esquema.posiciones or self.__encabezado(campo) not in self.almacen.encabezados:
+            return ErrorDeValidacion(campo, f"El campo {campo} no es un atributo {esquema.contraccion} {esquema.singular}.")
+        if campo in esquema.campos_clave:
+            return ErrorDeValidacion(campo, f"No es posible modificar {campo}: es parte de la clave "
+                                            f"{esquema.contraccion} {esquema.singular}.")
+        return esquema.reglas.error_de_campo(campo, valor)
+
+    def editar_datos(self, *argumentos):
+        """Edita un campo de un registro.
+
+        Args:
+            *argumentos: Valor de cada columna de la clave, seguido del campo
+                y del nuevo valor, por ejemplo ``editar_datos(id, campo, valor)``.
+                Las fechas se guardan con formato YYYY-MM-DD.
+
+        Returns:
+            Resultado: Éxito de la edición, o el error de validación que la impidió.
+        """
+        valores = self.__valores(argumentos, extra=2)
+        campo, valor = self.ESQUEMA.nombres([argumentos[-2]])[0], a_texto(argumentos[-1])
+        clave = self.ESQUEMA.clave(valores)
+        with self.__bloqueo():
+            error = self.__error_de_edicion(valores, campo, valor) or self.__error_de_referencia(campo, valor)
+            if error is not None:
+                return Resultado(False, error.mensaje, clave, errores=(error,))
+
+            try:
+                with self.cache.escritura(self.almacen.firma), self.__escritura([valores]):
+                    self.almacen.editar([(valores, {self.__encabezado(campo): valor})])
+                    self.cache.invalidar(self.almacen.clave_de(valores))
+            except Exception as e:
+                return Resultado(False, self.__fallo("editar", valores, e), clave)
+            return Resultado(True, f"{campo} {self.ESQUEMA.contraccion} {self.ESQUEMA.singular} editado exitosamente.",
+                             clave)
+
+    def editar_lote(self, cambios):
+        """Edita varios registros aplicando todos los cambios en una sola pasada.
+
+        Todos los cambios se validan antes de tocar el almacenamiento; los
+        que no son válidos se omiten y el resto se aplica de una vez. Si un
+        mismo campo de un registro aparece varias veces, prevalece el último
+        valor.
+
+        Args:
+            cambios (list): Tuplas con los valores de la clave, el campo y el
+                valor, por ejemplo (id, campo, valor).
+
+        Returns:
+            list: Un ``Resultado`` por cada cambio recibido, en el mismo orden.
+        """
+        esquema = self.ESQUEMA
+        cambios = [([str(valor) for valor in self.__valores(cambio, extra=2)], esquema.nombres([cambio[-2]])[0],
+                    a_texto(cambio[-1])) for cambio in cambios]
+        with self.__bloqueo():
+            resultados = []
+            por_clave = {}
+            for valores, campo, valor in cambios:
+                clave = esquema.clave(valores)
+                error = self.__error_de_edicion(valores, campo, valor) or self.__error_de_referencia(campo, valor)
+                if error is not None:
+                    resultados.append(Resultado(False, error.mensaje, clave, errores=(error,)))
+                else:
+                    resultados.append(Resultado(True, self.__exito(valores, 'editado'), clave))
+                    por_clave.setdefault(self.almacen.clave_de(valores), (valores, {}))[1][self.__encabezado(campo)] = valor
+
+            if por_clave:
+                try:
+                    with self.cache.escritura(self.almacen.firma), \
+                            self.__escritura([valores for valores, _ in por_clave.values()]):
+                        self.almacen.editar(list(por_clave.values()))
+                        self.cache.invalidar(*por_clave)
+                except Exception as e:
+                    resultados = [Resultado(False, self.__fallo("editar", esquema.valores_de_clave(resultado.clave), e),
+                                            resultado.clave) if resultado.exito else resultado
+                                  for resultado in resultados]
+            return resultados
+
+    def eliminar_datos(self, *clave):
+        """Elimina un registro por su clave.
+
+        Args:
+            *clave: Valor de cada columna de la clave, por ejemplo el ID.
+
+        Returns:
+            Resultado: Éxito de la baja, o el motivo por el que no se hizo.
+        """
+        return self.eliminar_lote([self.ESQUEMA.clave(self.__valores(clave))])[0]
+
+    def eliminar_lote(self, claves):
+        """Elimina varios registros en una sola pasada.
+
+        Args:
+            claves (list): Clave de cada registro: el valor si la clave tiene
+                una columna, por ejemplo el ID, o la tupla de valores si tiene
+                varias, por ejemplo (nombre, categoria).
+
+        Returns:
+            list: Un ``Resultado`` por cada clave recibida, en el mismo orden.
+        """
+        esquema = self.ESQUEMA
+        claves = [esquema.clave([str(valor) for valor in esquema.valores_de_clave(clave)]) for clave in claves]
+        with self.__bloqueo():
+            bloqueadas, cascada = {}, {}
+            if self.relaciones is not None:
+                bloqueadas, cascada = self.relaciones.antes_de_eliminar(self, claves)
+            resultados = []
+            por_eliminar = {}
+            for clave in claves:
+                valores = esquema.valores_de_clave(clave)
+                if not self.__exist(valores):
+                    resultados.append(Resultado(False, self.__no_registrado(valores), clave))
+                elif clave in bloqueadas:
+                    resultados.append(Resultado(False, bloqueadas[clave], clave))
+                else:
+                    resultados.append(Resultado(True, self.__exito(valores, 'eliminado'), clave))
+                    por_eliminar[self.almacen.clave_de(valores)] = valores
+
+            if por_eliminar:
+                try:
+                    with self.cache.escritura(self.almacen.firma), self.__escritura(list(por_eliminar.values())):
+                        self.almacen.eliminar(list(por_eliminar.values()))
+                        self.cache.invalidar(*por_eliminar)
+                except Exception as e:
+                    resultados = [Resultado(False, self.__fallo("eliminar", esquema.valores_de_clave(resultado.clave), e),
+                                            resultado.clave) if resultado.exito else resultado
+                                  for resultado in resultados]
+                else:
+                    # La cascada se aplica solo si la baja se hizo, sin soltar el bloqueo.
+                    if cascada:
+                        self.relaciones.eliminar_dependientes(
+                            cascada, [resultado.clave for resultado in resultados if resultado.exito])
+            return resultados
+
+    def compactar(self):
+        """Consolida los cambios pendientes del almacenamiento (la bitácora
+        en CSV o el registro WAL en SQLite).
+
+        Returns:
+            Resultado: Éxito de la compactación.
+        """
+        try:
+            self.almacen.compactar()
+        except Exception as e:
+            return Resultado(False, f"Error al compactar el almacenamiento de {self.ESQUEMA.plural}: {e}")
+        return Resultado(True, f"Se compactó el almacenamiento de {self.ESQUEMA.plural}.")
+
+    def exportar_csv(self, destino):
+        """Exporta a un CSV compatible con el formato original el contenido
+        actual de la entidad, incluidos los cambios pendientes de la bitácora.
+
+        Args:
+            destino (str): Ruta del archivo CSV a escribir.
+
+        Returns:
+            Resultado: Éxito de la exportación.
+        """
+        with self.almacen.compartido():
+            try:
+                self.almacen.exportar(destino)
+            except Exception as e:
+                return Resultado(False, f"Error al exportar {self.ESQUEMA.plural}: {e}")
+            return Resultado(True, f"Se exportaron {self.ESQUEMA.plural} a {destino}.")
@@ -1,8 +1,110 @@
 import re
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import contains, itemgetter, not_
 
+from Instrumentacion import instrumentar_clase
+from Resultado import ErrorDeValidacion
+
+# Los patrones se compilan una sola vez al importar el módulo.
+PATRON_CORREO = re.compile(r'^[^@,]+@[a-zA-Z]+\.[a-zA-Z]+$')
+PATRON_TELEFONO = re.compile(r'^\d{10}$')
+# Mismo formato que acepta datetime.strptime(fecha, "%Y-%m-%d").
+PATRON_FECHA = re.compile(r'(\d{4})-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])')
+
+# Comprobaciones rápidas para la validación por columnas: si aceptan un valor,
+# las reglas completas también lo aceptan; si no, se aplican las completas.
+RAPIDO_TELEFONO = PATRON_TELEFONO.match
+RAPIDO_CORREO = re.compile(r'(?:[^@, ]+@[a-zA-Z]+\.[a-zA-Z]+\n?)?').fullmatch
+
+MENSAJE_DATOS_INCOMPLETOS = "Verifique que el número de datos ingresados sea correcto."
+MENSAJE_CAMPO_VACIO = "Verifica que los campos se han llenado correctamente."
+
+
+def error_de_correos(correos):
+    """Mensaje de error del primer correo inválido de una lista, o None."""
+    for correo in correos:
+        if not PATRON_CORREO.match(correo):
+            return f"El correo '{correo}' no es válido, verifica que los correos sean correctos."
+    return None
+
+
+def error_de_telefonos(telefonos):
+    """Mensaje de error del primer teléfono inválido de una lista, o None."""
+    for telefono in telefonos:
+        if not PATRON_TELEFONO.match(telefono):
+            return f"Verifica que el número de teléfono '{telefono}' tenga 10 dígitos."
+    return None
+
+
+def error_de_id(id):
+    """Mensaje de error si el ID no es un número entero, o None."""
+    try:
+        int(id)
+        return None
+    except ValueError:
+        return f"Error al procesar el ID: {id}"
+
+
+@lru_cache(maxsize=65536)
+def error_de_fecha(fecha):
+    """Mensaje de error si la fecha no tiene el formato YYYY-MM-DD, o None.
+
+    Como las fechas se repiten mucho en una carga masiva, los resultados se
+    guardan en una caché acotada.
+    """
+    coincidencia = PATRON_FECHA.fullmatch(fecha)
+    if coincidencia is not None:
+        anio, mes, dia = coincidencia.groups()
+        try:
+            date(int(anio), int(mes), int(dia))
+            return None
+        except ValueError:
+            pass
+    return f"Error en el formato de fecha {fecha}."
+
+
+def fecha_valida(fecha):
+    """True si la fecha tiene el formato YYYY-MM-DD."""
+    return error_de_fecha(fecha) is None
+
+
+def ignorar(mensaje):
+    """Descarta un mensaje de error; es el ``reportar`` por omisión."""
+
+
+@instrumentar_clase
 class ValidadorDeDatos:
-    """Clase para validar diferentes tipos de datos."""
+    """Clase para validar diferentes tipos de datos.
+
+    El validador no guarda estado entre llamadas: una misma instancia puede
+    compartirse entre entidades e hilos. ``VALIDADOR`` es la instancia que
+    usan las entidades por omisión; no reporta nada, porque las entidades
+    devuelven los errores en su ``Resultado``.
+
+    Attributes:
+        reportar (callable): Función que recibe cada mensaje de error.
+    """
+
+    reportar = ignorar
+
+    def __init__(self, reportar=ignorar):
+        """Inicializa el validador.
+
+        Args:
+            reportar (callable): Función que recibe cada mensaje de error. Por
+                omisión los mensajes se descartan; puede ser, por ejemplo,
+                ``print`` o el ``append`` de una lista que los acumula.
+        """
+        self.reportar = reportar
+
+    def __resultado(self, error):
+        """Reporta el error, si lo hay, y devuelve True si no hubo error."""
+        if error is not None:
+            self.reportar(error)
+            return False
+        return True
 
     def correo_valido(self, correos):
         """Valida una lista de correos electrónicos.
@@ -13,12 +115,7 @@ class ValidadorDeDatos:
         Returns:
             bool: True si todos los correos son válidos, False en caso contrario.
         """
-        patron = re.compile(r'^[^@,]+@[a-zA-Z]+\.[a-zA-Z]+$')
-        for correo in correos:
-            if not patron.match(correo):
-                print(f"El correo '{correo}' no es válido, verifica que los correos sean correctos.")
-                return False
-        return True
+        return self.__resultado(error_de_correos(correos))
 
     def telefono_valido(self, telefonos):
         """Valida una lista de números de teléfono.
@@ -29,12 +126,7 @@ class ValidadorDeDatos:
         Returns:
             bool: True si todos los números de teléfono son válidos, False en caso contrario.
         """
-        patron = re.compile(r'^\d{10}$')
-        for telefono in telefonos:
-            if not patron.match(telefono):
-                print(f"Verifica que el número de teléfono '{telefono}' tenga 10 dígitos.")
-                return False
-        return True
+        return self.__resultado(error_de_telefonos(telefonos))
 
     def hay_campo_vacio(self, datos, atributos, excepciones):
         """Verifica si hay campos vacíos en los datos proporcionados, salvo las excepciones.
@@ -50,7 +142,7 @@ class ValidadorDeDatos:
         for i, dato in enumerate(datos):
             if atributos[i] not in excepciones:
                 if dato == "":
-                    print("Verifica que los campos se han llenado correctamente.")
+                    self.reportar(MENSAJE_CAMPO_VACIO)
                     return True
         return False
 
@@ -65,7 +157,7 @@ class ValidadorDeDatos:
             bool: True si el número de datos coincide con el número de atributos, False en caso contrario.
         """
         if len(datos) != len(atributos):
-            print("Verifique que el número de datos ingresados sea correcto.")
+            self.reportar(MENSAJE_DATOS_INCOMPLETOS)
             return False
         return True
 
@@ -78,15 +170,10 @@ class ValidadorDeDatos:
         Returns:
             bool: True si el ID es un número entero válido, False en caso contrario.
         """
-        try:
-            int(id)
-            return True
-        except ValueError:
-            print(f"Error al procesar el ID: {id}")
-            return False
+        return self.__resultado(error_de_id(id))
 
     def formato_fecha_valida(self, fecha):
-        """Valida el formato de la fecha en el formato YYYY-MM-DD usando datetime.
+        """Valida el formato de la fecha en el formato YYYY-MM-DD.
 
         Args:
             fecha (str): Fecha a verificar.
@@ -94,9 +181,163 @@ class ValidadorDeDatos:
         Returns:
             bool: True si la fecha tiene el formato correcto, False en caso contrario.
         """
-        try:
-            datetime.strptime(fecha, "%Y-%m-%d")
-            return True
-        except ValueError:
-            print(f"Error en el formato de fecha {fecha}.")
-            return False
+        return self.__resultado(error_de_fecha(fecha))
+
+    def validar_columnas(self, filas, atributos, opcionales=(), ids=(), fechas=(), telefonos=(), correos=()):
+        """Valida muchas filas a la vez, recorriendo una columna a la vez.
+
+        Compila las reglas en cada llamada; las entidades usan las de su
+        ``Esquema``, que se compilan una sola vez, con ``validar_filas``.
+
+        Args:
+            filas (list): Filas a validar, cada una en el orden de ``atributos``.
+            atributos (list): Lista de atributos esperados.
+            opcionales (list): Atributos que pueden estar vacíos.
+            ids (list): Atributos que deben ser números enteros.
+            fechas (list): Atributos con fechas YYYY-MM-DD.
+            telefonos (list): Atributos con teléfonos separados por comas.
+            correos (list): Atributos opcionales con correos separados por comas.
+
+        Returns:
+            list: Por cada fila, una tupla de ``ErrorDeValidacion``; vacía si
+            la fila es válida.
+        """
+        return self.validar_filas(filas, ReglasDeValidacion(atributos, opcionales, ids, fechas, telefonos, correos))
+
+    def validar_filas(self, filas, reglas):
+        """Valida muchas filas a la vez con reglas ya compiladas.
+
+        No reporta nada ni se detiene en el primer error: devuelve todos los
+        errores de cada fila, en el mismo orden en que los encontraría la
+        validación de una sola fila. Las filas con un número incorrecto de
+        datos solo reciben ese error, sin campo.
+
+        Args:
+            filas (list): Filas a validar, cada una en el orden de ``reglas.atributos``.
+            reglas (ReglasDeValidacion): Reglas de las columnas.
+
+        Returns:
+            list: Por cada fila, una tupla de ``ErrorDeValidacion``; vacía si
+            la fila es válida.
+        """
+        return reglas.validar(filas)
+
+
+class ReglasDeValidacion:
+    """Reglas de validación de las columnas de una entidad, compiladas una vez.
+
+    Al crearlas se resuelven la posición de cada columna y la comprobación
+    que le toca, de modo que validar muchas filas solo recorre columnas: cada
+    valor pasa primero por una comprobación rápida y solo los que no la
+    superan se revisan con las reglas completas.
+
+    Attributes:
+        atributos (tuple): Columnas esperadas, en orden.
+    """
+
+    atributos = ()
+
+    def __init__(self, atributos, opcionales=(), ids=(), fechas=(), telefonos=(), correos=(), separadores=None):
+        """Compila las reglas.
+
+        Args:
+            atributos (list): Columnas esperadas, en orden.
+            opcionales (list): Columnas que pueden estar vacías.
+            ids (list): Columnas que deben ser números enteros.
+            fechas (list): Columnas con fechas YYYY-MM-DD.
+            telefonos (list): Columnas con uno o varios teléfonos.
+            correos (list): Columnas opcionales con uno o varios correos.
+            separadores (dict): Separador de los valores de cada columna con
+                varios teléfonos o correos; por omisión, la coma.
+
+        Raises:
+            ValueError: Si una columna no está entre los atributos.
+        """
+        self.atributos = tuple(atributos)
+        separadores = separadores or {}
+
+        def posicion(campo):
+            if campo not in self.atributos:
+                raise ValueError(f"El campo {campo} no es un atributo.")
+            return self.atributos.index(campo)
+
+        def separar(campo):
+            separador = separadores.get(campo, ",")
+            return lambda valor: valor.replace(' ', '').split(separador)
+
+        def telefonos_de(campo):
+            valores = separar(campo)
+            return lambda valor: error_de_telefonos(valores(valor))
+
+        def correos_de(campo):
+            valores = separar(campo)
+            return lambda valor: error_de_correos(valores(valor)) if valor != "" else None
+
+        self.__ids = [(campo, posicion(campo), str.isdecimal, error_de_id) for campo in ids]
+        self.__requeridos = [posicion(campo) for campo in self.atributos if campo not in opcionales]
+        self.__campos_requeridos = frozenset(campo for campo in self.atributos if campo not in opcionales)
+        self.__revisiones = ([(campo, posicion(campo), fecha_valida, error_de_fecha) for campo in fechas]
+                             + [(campo, posicion(campo), RAPIDO_TELEFONO, telefonos_de(campo)) for campo in telefonos]
+                             + [(campo, posicion(campo), RAPIDO_CORREO, correos_de(campo)) for campo in correos])
+        self.__por_campo = {campo: (rapido, error_de)
+                            for campo, _, rapido, error_de in self.__ids + self.__revisiones}
+
+    def error_de_campo(self, campo, valor):
+        """Primer error de un valor aislado de una columna, con las mismas reglas.
+
+        Returns:
+            ErrorDeValidacion: El problema encontrado, o None si el valor es válido.
+        """
+        if valor == "" and campo in self.__campos_requeridos:
+            return ErrorDeValidacion(campo, MENSAJE_CAMPO_VACIO)
+        regla = self.__por_campo.get(campo)
+        if regla is None or regla[0](valor):
+            return None
+        mensaje = regla[1](valor)
+        return None if mensaje is None else ErrorDeValidacion(campo, mensaje)
+
+    def validar(self, filas):
+        """Valida muchas filas, como ``ValidadorDeDatos.validar_filas``."""
+        errores = {}
+        total = len(self.atributos)
+        if all(len(fila) == total for fila in filas):
+            completas = range(len(filas))
+            filas_completas = filas
+        else:
+            completas = [i for i, fila in enumerate(filas) if len(fila) == total]
+            filas_completas = [filas[i] for i in completas]
+            for i in set(range(len(filas))).difference(completas):
+                errores[i] = [ErrorDeValidacion(None, MENSAJE_DATOS_INCOMPLETOS)]
+        posiciones = range(len(filas_completas))
+
+        def reportar(k, campo, mensaje):
+            errores.setdefault(completas[k], []).append(ErrorDeValidacion(campo, mensaje))
+
+        def revisar(reglas):
+            # Solo los valores que no pasan la comprobación rápida se revisan
+            # uno por uno con las reglas completas.
+            for campo, posicion, rapido, error_de in reglas:
+                valores = list(map(itemgetter(posicion), filas_completas))
+                for k in compress(posiciones, map(not_, map(rapido, valores))):
+                    mensaje = error_de(valores[k])
+                    if mensaje is not None:
+                        reportar(k, campo, mensaje)
+
+        revisar(self.__ids)
+
+        requeridos = self.__requeridos
+        if requeridos:
+            extraer = itemgetter(*requeridos) if len(requeridos) > 1 else lambda fila: (fila[requeridos[0]],)
+            for k in compress(posiciones, map(contains, map(extraer, filas_completas), repeat(""))):
+                fila = filas_completas[k]
+                reportar(k, next(self.atributos[p] for p in requeridos if fila[p] == ""), MENSAJE_CAMPO_VACIO)
+
+        revisar(self.__revisiones)
+
+        resultado = [()] * len(filas)
+        for i, mensajes in errores.items():
+            resultado[i] = tuple(mensajes)
+        return resultado
+
+
+VALIDADOR = ValidadorDeDatos()
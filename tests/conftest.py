@@ -0,0 +1,26 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Los módulos del proyecto están en la raíz del repositorio, no en un paquete.
+sys.path.insert(0, RAIZ)
+
+
+@pytest.fixture
+def carpeta(tmp_path, monkeypatch):
+    """Directorio de trabajo temporal con una copia de los CSV de ``archivos``.
+
+    Las entidades usan rutas relativas como "archivos/Atleta.csv", así que
+    las pruebas que las crean trabajan sobre esta copia y no sobre los datos
+    del repositorio.
+    """
+    os.makedirs(tmp_path / "archivos")
+    for nombre in os.listdir(os.path.join(RAIZ, "archivos")):
+        if nombre.endswith(".csv"):
+            shutil.copy(os.path.join(RAIZ, "archivos", nombre), tmp_path / "archivos" / nombre)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from Agregacion import Conteo, ContadorDeDistintos, Distintos, Maximo, Minimo, Resumen
+from Atleta import Atleta
+
+
+def test_distintos_exacto_y_estimado():
+    pocos = ContadorDeDistintos()
+    for valor in list(range(100)) * 3:
+        pocos.agregar(valor)
+    muchos = ContadorDeDistintos()
+    for valor in range(100000):
+        muchos.agregar(f"valor{valor}")
+
+    assert pocos.exacto and pocos.total() == 100
+    assert not muchos.exacto
+    assert abs(muchos.total() - 100000) < 100000 * 0.06
+
+
+@pytest.fixture(params=['csv', 'sqlite'])
+def atletas(request, carpeta):
+    for nombre in os.listdir("archivos"):
+        if nombre.startswith("Atleta"):
+            os.remove(os.path.join("archivos", nombre))
+    atletas = Atleta(almacenamiento=request.param)
+    for id in range(1, 13):
+        atletas.agregar_datos([str(id), f'Nombre{id % 4}', 'Perez', '', ['Mexico', 'Peru'][id % 2],
+                               f'{1990 + id}-01-01', ['Futbol', 'Tenis', 'Remo'][id % 3], 'F', '5512345678', ''])
+    return atletas
+
+
+def test_varios_resumenes_en_una_pasada(atletas):
+    por_pais, por_disciplina = atletas.resumir([
+        Resumen(['Nacionalidad'], atletas=Conteo()),
+        Resumen(['Disciplina'], atletas=Conteo(), nombres=Distintos('Nombre'),
+                primero=Minimo('Fecha de Nacimiento'), ultimo=Maximo('Fecha de Nacimiento')),
+    ])
+
+    assert por_pais == [{'Nacionalidad': 'Mexico', 'atletas': 6}, {'Nacionalidad': 'Peru', 'atletas': 6}]
+    assert por_disciplina[0] == {'Disciplina': 'Futbol', 'atletas': 4, 'nombres': 4,
+                                 'primero': '1993-01-01', 'ultimo': '2002-01-01'}
+
+
+def test_resumen_con_filtros(atletas):
+    [grupos] = atletas.resumir([Resumen(['Disciplina'])], {'Nacionalidad': 'Peru'})
+
+    assert sum(grupo['registros'] for grupo in grupos) == 6
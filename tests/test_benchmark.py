@@ -0,0 +1,41 @@
+import csv
+import json
+
+import BenchmarkCRUD
+
+
+def test_percentil_por_rango_mas_cercano():
+    valores = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    assert BenchmarkCRUD.percentil(valores, 50) == 5
+    assert BenchmarkCRUD.percentil(valores, 99) == 10
+    assert BenchmarkCRUD.percentil([], 50) == 0.0
+
+
+def test_medir_cronometra_cada_operacion(carpeta):
+    resultado = BenchmarkCRUD.medir(50, 5, 'csv', 'reescritura', 0)
+
+    assert resultado['filas'] == 50
+    assert set(resultado['operaciones']) == {f'{entidad}.{operacion}' for entidad in ('Atleta', 'Disciplina')
+                                             for operacion in ('agregar_datos', 'consultar_datos',
+                                                               'editar_datos', 'eliminar_datos')}
+    for medicion in resultado['operaciones'].values():
+        assert medicion['operaciones'] == 5
+        assert medicion['p50_ms'] <= medicion['p99_ms']
+    with open("archivos/Atleta.csv", mode='r', newline='') as file:
+        ids = {row['ID'] for row in csv.DictReader(file)}
+    # Los registros generados son válidos: las altas se hicieron y las bajas quitaron 5 de los 50.
+    assert {str(id) for id in range(50, 55)} <= ids
+    assert len(ids) == 50
+
+
+def test_main_escribe_el_reporte_json(tmp_path):
+    salida = str(tmp_path / "benchmark.json")
+
+    assert BenchmarkCRUD.main(['--tamanos', '20', '--operaciones', '2', '--salida', salida]) == 0
+
+    with open(salida) as file:
+        reporte = json.load(file)
+    assert reporte['parametros']['almacenamiento'] == 'csv'
+    assert [resultado['filas'] for resultado in reporte['resultados']] == [20]
+    assert 'error' not in reporte['resultados'][0]
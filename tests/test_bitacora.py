@@ -0,0 +1,69 @@
+import csv
+import os
+
+from Atleta import Atleta
+
+BITACORA = os.path.join("archivos", "Atleta.log")
+
+
+def atleta(id, nombre):
+    return [str(id), nombre, 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', 'a@correo.com']
+
+
+def leer(archivo):
+    with open(archivo, mode='r', newline='') as file:
+        return {row['ID']: row for row in csv.DictReader(file)}
+
+
+def aplicar_cambios(atletas):
+    atletas.agregar_datos(atleta(101, 'Ana'))
+    atletas.agregar_datos(atleta(102, 'Luis'))
+    atletas.editar_datos(101, 'Nombre', 'Eva')
+    atletas.eliminar_datos(102)
+
+
+def test_los_cambios_se_anexan_sin_reescribir_el_csv(carpeta):
+    atletas = Atleta(modo='bitacora')
+    with open(atletas.archivo, mode='rb') as file:
+        original = file.read()
+
+    aplicar_cambios(atletas)
+
+    with open(atletas.archivo, mode='rb') as file:
+        assert file.read() == original
+    assert os.path.getsize(BITACORA) > 0
+    atletas.exportar_csv("exportado.csv")
+    registros = leer("exportado.csv")
+    assert registros['101']['Nombre'] == 'Eva'
+    assert '102' not in registros
+
+
+def test_compactar_incorpora_la_bitacora_al_csv(carpeta):
+    atletas = Atleta(modo='bitacora')
+    aplicar_cambios(atletas)
+
+    atletas.compactar()
+
+    assert not os.path.exists(BITACORA) or os.path.getsize(BITACORA) == 0
+    registros = leer(atletas.archivo)
+    assert registros['101']['Nombre'] == 'Eva'
+    assert '102' not in registros
+
+
+def test_la_bitacora_pendiente_se_compacta_en_modo_reescritura(carpeta):
+    aplicar_cambios(Atleta(modo='bitacora'))
+
+    atletas = Atleta()
+
+    assert not os.path.exists(BITACORA) or os.path.getsize(BITACORA) == 0
+    assert leer(atletas.archivo)['101']['Nombre'] == 'Eva'
+
+
+def test_se_compacta_al_superar_el_umbral(carpeta):
+    atletas = Atleta(modo='bitacora', umbral_bitacora=1)
+
+    atletas.agregar_datos(atleta(101, 'Ana'))
+    atletas.editar_datos(101, 'Nombre', 'Eva')
+
+    assert not os.path.exists(BITACORA) or os.path.getsize(BITACORA) == 0
+    assert leer(atletas.archivo)['101']['Nombre'] == 'Eva'
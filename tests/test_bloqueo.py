@@ -0,0 +1,118 @@
+import csv
+import os
+import threading
+import time
+
+import pytest
+
+from Atleta import Atleta
+from BloqueoDeArchivo import BloqueoDeArchivo
+from ReescrituraCSV import crear_temporal
+
+
+def atleta(id):
+    return [str(id), f'Nombre{id}', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678',
+            'a@correo.com']
+
+
+def test_el_bloqueo_exclusivo_excluye_a_otra_instancia(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    primero, segundo = BloqueoDeArchivo(archivo), BloqueoDeArchivo(archivo)
+    eventos = []
+
+    def leer():
+        with segundo.compartido():
+            eventos.append('lectura')
+
+    with primero.exclusivo():
+        hilo = threading.Thread(target=leer)
+        hilo.start()
+        time.sleep(0.2)
+        eventos.append('fin de la escritura')
+    hilo.join(5)
+
+    assert eventos == ['fin de la escritura', 'lectura']
+
+
+def test_los_bloqueos_son_reentrantes(tmp_path):
+    bloqueo = BloqueoDeArchivo(str(tmp_path / "atleta.csv"))
+
+    with bloqueo.exclusivo():
+        with bloqueo.exclusivo():
+            with bloqueo.compartido():
+                pass
+    with bloqueo.compartido():
+        with bloqueo.compartido():
+            pass
+
+
+def test_quien_lee_no_puede_pedir_el_bloqueo_exclusivo(tmp_path):
+    bloqueo = BloqueoDeArchivo(str(tmp_path / "atleta.csv"))
+
+    with bloqueo.compartido():
+        with pytest.raises(RuntimeError):
+            with bloqueo.exclusivo():
+                pass
+        with bloqueo.compartido():
+            pass
+    with bloqueo.exclusivo():
+        pass
+
+
+def test_dos_lectores_a_la_vez_y_un_escritor_despues(tmp_path):
+    bloqueo = BloqueoDeArchivo(str(tmp_path / "atleta.csv"))
+    juntos = threading.Barrier(3, timeout=5)
+    eventos = []
+
+    def leer(nombre):
+        with bloqueo.compartido():
+            juntos.wait()
+            eventos.append(f'entra {nombre}')
+            time.sleep(0.2)
+            eventos.append(f'sale {nombre}')
+
+    def escribir():
+        juntos.wait()
+        with bloqueo.exclusivo():
+            eventos.append('escritura')
+
+    hilos = [threading.Thread(target=leer, args=(nombre,)) for nombre in ('a', 'b')]
+    hilos.append(threading.Thread(target=escribir))
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join(10)
+
+    assert sorted(eventos[:2]) == ['entra a', 'entra b']
+    assert sorted(eventos[2:4]) == ['sale a', 'sale b']
+    assert eventos[4:] == ['escritura']
+
+
+def test_los_temporales_tienen_nombres_unicos(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+
+    temporales = {crear_temporal(archivo) for _ in range(10)}
+
+    assert len(temporales) == 10
+    assert all(os.path.dirname(temporal) == str(tmp_path) for temporal in temporales)
+
+
+def test_altas_y_bajas_concurrentes_desde_varias_instancias(carpeta):
+    def trabajar(numero):
+        atletas = Atleta()
+        ids = range(1000 + numero * 100, 1000 + numero * 100 + 10)
+        for id in ids:
+            atletas.agregar_datos(atleta(id))
+        atletas.eliminar_lote(list(ids)[::2])
+
+    hilos = [threading.Thread(target=trabajar, args=(numero,)) for numero in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join(60)
+
+    with open(os.path.join("archivos", "Atleta.csv"), mode='r', newline='') as file:
+        ids = [row['ID'] for row in csv.DictReader(file)]
+    esperados = [str(1000 + numero * 100 + desplazamiento) for numero in range(4) for desplazamiento in range(1, 10, 2)]
+    assert sorted(id for id in ids if int(id) >= 1000) == sorted(esperados)
+    assert len(ids) == len(set(ids))
@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from Atleta import Atleta
+
+ATLETAS = [
+    ['201', 'Ana', 'Perez', 'Lopez', 'Mexico', '2001-05-02', 'Futbol', 'F', '5512345678', 'a@correo.com'],
+    ['202', 'Luis', 'Gomez', '', 'Peru', '1998-11-30', 'Tenis', 'M', '5512345678', 'l@correo.com'],
+    ['203', 'Andrea', 'Diaz', '', 'Mexico', '1995-01-15', 'Futbol', 'F', '5512345678', 'd@correo.com'],
+    ['204', 'Mario', 'Ruiz', '', 'Chile', '2003-07-09', 'Natacion', 'M', '5512345678', 'm@correo.com'],
+]
+
+
+@pytest.fixture(params=['csv', 'sqlite'])
+def atletas(request, carpeta):
+    os.remove(os.path.join("archivos", "Atleta.csv"))
+    entidad = Atleta(almacenamiento=request.param)
+    for datos in ATLETAS:
+        entidad.agregar_datos(list(datos))
+    return entidad
+
+
+def ids(registros):
+    return [registro['ID'] for registro in registros]
+
+
+def test_filtros_de_igualdad_y_fecha(atletas):
+    encontrados = atletas.buscar({'Nacionalidad': 'Mexico', 'Fecha de Nacimiento': ('>=', '2000-01-01')})
+
+    assert ids(encontrados) == ['201']
+
+
+def test_operadores(atletas):
+    assert ids(atletas.buscar({'Disciplina': ('en', ['Tenis', 'Natacion'])})) == ['202', '204']
+    assert ids(atletas.buscar({'Nombre': ('comienza', 'An')})) == ['201', '203']
+    assert ids(atletas.buscar({'Correo': ('contiene', 'd@')})) == ['203']
+    assert ids(atletas.buscar({'ID': ('!=', '201'), 'Genero': 'F'})) == ['203']
+    assert ids(atletas.buscar({'ID': '204'})) == ['204']
+    assert ids(atletas.buscar({'Fecha de Nacimiento': ('<', '1999-01-01')})) == ['202', '203']
+
+
+def test_los_id_se_comparan_como_numeros(atletas):
+    atletas.agregar_datos(['1234', 'Eva', 'Soto', '', 'Chile', '1990-03-03', 'Tenis', 'F', '5512345678', 'e@correo.com'])
+
+    assert ids(atletas.buscar({'ID': ('<', '300')})) == ['201', '202', '203', '204']
+    assert ids(atletas.buscar({'ID': ('entre', ['203', '2000'])})) == ['203', '204', '1234']
+
+
+def test_proyeccion_y_limite(atletas):
+    encontrados = list(atletas.buscar({'Genero': 'M'}, campos=['Nombre', 'Disciplina'], limite=1))
+
+    assert encontrados == [{'Nombre': 'Luis', 'Disciplina': 'Tenis'}]
+
+
+def test_filtros_invalidos(atletas):
+    with pytest.raises(ValueError):
+        list(atletas.buscar({'Estatura': '1.80'}))
+    with pytest.raises(ValueError):
+        list(atletas.buscar({'Nombre': ('parecido', 'Ana')}))
+    with pytest.raises(ValueError):
+        list(atletas.buscar({'Fecha de Nacimiento': ('>', 'ayer')}))
+
+
+def test_escribir_mientras_se_recorre_una_busqueda(atletas):
+    vistos = []
+    for registro in atletas.buscar({'Genero': 'F'}):
+        vistos.append(registro['ID'])
+        atletas.eliminar_datos(registro['ID'])
+        atletas.agregar_datos([str(int(registro['ID']) + 100)] + ATLETAS[0][1:])
+    for registro in atletas.buscar({}):
+        atletas.editar_datos(registro['ID'], 'Nombre', 'Eva')
+    for registro in atletas.ordenar_por_edad(limite=2):
+        atletas.eliminar_datos(registro['ID'])
+
+    assert vistos == ['201', '203']
+    assert ids(atletas.buscar({'Nombre': 'Eva'})) == ['202', '303']
@@ -0,0 +1,51 @@
+from Atleta import Atleta
+from CacheLRU import CacheLRU
+
+FILA = ['201', 'Ana', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', '']
+
+
+def test_desaloja_al_menos_usado():
+    cache = CacheLRU(2)
+    cache.obtener(1, 'a', lambda: 'A')
+    cache.obtener(1, 'b', lambda: 'B')
+    cache.obtener(1, 'a', lambda: None)
+    cache.obtener(1, 'c', lambda: 'C')
+
+    assert cache.obtener(1, 'a', lambda: None) == 'A'
+    assert cache.obtener(1, 'b', lambda: None) is None
+    assert cache.estadisticas()['desalojos'] == 1
+
+
+def test_otra_firma_vacia_la_cache():
+    cache = CacheLRU()
+    cache.obtener(1, 'a', lambda: 'A')
+
+    assert cache.obtener(2, 'a', lambda: 'nuevo') == 'nuevo'
+
+
+def test_la_escritura_propia_conserva_la_cache():
+    cache = CacheLRU()
+    firmas = iter([1, 2])
+    cache.obtener(1, 'a', lambda: 'A')
+    cache.obtener(1, 'b', lambda: 'B')
+
+    with cache.escritura(lambda: next(firmas)):
+        cache.invalidar('b')
+
+    assert cache.obtener(2, 'a', lambda: None) == 'A'
+    assert cache.obtener(2, 'b', lambda: None) is None
+
+
+def test_la_entidad_invalida_lo_que_edita(carpeta):
+    atletas = Atleta(tamano_cache=8)
+    atletas.agregar_datos(FILA)
+    assert atletas.consultar_datos('201').registro.nombre == 'Ana'
+
+    atletas.editar_datos('201', 'Nombre', 'Eva')
+    assert atletas.consultar_datos('201').registro.nombre == 'Eva'
+
+    Atleta(tamano_cache=8).editar_datos('201', 'Nombre', 'Sara')
+    assert atletas.consultar_datos('201').registro.nombre == 'Sara'
+
+    atletas.eliminar_datos('201')
+    assert atletas.consultar_datos('201').registro is None
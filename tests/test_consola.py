@@ -0,0 +1,45 @@
+import io
+import json
+
+from Consola import Consola, main
+
+GUION = """\
+# Alta y consulta de un atleta
+atletas agregar 201 Ana Perez Lopez Mexico 2000-01-02 Futbol F 5512345678 a@correo.com
+atletas consultar 201
+atletas editar 201 Nombre Eva
+atletas buscar --filtro Nombre = Eva --campos ID
+atletas borrar 201
+
+atletas eliminar 201
+atletas consultar 201
+"""
+
+
+def ejecutar(guion):
+    salida = io.StringIO()
+    fallidos = Consola(almacenamiento='csv').ejecutar_guion(io.StringIO(guion), salida)
+    return fallidos, [json.loads(linea) for linea in salida.getvalue().splitlines()]
+
+
+def test_guion_con_un_resultado_por_comando(carpeta):
+    fallidos, resultados = ejecutar(GUION)
+
+    assert [resultado['exito'] for resultado in resultados] == [True, True, True, True, False, True, False]
+    assert fallidos == 2
+    assert resultados[1]['resultado']['Nombre'] == 'Ana'
+    assert resultados[3]['resultado'] == [{'ID': '201'}]
+
+
+def test_la_ayuda_en_un_guion_es_un_resultado_fallido(carpeta):
+    fallidos, resultados = ejecutar("atletas -h\natletas consultar -h\natletas consultar 999\n")
+
+    assert [resultado['exito'] for resultado in resultados] == [False, False, False]
+    assert fallidos == 3
+    assert 'usage:' in resultados[1]['mensajes'][0]
+    assert 'registrado' in resultados[2]['mensajes'][0]
+
+
+def test_un_comando_suelto_devuelve_su_codigo(carpeta, capsys):
+    assert main(['--almacenamiento', 'csv', 'atletas', 'consultar', '999']) == 1
+    assert json.loads(capsys.readouterr().out)['exito'] is False
@@ -0,0 +1,66 @@
+import os
+import time
+
+import pytest
+
+from EscritorDeAnexos import EscritorDeAnexos
+
+
+def leer(ruta):
+    return ruta.read_text().splitlines()
+
+
+def test_fila_sincroniza_cada_escritura(tmp_path):
+    ruta = tmp_path / "datos.csv"
+    escritor = EscritorDeAnexos(str(ruta), politica='fila')
+
+    escritor.anexar_filas([['1', 'a']])
+    escritor.anexar_filas([['2', 'b'], ['3', 'c']])
+
+    assert leer(ruta) == ['1,a', '2,b', '3,c']
+    assert escritor.sincronizaciones == 2
+    escritor.cerrar()
+
+
+def test_grupo_agrupa_los_fsync(tmp_path):
+    ruta = tmp_path / "datos.csv"
+    escritor = EscritorDeAnexos(str(ruta), politica='grupo', filas_por_fsync=3, ms_por_fsync=60000)
+
+    for numero in range(7):
+        escritor.anexar_filas([[str(numero)]])
+
+    assert len(leer(ruta)) == 7
+    assert escritor.sincronizaciones == 2
+    escritor.sincronizar()
+    assert escritor.sincronizaciones == 3
+    escritor.cerrar()
+
+
+def test_periodica_sincroniza_al_vencer(tmp_path):
+    escritor = EscritorDeAnexos(str(tmp_path / "datos.csv"), politica='periodica', ms_por_fsync=10)
+
+    escritor.anexar_lineas(["uno\n", "dos\n"])
+    time.sleep(0.3)
+
+    assert escritor.sincronizaciones == 1
+    escritor.cerrar()
+
+
+def test_reabre_el_archivo_reemplazado(tmp_path):
+    ruta = tmp_path / "datos.csv"
+    escritor = EscritorDeAnexos(str(ruta), politica='ninguna')
+    escritor.anexar_filas([['1']])
+
+    reemplazo = tmp_path / "nuevo.csv"
+    reemplazo.write_text("0\n")
+    os.replace(reemplazo, ruta)
+    escritor.anexar_filas([['2']])
+
+    assert leer(ruta) == ['0', '2']
+    assert escritor.sincronizaciones == 0
+    escritor.cerrar()
+
+
+def test_politica_inexistente(tmp_path):
+    with pytest.raises(ValueError):
+        EscritorDeAnexos(str(tmp_path / "datos.csv"), politica='siempre')
@@ -0,0 +1,56 @@
+import csv
+import json
+
+from Atleta import Atleta
+from Importador import Importador
+
+
+def leer(archivo):
+    with open(archivo, mode='r', newline='', encoding='utf-8') as file:
+        return list(csv.reader(file))
+
+
+def test_importar_csv_con_rechazos(carpeta):
+    with open("origen.csv", mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['correo', 'ID', 'Nombre', 'Apellido Paterno', 'Apellido Materno', 'Nacionalidad',
+                         'Fecha de Nacimiento', 'Disciplina', 'Genero', 'Telefono'])
+        writer.writerow(['a@correo.com', '201', 'Ana', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F',
+                         '5512345678'])
+        writer.writerow(['a@correo.com', '202', 'Luis', 'Gomez', '', 'Peru', '1999-05-06', 'Tenis', 'M',
+                         'no es telefono'])
+        writer.writerow(['a@correo.com', '201', 'Ana', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F',
+                         '5512345678'])
+        writer.writerow(['a@correo.com', '12', 'Eva', 'Diaz', '', 'Chile', '2001-03-04', 'Futbol', 'F',
+                         '5512345678'])
+        writer.writerow(['a@correo.com', '203'])
+
+    resumen = Importador(Atleta()).importar("origen.csv")
+
+    assert (resumen['leidas'], resumen['importadas'], resumen['rechazadas']) == (5, 1, 4)
+    rechazos = leer(resumen['rechazos'])
+    assert rechazos[0][:2] == ['Linea', 'Motivo']
+    assert [fila[0] for fila in rechazos[1:]] == ['3', '4', '5', '6']
+    assert "repetido" in rechazos[2][1]
+    assert "ya está registrado" in rechazos[3][1]
+    importados = [fila for fila in leer(Atleta().archivo) if fila[0] == '201']
+    assert importados == [['201', 'Ana', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678',
+                           'a@correo.com']]
+
+
+def test_importar_jsonl(carpeta):
+    registro = {'ID': 301, 'Nombre': 'Ana', 'Apellido Paterno': 'Perez', 'Apellido Materno': None,
+                'Nacionalidad': 'Mexico', 'Fecha de Nacimiento': '2000-01-02', 'Disciplina': 'Futbol',
+                'Genero': 'F', 'Telefono': '5512345678', 'Correo': 'a@correo.com'}
+    with open("origen.jsonl", mode='w', encoding='utf-8') as file:
+        file.write(json.dumps(registro) + "\n")
+        file.write("{no es json\n")
+        file.write(json.dumps({'ID': 302, 'Nombre': 'Luis'}) + "\n")
+        file.write("\n")
+
+    resumen = Importador(Atleta()).importar("origen.jsonl", rechazos="rechazos.csv")
+
+    assert (resumen['leidas'], resumen['importadas'], resumen['rechazadas']) == (3, 1, 2)
+    assert [fila[0] for fila in leer("rechazos.csv")[1:]] == ['2', '3']
+    importados = [fila for fila in leer(Atleta().archivo) if fila[0] == '301']
+    assert importados[0][3] == ''
@@ -0,0 +1,40 @@
+from IndiceCompuesto import IndiceCompuesto
+
+
+def crear_indice(tmp_path, filas):
+    archivo = str(tmp_path / "disciplina.csv")
+    with open(archivo, mode='w', newline='') as file:
+        file.write("Nombre,Categoria,Participantes,Patrocinadores\r\n")
+        for fila in filas:
+            file.write(",".join(fila) + "\r\n")
+    return IndiceCompuesto(archivo, ['Nombre', 'Categoria'])
+
+
+def test_la_clave_no_distingue_mayusculas(tmp_path):
+    indice = crear_indice(tmp_path, [['Futbol', 'Equipo', 'Ana', 'Nike']])
+
+    assert indice.contiene('FUTBOL', 'equipo')
+    assert not indice.contiene('Futbol', 'Individual')
+    assert indice.obtener('futbol', 'EQUIPO')['Patrocinadores'] == 'Nike'
+
+
+def test_buscar_prefijo_en_orden_de_clave(tmp_path):
+    indice = crear_indice(tmp_path, [['Natacion', 'Individual', '', ''], ['Atletismo', 'Relevos', '', ''],
+                                     ['atletismo', 'Individual', '', ''], ['Basketball', 'Equipo', '', '']])
+
+    encontrados = [(registro['Nombre'], registro['Categoria']) for registro in indice.buscar_prefijo('AT')]
+
+    assert encontrados == [('atletismo', 'Individual'), ('Atletismo', 'Relevos')]
+    assert indice.buscar_prefijo('x') == []
+
+
+def test_buscar_prefijo_refleja_altas_y_bajas(tmp_path):
+    indice = crear_indice(tmp_path, [['Atletismo', 'Individual', '', '']])
+
+    for numero in range(20):
+        indice.agregar([f'Tiro {numero:02d}', 'Individual', '', ''])
+    indice.eliminar('Atletismo', 'Individual')
+
+    nombres = [registro['Nombre'] for registro in indice.buscar_prefijo('ti')]
+    assert nombres == [f'Tiro {numero:02d}' for numero in range(20)]
+    assert indice.buscar_prefijo('atl') == []
@@ -0,0 +1,54 @@
+import os
+from datetime import date
+
+import pytest
+
+from Atleta import Atleta
+from Consulta import fecha_para_edad
+from IndiceDeFechas import ordinal
+
+FECHAS = ['1990-05-01', '2001-12-31', '1985-01-15', '2001-12-31', '1999-07-04']
+
+
+def test_fecha_para_edad():
+    assert fecha_para_edad(50, hoy=date(2026, 10, 18)) == date(1976, 10, 18)
+    assert fecha_para_edad(1, hoy=date(2024, 2, 29)) == date(2023, 2, 28)
+
+
+def test_ordinal():
+    assert ordinal('2000-01-02') == date(2000, 1, 2).toordinal()
+    assert ordinal('no es fecha') is None
+
+
+@pytest.fixture(params=['csv', 'sqlite'])
+def atletas(request, carpeta):
+    for nombre in os.listdir("archivos"):
+        if nombre.startswith("Atleta"):
+            os.remove(os.path.join("archivos", nombre))
+    atletas = Atleta(almacenamiento=request.param)
+    for id, nacimiento in enumerate(FECHAS, start=1):
+        atletas.agregar_datos([str(id), 'Ana', 'Perez', '', 'Mexico', nacimiento, 'Futbol', 'F', '5512345678', ''])
+    return atletas
+
+
+def ids(registros):
+    return [registro['ID'] for registro in registros]
+
+
+def test_rango_de_fechas(atletas):
+    encontrados = atletas.buscar({'Fecha de Nacimiento': ('entre', ('1986-01-01', '2000-01-01'))})
+
+    assert sorted(ids(encontrados)) == ['1', '5']
+
+
+def test_ordenar_por_edad_con_limite(atletas):
+    assert ids(atletas.ordenar_por_edad(limite=3)) == ['2', '4', '5']
+    assert ids(atletas.ordenar_por_edad(limite=2, mayores_primero=True)) == ['3', '1']
+
+
+def test_el_indice_sigue_las_ediciones(atletas):
+    list(atletas.ordenar_por_edad())
+    atletas.editar_datos('3', 'Fecha de Nacimiento', '2010-01-01')
+    atletas.eliminar_datos('2')
+
+    assert ids(atletas.ordenar_por_edad(limite=2)) == ['3', '4']
@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from Atleta import Atleta
+from IndiceDeTexto import normalizar_texto, palabras, trigramas
+
+NOMBRES = [('José', 'Pérez'), ('Josefina', 'Gómez'), ('Ana', 'Núñez'), ('Luis', 'Perea')]
+
+
+def test_normalizacion_y_trigramas():
+    assert normalizar_texto("José Núñez-Peña") == "jose nunez pena"
+    assert palabras("Ana ana Luis") == ('ana', 'luis')
+    assert trigramas('ana') == {'  a', ' an', 'ana', 'na '}
+
+
+@pytest.fixture(params=['csv', 'sqlite'])
+def atletas(request, carpeta):
+    for nombre in os.listdir("archivos"):
+        if nombre.startswith("Atleta"):
+            os.remove(os.path.join("archivos", nombre))
+    atletas = Atleta(almacenamiento=request.param)
+    for id, (nombre, paterno) in enumerate(NOMBRES, start=1):
+        atletas.agregar_datos([str(id), nombre, paterno, '', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', ''])
+    return atletas
+
+
+def test_tolera_acentos_y_errores(atletas):
+    encontrados = atletas.buscar_por_nombre("jose peres", limite=2)
+
+    assert encontrados[0]['ID'] == '1'
+    assert encontrados[0]['Similitud'] > encontrados[-1]['Similitud']
+
+
+def test_sigue_las_ediciones_y_bajas(atletas):
+    atletas.buscar_por_nombre("ana")
+    atletas.editar_datos('3', 'Nombre', 'Mariana')
+    atletas.eliminar_datos('1')
+
+    assert [registro['ID'] for registro in atletas.buscar_por_nombre("mariana", campos=['ID'])][:1] == ['3']
+    assert '1' not in [registro['ID'] for registro in atletas.buscar_por_nombre("jose perez")]
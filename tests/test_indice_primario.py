@@ -0,0 +1,51 @@
+import os
+
+from IndicePrimario import IndicePrimario
+
+ENCABEZADOS = "ID,Nombre,Apellido Paterno\r\n"
+
+
+def escribir(ruta, contenido, modo='w'):
+    with open(ruta, mode=modo, newline='') as file:
+        file.write(contenido)
+
+
+def test_consulta_por_clave(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    escribir(archivo, ENCABEZADOS + "1,Ana,Perez\r\n2,Luis,Gomez\r\n")
+
+    indice = IndicePrimario(archivo, ['ID'])
+
+    assert len(indice) == 2
+    assert indice.contiene('2')
+    assert not indice.contiene('3')
+    assert indice.obtener('1') == {'ID': '1', 'Nombre': 'Ana', 'Apellido Paterno': 'Perez'}
+    assert indice.obtener('3') is None
+
+
+def test_agregar_actualizar_y_eliminar(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    escribir(archivo, ENCABEZADOS + "1,Ana,Perez\r\n")
+    indice = IndicePrimario(archivo, ['ID'])
+
+    escribir(archivo, "2,Luis,Gomez\r\n", modo='a')
+    indice.agregar(['2', 'Luis', 'Gomez'])
+    indice.sincronizar()
+    indice.actualizar('Nombre', 'Ana Maria', '1')
+    indice.eliminar('2')
+
+    assert indice.obtener('1')['Nombre'] == 'Ana Maria'
+    assert not indice.contiene('2')
+    assert len(indice) == 1
+
+
+def test_se_reconstruye_si_el_archivo_cambia_por_fuera(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    escribir(archivo, ENCABEZADOS + "1,Ana,Perez\r\n")
+    indice = IndicePrimario(archivo, ['ID'])
+
+    escribir(archivo, "7,Eva,Diaz\r\n", modo='a')
+    os.utime(archivo, ns=(0, os.stat(archivo).st_mtime_ns + 10 ** 9))
+
+    assert indice.contiene('7')
+    assert indice.obtener('7')['Nombre'] == 'Eva'
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from Atleta import Atleta
+from IndiceSecundario import intersecar, unir
+
+NACIONALIDADES = ['Mexico', 'Peru', 'Chile']
+DISCIPLINAS = ['Futbol', 'Tenis']
+
+
+def test_intersecar_y_unir():
+    largas = list(range(0, 1000, 2))
+
+    assert intersecar([[4, 7, 10], largas]) == [4, 10]
+    assert intersecar([[1, 2, 3], [2, 3, 4], [3, 4, 5]]) == [3]
+    assert intersecar([]) == []
+    assert unir([[1, 5], [2, 5, 9]]) == [1, 2, 5, 9]
+
+
+@pytest.fixture(params=['csv', 'sqlite'])
+def atletas(request, carpeta):
+    for nombre in os.listdir("archivos"):
+        if nombre.startswith("Atleta"):
+            os.remove(os.path.join("archivos", nombre))
+    atletas = Atleta(almacenamiento=request.param)
+    for id in range(1, 31):
+        atletas.agregar_datos([str(id), 'Ana', 'Perez', '', NACIONALIDADES[id % 3], '2000-01-02',
+                               DISCIPLINAS[id % 2], 'FM'[id % 2], '5512345678', ''])
+    return atletas
+
+
+def ids(registros):
+    return sorted(int(registro['ID']) for registro in registros)
+
+
+def test_y_entre_columnas_indexadas(atletas):
+    encontrados = atletas.buscar({'Nacionalidad': 'Peru', 'Disciplina': 'Tenis'})
+
+    assert ids(encontrados) == [id for id in range(1, 31) if id % 3 == 1 and id % 2 == 1]
+
+
+def test_o_entre_alternativas(atletas):
+    encontrados = atletas.buscar([{'Nacionalidad': 'Chile', 'Genero': 'F'}, {'ID': '1'}])
+
+    assert ids(encontrados) == [1] + [id for id in range(1, 31) if id % 3 == 2 and id % 2 == 0]
+
+
+def test_los_indices_siguen_las_ediciones_y_bajas(atletas):
+    atletas.buscar({'Nacionalidad': 'Mexico'})
+    atletas.editar_datos('3', 'Nacionalidad', 'Peru')
+    atletas.eliminar_datos('6')
+
+    assert ids(atletas.buscar({'Nacionalidad': 'Mexico'})) == [id for id in range(9, 31, 3)]
+    assert 3 in ids(atletas.buscar({'Nacionalidad': 'Peru'}))
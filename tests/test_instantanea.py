@@ -0,0 +1,50 @@
+import pytest
+
+from Atleta import Atleta
+from InstantaneaColumnar import InstantaneaColumnar
+
+ENCABEZADOS = ['ID', 'Nombre', 'Fecha', 'Genero']
+FILAS = [
+    ['1', 'Ana', '2000-01-02', 'F'],
+    ['2', 'Luis', '', 'M'],
+    ['30', 'Ñandú', '1999-12-31', 'F'],
+    ['4', '', '2001-05-06', 'M'],
+]
+
+
+def test_ida_y_vuelta(tmp_path):
+    ruta = str(tmp_path / "datos.col")
+
+    instantanea = InstantaneaColumnar.escribir(ruta, ENCABEZADOS, FILAS, firma="uno")
+
+    assert instantanea.encabezados == ENCABEZADOS
+    assert len(instantanea) == 4
+    assert list(instantanea.filas()) == FILAS
+    assert [instantanea.columna(campo).tipo for campo in ENCABEZADOS] == ['entero', 'texto', 'fecha', 'diccionario']
+    assert instantanea.columna('genero').contar() == {'F': 2, 'M': 2}
+    assert instantanea.columna('Nombre')[-2] == 'Ñandú'
+
+
+def test_se_descarta_con_otra_firma_o_danada(tmp_path):
+    ruta = tmp_path / "datos.col"
+    InstantaneaColumnar.escribir(str(ruta), ENCABEZADOS, FILAS, firma="uno")
+
+    assert InstantaneaColumnar.abrir(str(ruta), firma="uno") is not None
+    assert InstantaneaColumnar.abrir(str(ruta), firma="dos") is None
+
+    ruta.write_bytes(ruta.read_bytes()[:20])
+    assert InstantaneaColumnar.abrir(str(ruta)) is None
+    assert InstantaneaColumnar.abrir(str(tmp_path / "no_existe.col")) is None
+
+
+def test_filas_de_distinta_longitud():
+    with pytest.raises(ValueError):
+        InstantaneaColumnar.escribir("no_se_escribe.col", ENCABEZADOS, [['1', 'Ana']])
+
+
+def test_la_entidad_no_usa_una_instantanea_vieja(carpeta):
+    atletas = Atleta(almacenamiento='csv')
+    atletas.almacen.instantanea()
+    atletas.agregar_datos(['201', 'Ana', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', ''])
+
+    assert Atleta(almacenamiento='csv').almacen.existe('201')
@@ -0,0 +1,63 @@
+import pytest
+
+import Instrumentacion
+from Atleta import Atleta
+from Instrumentacion import METRICAS, Histograma, Metricas, instrumentar
+
+
+@pytest.fixture
+def activa(monkeypatch):
+    monkeypatch.setattr(Instrumentacion, 'activa', True)
+    METRICAS.reiniciar()
+    yield
+    METRICAS.reiniciar()
+
+
+def test_percentiles_del_histograma():
+    histograma = Histograma()
+    for segundos in [0.0002] * 90 + [0.03] * 10:
+        histograma.observar(segundos)
+
+    assert histograma.total == 100
+    assert histograma.percentil(0.5) == 0.00025
+    assert histograma.percentil(0.99) == 0.03
+
+
+def test_las_magnitudes_van_a_la_operacion_externa(activa):
+    metricas = Metricas()
+
+    with metricas.operacion('externa'):
+        with metricas.operacion('interna'):
+            metricas.sumar('filas_examinadas', 5)
+
+    resumen = metricas.como_dict()['operaciones']
+    assert resumen['externa']['filas_examinadas'] == 5
+    assert resumen['interna']['llamadas'] == 1
+    assert 'entidad_filas_examinadas_total{operacion="externa"} 5' in metricas.como_prometheus()
+
+
+def test_los_iteradores_se_miden_al_agotarse(activa):
+    @instrumentar('prueba.contar')
+    def contar():
+        yield from range(3)
+
+    iterador = contar()
+    assert 'prueba.contar' not in METRICAS.como_dict()['operaciones']
+    assert list(iterador) == [0, 1, 2]
+    assert METRICAS.como_dict()['operaciones']['prueba.contar']['llamadas'] == 1
+
+
+def test_las_operaciones_de_la_entidad_se_registran(carpeta, activa):
+    Atleta().agregar_datos(['201', 'Ana', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', ''])
+
+    operaciones = METRICAS.como_dict()['operaciones']
+    assert any(nombre.endswith('.agregar_datos') for nombre in operaciones)
+
+
+def test_desactivada_no_registra_nada():
+    metricas = Metricas()
+
+    with metricas.operacion('nada'):
+        metricas.sumar('bytes_leidos', 10)
+
+    assert metricas.como_dict() == {'operaciones': {}}
@@ -0,0 +1,41 @@
+import csv
+
+from Atleta import Atleta
+
+
+def atleta(id, nombre):
+    return [str(id), nombre, 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', 'a@correo.com']
+
+
+def filas(archivo):
+    with open(archivo, mode='r', newline='') as file:
+        return {row['ID']: row for row in csv.DictReader(file)}
+
+
+def test_editar_lote_aplica_los_cambios_validos(carpeta):
+    atletas = Atleta()
+    for id, nombre in [(101, 'Ana'), (102, 'Luis')]:
+        atletas.agregar_datos(atleta(id, nombre))
+
+    resultados = atletas.editar_lote([(101, 'Nombre', 'Eva'), (102, 'Telefono', 'no es telefono'),
+                                      (999, 'Nombre', 'Nadie'), (102, 'Nombre', 'Leo'), (101, 'Nombre', 'Ema')])
+
+    assert [resultado.exito for resultado in resultados] == [True, False, False, True, True]
+    registros = filas(atletas.archivo)
+    assert registros['101']['Nombre'] == 'Ema'
+    assert registros['102']['Nombre'] == 'Leo'
+    assert registros['102']['Telefono'] == '5512345678'
+    assert '999' not in registros
+
+
+def test_eliminar_lote_omite_los_que_no_existen(carpeta):
+    atletas = Atleta()
+    for id, nombre in [(101, 'Ana'), (102, 'Luis'), (103, 'Eva')]:
+        atletas.agregar_datos(atleta(id, nombre))
+
+    resultados = atletas.eliminar_lote([101, 999, 103])
+
+    assert [resultado.exito for resultado in resultados] == [True, False, True]
+    registros = filas(atletas.archivo)
+    assert '101' not in registros and '103' not in registros
+    assert registros['102']['Nombre'] == 'Luis'
@@ -0,0 +1,112 @@
+import csv
+import os
+
+from BitacoraDeCambios import BitacoraDeCambios
+from IndicePrimario import IndicePrimario
+from ReescrituraCSV import TEMPORAL_ANTERIOR, crear_temporal, recuperar_csv
+
+ENCABEZADOS = ['ID', 'Nombre', 'Apellido']
+FILAS = [['1', 'Ana', 'Perez'], ['2', 'Luis', 'Gomez']]
+
+
+def escribir(ruta, contenido):
+    with open(ruta, mode='w', newline='') as file:
+        file.write(contenido)
+
+
+def leer(ruta):
+    with open(ruta, mode='r', newline='') as file:
+        return list(csv.reader(file))
+
+
+def csv_completo(filas=FILAS):
+    return "".join(",".join(fila) + "\r\n" for fila in [ENCABEZADOS] + filas)
+
+
+def test_elimina_el_temporal_de_una_reescritura_interrumpida(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    escribir(archivo, csv_completo())
+    temp_archivo = crear_temporal(archivo)
+    escribir(temp_archivo, csv_completo(FILAS[:1]) + "3,Ma")
+
+    acciones = recuperar_csv(archivo, ENCABEZADOS)
+
+    assert not os.path.exists(temp_archivo)
+    assert len(acciones) == 1
+    assert leer(archivo) == [ENCABEZADOS] + FILAS
+
+
+def test_restaura_el_temporal_si_falta_el_original(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    temp_archivo = crear_temporal(archivo)
+    escribir(temp_archivo, csv_completo() + "3,Mar")
+
+    recuperar_csv(archivo, ENCABEZADOS)
+
+    assert not os.path.exists(temp_archivo)
+    assert leer(archivo) == [ENCABEZADOS] + FILAS
+
+
+def test_restaura_el_temporal_de_versiones_anteriores(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    anterior = str(tmp_path / TEMPORAL_ANTERIOR)
+    escribir(anterior, csv_completo())
+
+    recuperar_csv(archivo, ENCABEZADOS)
+
+    assert not os.path.exists(anterior)
+    assert leer(archivo) == [ENCABEZADOS] + FILAS
+
+
+def test_conserva_el_temporal_anterior_de_otra_entidad(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    anterior = str(tmp_path / TEMPORAL_ANTERIOR)
+    escribir(archivo, csv_completo())
+    escribir(anterior, "Nombre,Categoria\r\nFutbol,Equipo\r\n")
+
+    assert recuperar_csv(archivo, ENCABEZADOS) == []
+    assert leer(anterior) == [['Nombre', 'Categoria'], ['Futbol', 'Equipo']]
+    assert leer(archivo) == [ENCABEZADOS] + FILAS
+
+
+def test_descarta_la_ultima_fila_incompleta(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    escribir(archivo, csv_completo() + "3,Mar")
+
+    acciones = recuperar_csv(archivo, ENCABEZADOS)
+
+    assert len(acciones) == 1
+    assert leer(archivo) == [ENCABEZADOS] + FILAS
+
+
+def test_descarta_la_ultima_fila_sin_salto_de_linea_aunque_parezca_completa(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    escribir(archivo, csv_completo() + "3,Maria,Di")
+
+    acciones = recuperar_csv(archivo, ENCABEZADOS)
+
+    assert len(acciones) == 1
+    assert leer(archivo) == [ENCABEZADOS] + FILAS
+
+
+def test_bitacora_descarta_la_entrada_incompleta(tmp_path):
+    archivo = str(tmp_path / "atleta.csv")
+    escribir(archivo, csv_completo())
+    bitacora = BitacoraDeCambios(archivo, durabilidad='fila')
+    bitacora.registrar_altas([(['3'], ['3', 'Maria', 'Diaz'])])
+    bitacora.registrar_ediciones([(['1'], {'Apellido': 'Ruiz'})])
+    bitacora.escritor.cerrar()
+    with open(bitacora.archivo, mode='a', encoding='utf-8') as file:
+        file.write('{"op": "eliminar", "clave": ["2"')
+
+    acciones = bitacora.recuperar()
+
+    assert len(acciones) == 1
+    assert [entrada["op"] for entrada in bitacora.entradas()] == ['agregar', 'editar']
+    assert bitacora.recuperar() == []
+
+    indice = IndicePrimario(archivo, ['ID'], bitacora=bitacora)
+    bitacora.compactar(indice)
+
+    assert not bitacora.pendiente()
+    assert leer(archivo) == [ENCABEZADOS, ['1', 'Ana', 'Ruiz'], ['2', 'Luis', 'Gomez'], ['3', 'Maria', 'Diaz']]
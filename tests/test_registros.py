@@ -0,0 +1,41 @@
+from datetime import date
+
+from Atleta import Atleta
+from Registros import RegistroAtleta, RegistroDisciplina
+
+FILA = ['201', 'Ana', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', 'a@correo.com']
+
+
+def test_convierte_id_y_fecha():
+    registro = RegistroAtleta.desde_fila(FILA)
+
+    assert registro.id == 201
+    assert registro.fecha_de_nacimiento == date(2000, 1, 2)
+    assert registro.fila() == FILA
+    assert registro.como_dict()['Fecha de Nacimiento'] == '2000-01-02'
+    assert not hasattr(registro, '__dict__')
+
+
+def test_conserva_como_texto_lo_que_no_es_canonico():
+    registro = RegistroAtleta.desde_fila(['007'] + FILA[1:5] + ['2000-1-2'] + FILA[6:])
+
+    assert registro.id == '007'
+    assert registro.fecha_de_nacimiento == '2000-1-2'
+    assert registro.fila()[0] == '007'
+
+
+def test_lector_ordena_las_columnas_sin_distinguir_mayusculas():
+    leer = RegistroDisciplina.lector(['CATEGORIA', 'nombre', 'Patrocinadores', 'Participantes'])
+
+    registro = leer(['Equipo', 'Futbol', 'Nike', 'Ana'])
+
+    assert registro == RegistroDisciplina('Futbol', 'Equipo', 'Ana', 'Nike')
+
+
+def test_la_entidad_entrega_registros(carpeta):
+    atletas = Atleta()
+    atletas.agregar_datos(RegistroAtleta.desde_fila(FILA))
+
+    registros = list(atletas.registros({'ID': '201'}))
+
+    assert registros == [RegistroAtleta.desde_fila(FILA)]
@@ -0,0 +1,109 @@
+import os
+import threading
+import time
+
+import pytest
+
+from Atleta import Atleta
+from Disciplina import Disciplina
+from Entrenador import Entrenador
+from Relaciones import Relaciones
+
+
+def atleta(id, nombre, paterno, disciplina):
+    return [str(id), nombre, paterno, '', 'Mexico', '2000-01-02', disciplina, 'F', '5512345678', '']
+
+
+def entrenador(id, atleta, disciplina):
+    return [str(id), 'Carlos', 'Ruiz', '', 'Mexico', '1980-01-02', atleta, disciplina, '5512345678', '']
+
+
+@pytest.fixture
+def entidades(carpeta):
+    for nombre in os.listdir("archivos"):
+        os.remove(os.path.join("archivos", nombre))
+    atletas, entrenadores, disciplinas = Atleta(), Entrenador(), Disciplina()
+    disciplinas.agregar_datos(['Futbol', 'Equipo', 'Ana Perez', 'Nike'])
+    disciplinas.agregar_datos(['Tenis', 'Individual', 'Ana Perez, Luis', 'Wilson'])
+    atletas.agregar_datos(atleta(201, 'Ana', 'Perez', 'Futbol'))
+    atletas.agregar_datos(atleta(202, 'Luis', 'Gomez', 'Tenis'))
+    entrenadores.agregar_datos(entrenador(301, 'Ana Perez', 'futbol'))
+    return atletas, entrenadores, disciplinas
+
+
+def ids(registros):
+    return sorted(registro['ID'] for registro in registros)
+
+
+def test_uniones(entidades):
+    relaciones = Relaciones(*entidades)
+
+    assert ids(relaciones.atletas_por_disciplina('FUTBOL')) == ['201']
+    assert ids(relaciones.entrenadores_por_disciplina('Futbol')) == ['301']
+    assert ids(relaciones.entrenadores_de_atletas_en('futbol')) == ['301']
+    assert ids(relaciones.entrenadores_de_atleta('201')) == ['301']
+    assert ids(relaciones.atletas_de_entrenador('301')) == ['201']
+    assert [registro['Nombre'] for registro in relaciones.disciplinas_de_participante('luis')] == ['Tenis']
+
+
+def test_se_rechazan_las_referencias_inexistentes(entidades):
+    atletas, entrenadores, disciplinas = entidades
+    Relaciones(atletas, entrenadores, disciplinas)
+
+    atletas.agregar_datos(atleta(203, 'Eva', 'Diaz', 'Rugby'))
+    entrenadores.agregar_datos(entrenador(302, 'Nadie', 'Futbol'))
+    atletas.editar_datos('202', 'Disciplina', 'Rugby')
+
+    assert not atletas.almacen.existe('203')
+    assert not entrenadores.almacen.existe('302')
+    assert atletas.almacen.obtener('202')['Disciplina'] == 'Tenis'
+
+
+def test_restringir_impide_eliminar_lo_referenciado(entidades):
+    atletas, entrenadores, disciplinas = entidades
+    Relaciones(atletas, entrenadores, disciplinas, al_eliminar='restringir')
+
+    disciplinas.eliminar_datos('Futbol', 'Equipo')
+    atletas.eliminar_datos('201')
+    atletas.eliminar_datos('202')
+
+    assert disciplinas.almacen.existe('Futbol', 'Equipo')
+    assert atletas.almacen.existe('201')
+    assert not atletas.almacen.existe('202')
+
+
+def test_cascada_elimina_los_dependientes(entidades):
+    atletas, entrenadores, disciplinas = entidades
+    Relaciones(atletas, entrenadores, disciplinas, al_eliminar='cascada')
+
+    disciplinas.eliminar_datos('Futbol', 'Equipo')
+
+    assert not disciplinas.almacen.existe('Futbol', 'Equipo')
+    assert not atletas.almacen.existe('201')
+    assert not entrenadores.almacen.existe('301')
+    assert atletas.almacen.existe('202')
+
+
+def test_una_baja_no_se_cuela_entre_la_verificacion_y_el_alta(entidades):
+    atletas, entrenadores, disciplinas = entidades
+    relaciones = Relaciones(atletas, entrenadores, disciplinas)
+    disciplinas.agregar_datos(['Rugby', 'Equipo', '', ''])
+    verificar = relaciones.error_de_referencias
+    verificado = threading.Event()
+
+    def verificar_despacio(entidad, datos):
+        error = verificar(entidad, datos)
+        verificado.set()
+        time.sleep(0.3)
+        return error
+
+    relaciones.error_de_referencias = verificar_despacio
+    alta = threading.Thread(target=atletas.agregar_datos, args=(atleta(203, 'Eva', 'Diaz', 'Rugby'),))
+    alta.start()
+    assert verificado.wait(5)
+    baja = disciplinas.eliminar_datos('Rugby', 'Equipo')
+    alta.join(5)
+
+    assert not baja
+    assert atletas.almacen.existe('203')
+    assert disciplinas.almacen.existe('Rugby', 'Equipo')
@@ -0,0 +1,35 @@
+from Atleta import Atleta
+from Presentacion import a_json
+from Resultado import ErrorDeValidacion, Resultado
+
+FILA = ['201', 'Ana', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', '']
+
+
+def test_un_resultado_es_verdadero_si_tuvo_exito():
+    assert Resultado(True, "Listo.")
+    assert not Resultado(False, "Falló.")
+    assert str(ErrorDeValidacion('Correo', "El correo no es válido.")) == "El correo no es válido."
+
+
+def test_las_operaciones_devuelven_resultados_sin_imprimir(carpeta, capsys):
+    atletas = Atleta()
+
+    alta = atletas.agregar_datos(FILA)
+    repetida = atletas.agregar_datos(FILA)
+    consulta = atletas.consultar_datos('201')
+    lote = atletas.eliminar_lote(['201', '999'])
+
+    assert capsys.readouterr().out == ""
+    assert alta and alta.registro.id == 201
+    assert not repetida
+    assert consulta.registro.nombre == 'Ana'
+    assert [bool(resultado) for resultado in lote] == [True, False]
+
+
+def test_los_errores_indican_el_campo(carpeta):
+    resultado = Atleta().agregar_datos(FILA[:5] + ['no es fecha'] + FILA[6:])
+
+    assert not resultado
+    assert [error.campo for error in resultado.errores] == ['Fecha de Nacimiento']
+    assert a_json(resultado)['errores'][0]['campo'] == 'Fecha de Nacimiento'
+    assert a_json(resultado)['resultado'] is None
@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+from Servidor import Servidor
+
+
+async def pedir(puerto, metodo, ruta, cuerpo=None):
+    lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+    datos = b"" if cuerpo is None else json.dumps(cuerpo).encode('utf-8')
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nContent-Length: {len(datos)}\r\n"
+                   f"Connection: close\r\n\r\n".encode('latin-1') + datos)
+    await escritor.drain()
+    respuesta = await lector.read()
+    escritor.close()
+    estado = int(respuesta.split(b" ", 2)[1])
+    return estado, json.loads(respuesta.split(b"\r\n\r\n", 1)[1])
+
+
+def atleta(id):
+    return [str(id), 'Ana', 'Perez', 'Lopez', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', '']
+
+
+async def sesion(prueba):
+    servidor = Servidor(almacenamiento='csv', lectores=4)
+    puerto = asyncio.get_running_loop().create_future()
+    tarea = asyncio.create_task(servidor.servir(puerto=0, listo=puerto.set_result))
+    try:
+        return await prueba(await puerto)
+    finally:
+        tarea.cancel()
+        await asyncio.gather(tarea, return_exceptions=True)
+
+
+def test_escrituras_concurrentes_sin_perdidas_ni_duplicados(carpeta):
+    async def prueba(puerto):
+        altas = await asyncio.gather(*(pedir(puerto, 'POST', '/atletas', atleta(500 + numero))
+                                       for numero in range(20)))
+        repetida = await pedir(puerto, 'POST', '/atletas', atleta(500))
+        encontrados = await pedir(puerto, 'GET', '/atletas?Apellido%20Materno=Lopez&campos=ID')
+        return altas, repetida, encontrados
+
+    altas, repetida, (estado, encontrados) = asyncio.run(sesion(prueba))
+
+    assert [estado for estado, _ in altas] == [201] * 20
+    assert repetida[0] == 409
+    assert estado == 200
+    assert sorted(int(registro['ID']) for registro in encontrados['resultado']) == list(range(500, 520))
+
+
+def test_consulta_edicion_y_rutas_invalidas(carpeta):
+    async def prueba(puerto):
+        await pedir(puerto, 'POST', '/atletas', atleta(600))
+        return [
+            await pedir(puerto, 'PATCH', '/atletas/600', {'Nombre': 'Eva'}),
+            await pedir(puerto, 'GET', '/atletas/600'),
+            await pedir(puerto, 'DELETE', '/atletas/600'),
+            await pedir(puerto, 'GET', '/atletas/600'),
+            await pedir(puerto, 'GET', '/otra'),
+        ]
+
+    edicion, consulta, eliminacion, ausente, invalida = asyncio.run(sesion(prueba))
+
+    assert edicion[0] == 200
+    assert consulta[1]['resultado']['Nombre'] == 'Eva'
+    assert eliminacion[0] == 200
+    assert ausente[0] == 404
+    assert invalida[0] == 404
@@ -0,0 +1,64 @@
+import csv
+
+from AlmacenamientoSQLite import AlmacenamientoSQLite
+from Disciplina import Disciplina
+from MigracionSQLite import migrar
+
+ATRIBUTOS = ['Nombre', 'Categoria', 'Participantes', 'Patrocinadores']
+
+
+def crear(tmp_path):
+    return AlmacenamientoSQLite(str(tmp_path / "datos.db"), 'disciplina', ATRIBUTOS, ['Nombre', 'Categoria'],
+                                str.casefold)
+
+
+def test_altas_ediciones_y_bajas(tmp_path):
+    almacen = crear(tmp_path)
+    almacen.agregar_lote([['Futbol', 'Equipo', 'Ana', 'Nike'], ['Atletismo', 'Individual', '', '']])
+    almacen.editar([(['FUTBOL', 'equipo'], {'Patrocinadores': 'Adidas'})])
+    almacen.eliminar([['atletismo', 'INDIVIDUAL']])
+
+    assert almacen.existe('futbol', 'EQUIPO')
+    assert not almacen.existe('Atletismo', 'Individual')
+    assert almacen.obtener('Futbol', 'Equipo')['Patrocinadores'] == 'Adidas'
+    assert [list(fila) for fila in almacen.filas()] == [['Futbol', 'Equipo', 'Ana', 'Adidas']]
+
+
+def test_los_datos_persisten_entre_instancias(tmp_path):
+    crear(tmp_path).agregar_lote([['Futbol', 'Equipo', '', ''], ['Futsal', 'Equipo', '', ''],
+                                  ['Tenis', 'Individual', '', '']])
+
+    almacen = crear(tmp_path)
+
+    assert [registro['Nombre'] for registro in almacen.buscar_prefijo('fut')] == ['Futbol', 'Futsal']
+
+
+def test_exportar_a_csv(tmp_path):
+    almacen = crear(tmp_path)
+    almacen.agregar_lote([['Futbol', 'Equipo', 'Ana, Luis', 'Nike']])
+
+    almacen.exportar(str(tmp_path / "exportado.csv"))
+
+    with open(tmp_path / "exportado.csv", mode='r', newline='') as file:
+        assert list(csv.reader(file)) == [ATRIBUTOS, ['Futbol', 'Equipo', 'Ana, Luis', 'Nike']]
+
+
+def test_entidad_con_sqlite(carpeta):
+    disciplinas = Disciplina(almacenamiento='sqlite')
+
+    disciplinas.agregar_datos(['Esgrima', 'Individual', 'Ana', 'Nike'])
+    disciplinas.editar_datos('esgrima', 'individual', 'Patrocinadores', 'Puma')
+
+    registro = Disciplina(almacenamiento='sqlite').almacen.obtener('ESGRIMA', 'Individual')
+    assert registro['Patrocinadores'] == 'Puma'
+
+
+def test_la_migracion_no_duplica_registros(carpeta):
+    destino = str(carpeta / "migrada.db")
+
+    primera = {tabla: (leidos, insertados) for tabla, leidos, insertados in migrar(destino)}
+    segunda = {tabla: (leidos, insertados) for tabla, leidos, insertados in migrar(destino)}
+
+    assert primera['disciplina'] == (5, 5)
+    assert segunda['disciplina'] == (5, 0)
+    assert all(insertados == 0 for _, insertados in segunda.values())
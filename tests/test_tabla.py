@@ -0,0 +1,61 @@
+import csv
+
+import pytest
+
+from Atleta import Atleta
+from Disciplina import Disciplina
+from Entrenador import Entrenador
+from Esquema import Esquema
+from Registros import RegistroDisciplina
+from Tabla import Tabla
+
+
+class Torneo(Tabla):
+    ESQUEMA = Esquema(
+        'torneo', "archivos/torneo.csv",
+        ['Nombre', 'Categoria', 'Participantes', 'Patrocinadores'],
+        ['Nombre', 'Categoria'], RegistroDisciplina, 'torneo', 'torneos',
+        normalizar=str.casefold, opcionales=['Participantes', 'Patrocinadores'], indices=['Categoria'],
+    )
+
+
+def test_el_esquema_rechaza_columnas_y_validadores_desconocidos():
+    with pytest.raises(ValueError):
+        Esquema('x', "x.csv", ['ID'], ['Clave'], None, 'x', 'xs')
+    with pytest.raises(ValueError):
+        Esquema('x', "x.csv", ['ID'], ['ID'], None, 'x', 'xs', validadores={'ID': 'rfc'})
+
+
+def test_una_tabla_nueva_solo_declara_su_esquema(carpeta):
+    torneos = Torneo(almacenamiento='csv')
+
+    assert torneos.agregar_datos(['Copa', 'Libre', '', ''])
+    assert not torneos.agregar_datos(['COPA', 'libre', '', ''])
+    assert torneos.consultar_datos('copa', 'LIBRE').registro.nombre == 'Copa'
+    assert torneos.editar_datos('Copa', 'Libre', 'Patrocinadores', 'Nike')
+    assert [registro['Patrocinadores'] for registro in torneos.buscar({'Categoria': 'Libre'})] == ['Nike']
+    assert torneos.eliminar_datos('Copa', 'Libre')
+    assert not torneos.consultar_datos('Copa', 'Libre')
+
+
+def test_las_ediciones_usan_las_reglas_del_alta(carpeta):
+    atletas, disciplinas = Atleta(), Disciplina()
+    atletas.agregar_datos(['201', 'Ana', 'Perez', '', 'Mexico', '2000-01-02', 'Futbol', 'F', '5512345678', ''])
+
+    telefono = atletas.editar_datos('201', 'Telefono', '12')
+    correo = atletas.editar_datos('201', 'Correo', 'no-es-correo')
+
+    assert not telefono and [error.campo for error in telefono.errores] == ['Telefono']
+    assert not correo
+    assert not disciplinas.agregar_datos(['', 'Equipo', 'Ana', 'Nike'])
+
+
+def test_edita_una_columna_escrita_con_otras_mayusculas_en_el_csv(carpeta):
+    entrenadores = Entrenador(almacenamiento='csv')
+
+    assert entrenadores.editar_datos('1234', 'Fecha de Nacimiento', '1980-06-07')
+    assert not entrenadores.editar_datos('1234', 'Fecha de Nacimiento', '07/06/1980')
+    assert entrenadores.editar_lote([('1234', 'Fecha de Nacimiento', '1981-06-07')])[0]
+    assert entrenadores.consultar_datos('1234').registro.fecha_de_nacimiento.isoformat() == '1981-06-07'
+    with open("archivos/entrenador.csv", newline='') as file:
+        assert next(csv.reader(file))[5] == 'Fecha de nacimiento'
@@ -0,0 +1,45 @@
+from ValidadorDeDatos import ValidadorDeDatos
+
+ATRIBUTOS = ['ID', 'Nombre', 'Fecha', 'Telefono', 'Correo']
+REGLAS = dict(opcionales=['Correo'], ids=['ID'], fechas=['Fecha'], telefonos=['Telefono'], correos=['Correo'])
+
+FILAS = [
+    (['1', 'Ana', '2000-01-02', '5512345678', 'a@correo.com'], True),
+    (['2', 'Luis', '1999-12-31', '5512345678,5587654321', ''], True),
+    (['3', 'Eva', '2000-1-2', '5512345678', 'e@correo.com,f@correo.mx'], True),
+    (['x', 'Ana', '2000-01-02', '5512345678', ''], False),
+    (['4', '', '2000-01-02', '5512345678', ''], False),
+    (['5', 'Ana', '2000-13-02', '5512345678', ''], False),
+    (['6', 'Ana', '02/01/2000', '5512345678', ''], False),
+    (['7', 'Ana', '2000-01-02', '55123', ''], False),
+    (['8', 'Ana', '2000-01-02', '5512345678', 'sin arroba'], False),
+    (['9', 'Ana', '2000-01-02'], False),
+]
+
+
+def valida_una_por_una(datos):
+    validador = ValidadorDeDatos(reportar=lambda mensaje: None)
+    return (validador.datos_completos(datos, ATRIBUTOS)
+            and validador.id_numerico_valido(datos[0])
+            and not validador.hay_campo_vacio(datos, ATRIBUTOS, ['Correo'])
+            and validador.formato_fecha_valida(datos[2])
+            and validador.telefono_valido(datos[3].split(","))
+            and (datos[4] == "" or validador.correo_valido(datos[4].split(","))))
+
+
+def test_validar_columnas_reporta_los_errores_de_cada_fila():
+    errores = ValidadorDeDatos().validar_columnas([datos for datos, _ in FILAS], ATRIBUTOS, **REGLAS)
+
+    assert len(errores) == len(FILAS)
+    assert [not errores_de_fila for errores_de_fila in errores] == [valida for _, valida in FILAS]
+    assert all(str(error) for errores_de_fila in errores for error in errores_de_fila)
+
+
+def test_coincide_con_la_validacion_registro_por_registro():
+    errores = ValidadorDeDatos().validar_columnas([datos for datos, _ in FILAS], ATRIBUTOS, **REGLAS)
+
+    assert [not errores_de_fila for errores_de_fila in errores] == [valida_una_por_una(datos) for datos, _ in FILAS]
+
+
+def test_lote_vacio():
+    assert ValidadorDeDatos().validar_columnas([], ATRIBUTOS, **REGLAS) == []